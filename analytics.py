@@ -5,6 +5,7 @@ Matches automatedv6.py calculate_summary_stats logic for Slate metrics.
 """
 
 from typing import Optional, List, Dict
+from datetime import date
 
 import pandas as pd
 import numpy as np
@@ -44,9 +45,14 @@ class FunnelMetrics:
 
 @dataclass
 class YoYComparison:
-    """Year-over-year comparison between two years."""
+    """
+    Year-over-year comparison between two years.  With ``as_of`` set,
+    applications and enrollments are compared on that date of each cycle
+    (admits and offers on cycle totals; see pace.DATED_METRICS).
+    """
     current: FunnelMetrics
     previous: FunnelMetrics
+    as_of: Optional[date] = None
     
     @property
     def apps_change(self) -> float:
@@ -154,11 +160,15 @@ def calculate_summary_stats(
     current_df: pd.DataFrame,
     previous_df: pd.DataFrame,
     two_years_ago_df: pd.DataFrame,
-    census_enrollments: Optional[dict] = None
+    census_enrollments: Optional[dict] = None,
+    pace=None,
 ) -> dict:
     """
     Calculate comprehensive summary statistics using Slate data for funnel metrics.
     Census data is used only for continuing/returning enrollment breakdown and NTR.
+    With a pace index (pace.PaceIndex, data['pace']), 'yoy_to_date' holds the
+    same comparisons with applications and enrollments counted to the same
+    date of each cycle.
     """
     # Calculate overall funnel metrics from Slate data
     current_metrics = calculate_funnel_metrics(current_df, 2026)
@@ -181,6 +191,8 @@ def calculate_summary_stats(
             '2025_vs_2024': YoYComparison(previous_metrics, two_years_metrics),
         },
     }
+    if pace is not None:
+        summary['yoy_to_date'] = pace.yoy_comparisons()
 
     # Enrollment breakdown (Slate new + Census continuing/returning)
     census_new = 0
@@ -12,9 +12,12 @@ from datetime import datetime, timedelta
 sys.path.insert(0, str(Path(__file__).parent))
 
 from auth import check_password, show_logout_button
-from data_loader import load_all_data, get_last_refresh_info, force_refresh
+from utils.lazy import lazy_import
 from utils.ui import inject_global_styles
 
+# pandas/numpy/requests come in with data_loader; defer them until after login
+data_loader = lazy_import("data_loader")
+
 # Stevens Brand Colors
 STEVENS_RED = "#A41034"
 STEVENS_GRAY_DARK = "#54585A"
@@ -36,7 +39,8 @@ st.set_page_config(
 inject_global_styles()
 
 # Use Streamlit's built-in logo function (appears in sidebar/header)
-logo_path = Path(__file__).parent / "Stevens-CPE-logo-RGB_Linear-4C-BLK-bg.png"
+# Header-sized (200px) copy of the full-resolution logo; decoding the original takes ~0.5s
+logo_path = Path(__file__).parent / "Stevens-CPE-logo-header.png"
 if logo_path.exists():
     st.logo(str(logo_path), size="large")
 
@@ -429,7 +433,7 @@ def render_sidebar():
         st.markdown("### Data Status")
         
         try:
-            # Prefer the already-loaded timestamp if available (avoids extra load_all_data calls).
+            # Prefer the already-loaded timestamp if available (avoids an extra data load).
             cached_last_refresh = st.session_state.get("last_refresh")
             if cached_last_refresh:
                 last_refresh = cached_last_refresh
@@ -438,7 +442,7 @@ def render_sidebar():
                 if time_until.total_seconds() < 0:
                     time_until = timedelta(seconds=0)
             else:
-                last_refresh, time_until = get_last_refresh_info()
+                last_refresh, time_until = data_loader.get_last_refresh_info(st.session_state.get("data_version"))
             hours = int(time_until.total_seconds() // 3600)
             minutes = int((time_until.total_seconds() % 3600) // 60)
             
@@ -452,7 +456,7 @@ def render_sidebar():
             st.caption("Data not yet loaded")
         
         if st.button("Refresh Data", width="stretch"):
-            force_refresh()
+            data_loader.force_refresh()
             st.rerun()
         
         # Logout button
@@ -470,8 +474,8 @@ def render_sidebar():
 
 
 def _get_data() -> dict:
-    """Get the latest loaded data dict from session state."""
-    return st.session_state.get("data", {}) or {}
+    """Copy-on-write view of the shared dataset this session is on."""
+    return data_loader.get_shared_data(st.session_state.get("data_version"))
 
 
 def page_executive_summary():
@@ -535,7 +539,10 @@ def main():
     # Check authentication
     check_password()
 
-    # Load data once per rerun (Slate + Census). Pages read from session state.
+    # Load data once per process (Slate + Census); the session keeps only the
+    # dataset version and pages read the shared copy through _get_data(),
+    # as Copy-on-Write views.
+    data_loader.enable_copy_on_write()
     with st.spinner("Loading data from Slate and Census..."):
         try:
             census_bytes = None
@@ -550,7 +557,7 @@ def main():
                 apps_bytes = st.session_state["upload_apps_xlsx"].getvalue()
                 apps_name = st.session_state["upload_apps_xlsx"].name
 
-            data, last_refresh = load_all_data(
+            version, last_refresh = data_loader.load_shared_data(
                 census_uploaded_bytes=census_bytes,
                 census_uploaded_name=census_name,
                 apps_uploaded_bytes=apps_bytes,
@@ -558,9 +565,9 @@ def main():
             )
         except Exception as e:
             st.error(f"Error loading data: {e}")
-            data, last_refresh = {}, None
+            version, last_refresh = None, None
 
-    st.session_state["data"] = data
+    st.session_state["data_version"] = version
     if last_refresh is not None:
         st.session_state["last_refresh"] = last_refresh
 
@@ -596,12 +603,13 @@ def main():
     current = st.navigation(pages, position="top", expanded=False)
     current.run()
 
-    # Floating chat widget on every page except the dedicated chat page
+    # Floating chat widget on every page except the dedicated chat page.
+    # navs_widget is tiny; the AI stack loads only when the panel is opened.
     try:
-        from components import ai_assistant
+        from components import navs_widget
         page_hint = getattr(current, "title", "") or ""
         if page_hint not in ("Ask Navs", "Naveen"):
-            ai_assistant.render_floating_widget(_get_data(), page_hint=page_hint)
+            navs_widget.render_floating_widget(_get_data(), page_hint=page_hint)
     except Exception:
         # Never block page render if widget fails
         pass
@@ -0,0 +1,126 @@
+"""
+Process-wide answer cache for Ask Navs.
+
+Answers (and planner decisions) are shared across sessions, keyed by the
+dataset version, a scope (selected categories or page), and the normalized
+question.  Near-duplicate phrasings are matched with TF-IDF similarity inside
+the same dataset version and scope; questions that differ in any number
+(years, counts) never match each other.  Entries expire after a TTL and
+are evicted least-recently-used beyond ``max_entries``.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+import streamlit as st
+
+from utils.text_similarity import TfidfIndex, numbers_in, tokenize
+
+
+def normalize_question(q: str) -> str:
+    """Lower-case, drop punctuation and collapse whitespace."""
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s']", " ", (q or "").lower())).strip()
+
+
+@dataclass
+class _Entry:
+    value: object
+    created: float
+
+
+class SemanticCache:
+    """LRU + TTL cache with exact and near-duplicate question lookup.
+
+    ``similarity`` is tuned on tests/test_ai_answer_cache.py: a question that
+    adds a qualifier to a cached one ("... highest yield and enrollment?")
+    scores up to ~0.87, while rephrasings that differ only in stopwords,
+    punctuation or plurals score 1.0.  0.90 keeps the added-qualifier
+    questions out; a missed rephrasing only costs one LLM call.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3 * 60 * 60,
+                 similarity: float = 0.90, min_tokens: int = 2):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity = similarity
+        self.min_tokens = min_tokens
+        self._entries: "OrderedDict[Tuple[str, Hashable, str], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"exact_hits": 0, "near_hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    # ── Internals (call with lock held) ─────────────────────────────
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return now - entry.created > self.ttl_seconds
+
+    def _purge_expired(self, now: float):
+        for key in [k for k, e in self._entries.items() if self._expired(e, now)]:
+            del self._entries[key]
+            self._counts["expirations"] += 1
+
+    def _near_duplicate(self, version: str, scope: Hashable, question: str):
+        if len(tokenize(question)) < self.min_tokens:
+            return None
+        nums = numbers_in(question)
+        candidates = [k for k in self._entries
+                      if k[0] == version and k[1] == scope and numbers_in(k[2]) == nums]
+        if not candidates:
+            return None
+        scores = TfidfIndex([k[2] for k in candidates]).similarities(question)
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return candidates[best] if scores[best] >= self.similarity else None
+
+    # ── Public API ─────────────────────────────────────────────────
+    def get(self, version: str, scope: Hashable, question: str) -> Optional[object]:
+        q = normalize_question(question)
+        now = time.time()
+        with self._lock:
+            self._purge_expired(now)
+            key = (version, scope, q)
+            hit = "exact_hits" if key in self._entries else None
+            if hit is None:
+                key = self._near_duplicate(version, scope, q)
+                hit = "near_hits" if key is not None else None
+            if hit is None:
+                self._counts["misses"] += 1
+                return None
+            self._counts[hit] += 1
+            self._entries.move_to_end(key)
+            return self._entries[key].value
+
+    def put(self, version: str, scope: Hashable, question: str, value: object):
+        key = (version, scope, normalize_question(question))
+        with self._lock:
+            self._entries[key] = _Entry(value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and hit rate since process start."""
+        with self._lock:
+            s = dict(self._counts)
+            s["entries"] = len(self._entries)
+        lookups = s["exact_hits"] + s["near_hits"] + s["misses"]
+        s["hit_rate"] = (s["exact_hits"] + s["near_hits"]) / lookups if lookups else 0.0
+        return s
+
+
+@st.cache_resource(show_spinner=False)
+def get_answer_cache() -> SemanticCache:
+    """Shared cache of final answers, scoped by page and selected categories."""
+    return SemanticCache()
+
+
+@st.cache_resource(show_spinner=False)
+def get_planner_cache() -> SemanticCache:
+    """Shared cache of planner category choices, scoped by page."""
+    return SemanticCache(max_entries=512)
@@ -3,14 +3,21 @@ Ask Navs - Premium AI Business Intelligence Assistant
 Combines premium UI with robust chat features including summarization and fallbacks.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import re
 import time
 import random
 import streamlit as st
-import google.genai as genai
 
 from analytics import calculate_summary_stats, calculate_program_stats, get_funnel_by_category
+from data_loader import get_dataset_version
+from components.ai_answer_cache import get_answer_cache, get_planner_cache
+from components.ai_query_engine import answer_locally, get_aggregates, is_follow_up, named_values
+from components.ai_router import get_question_router
+from components.ai_chat_memory import RollingSummary, fold_prompt
+from components.ai_context_packer import pack_context
+from components.navs_widget import get_avatar_base64
+from components.ai_client import get_llm_client, is_rate_limited
 from utils.formatting import format_number, format_percent, format_currency
 from utils.constants import STEVENS_RED, CHART_SUCCESS, BACKGROUND_CARD, STEVENS_WHITE, STEVENS_GRAY_LIGHT
 from components.ai_insights import (
@@ -19,9 +26,6 @@ from components.ai_insights import (
 )
 
 
-GEMINI_MODEL = "gemini-3-flash-preview"
-
-
 # -----------------------------
 # Two-stage context selection
 # -----------------------------
@@ -97,19 +101,25 @@ def _brief_summary_for_planner(data: dict) -> str:
 
 def query_gemini_light(prompt: str, api_key: str) -> str:
     """Small/cheap call used for planning; keep output short via instructions."""
-    client = genai.Client(api_key=api_key)
-    response = client.models.generate_content(model=GEMINI_MODEL, contents=prompt)
-    return (getattr(response, "text", "") or "").strip()
+    return get_llm_client(api_key).generate(prompt).strip()
 
 
 def plan_data_needs(question: str, data: dict, api_key: str, page_hint: str = "") -> List[str]:
     """Stage 1: pick which data categories are needed for this question."""
-    cache = st.session_state.setdefault("planner_cache", {})
-    key = _normalize_question(f"{page_hint}::{question}")
-    if key in cache:
-        return cache[key]
-
-    brief = _brief_summary_for_planner(data)
+    cache = get_planner_cache()
+    version = get_dataset_version(data)
+    cached = cache.get(version, page_hint, question)
+    if cached is not None:
+        return list(cached)
+
+    # Most questions are routed locally; only ambiguous ones reach the LLM planner
+    named = named_values(question, get_aggregates(data))
+    decision = get_question_router(tuple(DATA_CATEGORIES.items())).route(question, named)
+    if decision.confident:
+        cache.put(version, page_hint, question, tuple(decision.categories))
+        return decision.categories
+
+    brief = get_context_fragments(data)["brief"]
     categories_list = "\n".join([f"- {k}: {v}" for k, v in DATA_CATEGORIES.items()])
     page_line = f"Current page context: {page_hint}" if page_hint else "Current page context: not specified"
     planner_prompt = f"""
@@ -146,7 +156,7 @@ Example: summary,programs,yoy
     if not chosen:
         chosen = DEFAULT_CATEGORIES.copy()
 
-    cache[key] = chosen
+    cache.put(version, page_hint, question, tuple(chosen))
     return chosen
 
 
@@ -235,9 +245,10 @@ def build_programs_context(data: dict) -> str:
     if program_stats is None or getattr(program_stats, "empty", True):
         return "Programs: unavailable."
 
-    # Keep this tight: top 12 by enrollments + top 8 by yield (min enrollments)
+    # Every program, ranked; the context packer keeps as many as the token budget allows
     lines = [f"Programs (tracked: {len(program_stats)}):"]
-    top_enroll = program_stats.nlargest(12, "Enrollments 2026")[["Program", "Enrollments 2026", "Yield Rate 2026"]]
+    top_enroll = program_stats.sort_values("Enrollments 2026", ascending=False, kind="stable")[
+        ["Program", "Enrollments 2026", "Yield Rate 2026"]]
     lines.append("- Top by enrollments:")
     for _, row in top_enroll.iterrows():
         lines.append(
@@ -249,7 +260,8 @@ def build_programs_context(data: dict) -> str:
         filtered = program_stats[program_stats["Enrollments 2026"] >= 5]
     except Exception:
         filtered = program_stats
-    top_yield = filtered.nlargest(8, "Yield Rate 2026")[["Program", "Enrollments 2026", "Yield Rate 2026"]]
+    top_yield = filtered.sort_values("Yield Rate 2026", ascending=False, kind="stable")[
+        ["Program", "Enrollments 2026", "Yield Rate 2026"]]
     lines.append("- Top by yield (min 5 enrollments when available):")
     for _, row in top_yield.iterrows():
         lines.append(
@@ -286,16 +298,9 @@ def build_ntr_context(data: dict) -> str:
         if breakdown_df is None or breakdown_df.empty:
             return "\n".join(lines)
 
-        # Cap rows to keep context bounded
-        rows = []
-        for _, row in breakdown_df.iterrows():
-            if row.get("Category") == "Grand Total":
-                continue
-            rows.append(row)
-            if len(rows) >= 20:
-                break
+        rows = [row for _, row in breakdown_df.iterrows() if row.get("Category") != "Grand Total"]
 
-        lines.append("- NTR by Category/Degree (capped):")
+        lines.append("- NTR by Category/Degree:")
         for row in rows:
             lines.append(
                 f"  - {row.get('Category')} / {row.get('Degree Type')}: "
@@ -327,10 +332,9 @@ def build_cohorts_context(data: dict) -> str:
         .agg(Enrollments=("Census_1_STUDENT_ID", "nunique"))
         .reset_index()
         .sort_values("Enrollments", ascending=False)
-        .head(10)
     )
 
-    lines = ["Corporate cohorts (top 10 by enrollments):"]
+    lines = ["Corporate cohorts (by enrollments):"]
     for _, row in summary.iterrows():
         lines.append(f"- {row['Census_1_CORPORATE_COHORT']}: {int(row['Enrollments'])} enrollments")
     return "\n".join(lines)
@@ -344,7 +348,6 @@ def build_breakdowns_context(summary_stats: Optional[dict], key: str, title: str
         return f"{title}: unavailable."
 
     lines = [f"{title} (2026):"]
-    count = 0
     for name, metrics in block.items():
         m = metrics.get(2026) if hasattr(metrics, "get") else None
         if not m:
@@ -352,9 +355,6 @@ def build_breakdowns_context(summary_stats: Optional[dict], key: str, title: str
         lines.append(
             f"- {name}: Apps {m.applications}, Admits {m.admits}, Enrolls {m.enrollments}, Yield {m.yield_rate:.0f}%"
         )
-        count += 1
-        if count >= 15:
-            break
     return "\n".join(lines)
 
 
@@ -370,8 +370,8 @@ def build_category_funnel_context(data: dict) -> str:
     if df is None or getattr(df, "empty", True):
         return "Funnel by category: unavailable."
 
-    df = df.sort_values("Enrollments", ascending=False).head(12)
-    lines = ["Funnel by category (top 12 by enrollments):"]
+    df = df.sort_values("Enrollments", ascending=False)
+    lines = ["Funnel by category (by enrollments):"]
     for _, row in df.iterrows():
         lines.append(
             f"- {row['Category']}: Apps {int(row['Applications'])}, Admits {int(row['Admits'])}, "
@@ -380,168 +380,233 @@ def build_category_funnel_context(data: dict) -> str:
     return "\n".join(lines)
 
 
-def build_selective_context(data: dict, categories: List[str], page_hint: str = "") -> str:
-    """Stage 2: build context from only selected categories."""
+def _render_context_fragments(data: dict) -> Dict[str, str]:
+    """Render every DATA_CATEGORIES fragment (plus guardrails and brief) to text."""
+    if data.get("ntr_summary") is None:
+        census_df = data.get("census", {}).get("raw_df")
+        if census_df is not None and not census_df.empty:
+            try:
+                from ntr_calculator import calculate_ntr_from_census
+                data = {**data, "ntr_summary": calculate_ntr_from_census(census_df)[0]}
+            except Exception:
+                pass
+
     summary_stats = _get_summary_stats(data)
+    fragments = {
+        "guardrails": _build_guardrails_context(),
+        "brief": _brief_summary_for_planner(data),
+        "summary": build_summary_context(data, summary_stats),
+        "yoy": build_yoy_context(summary_stats),
+        "programs": build_programs_context(data),
+        "ntr": build_ntr_context(data),
+        "cohorts": build_cohorts_context(data),
+        "by_school": build_breakdowns_context(summary_stats, "by_school", "By school"),
+        "by_degree": build_breakdowns_context(summary_stats, "by_degree", "By degree type"),
+        "by_category": "\n\n".join([
+            build_breakdowns_context(summary_stats, "by_category", "By application category"),
+            build_category_funnel_context(data),
+        ]),
+    }
+    return fragments
+
 
-    parts: List[str] = [_build_guardrails_context()]
+@st.cache_data(ttl=3*60*60, max_entries=8, show_spinner=False)
+def _context_fragments_cached(version: str, _data: dict) -> Dict[str, str]:
+    """Fragments rendered once per dataset version; shared across sessions."""
+    return _render_context_fragments(_data)
+
+
+def get_context_fragments(data: dict) -> Dict[str, str]:
+    """Pre-rendered context text for each category of the current dataset."""
+    return _context_fragments_cached(get_dataset_version(data), data)
+
+
+def build_selective_context(data: dict, categories: List[str], page_hint: str = "",
+                            question: str = "", chat_summary: str = "",
+                            budget: Optional[int] = None) -> str:
+    """
+    Stage 2: build context from only selected categories.
+
+    Rows are packed into a token budget by relevance to ``question`` (see
+    ai_context_packer); the chat summary is included only if it earns its space.
+    """
+    fragments = get_context_fragments(data)
+
+    required: List[str] = [fragments["guardrails"]]
     if page_hint:
-        parts.append(f"Current page: {page_hint}")
+        required.append(f"Current page: {page_hint}")
     # Always include a tiny summary to anchor the model
-    parts.append(f"Brief: {_brief_summary_for_planner(data)}")
+    required.append(f"Brief: {fragments['brief']}")
 
     cat_set = set(categories or [])
-    if "summary" in cat_set:
-        parts.append(build_summary_context(data, summary_stats))
-    if "yoy" in cat_set:
-        parts.append(build_yoy_context(summary_stats))
-    if "programs" in cat_set:
-        parts.append(build_programs_context(data))
-    if "ntr" in cat_set:
-        parts.append(build_ntr_context(data))
-    if "cohorts" in cat_set:
-        parts.append(build_cohorts_context(data))
-    if "by_school" in cat_set:
-        parts.append(build_breakdowns_context(summary_stats, "by_school", "By school"))
-    if "by_degree" in cat_set:
-        parts.append(build_breakdowns_context(summary_stats, "by_degree", "By degree type"))
-    if "by_category" in cat_set:
-        parts.append(build_breakdowns_context(summary_stats, "by_category", "By application category"))
-        parts.append(build_category_funnel_context(data))
-
-    return "\n\n".join([p for p in parts if p])
+    selected = [(key, fragments[key]) for key in DATA_CATEGORIES if key in cat_set]
+
+    context, _ = pack_context(question, required, selected, chat_summary=chat_summary, budget=budget)
+    return context
+
+
+def stream_answer(prompt: str, data: dict, api_key: str, page_hint: str = "",
+                  chat_summary: str = "") -> Iterator[str]:
+    """
+    Plan, build context and stream the answer to one question.
+
+    Numeric questions are answered by the local query engine without an
+    LLM call.  Other answers are shared across sessions through the semantic
+    answer cache (a hit is yielded whole).  Only follow-ups ("what about
+    2025?") see the chat summary; they depend on the conversation, so they
+    bypass the cache, while standalone questions share it.
+    """
+    follow_up = bool(chat_summary) and is_follow_up(prompt)
+    if not follow_up:
+        chat_summary = ""
+    local = answer_locally(prompt, data, chat_summary=chat_summary)
+    if local is not None:
+        yield local
+        return
+
+    categories = plan_data_needs(prompt, data, api_key, page_hint=page_hint)
+    # The context names the current page, so answers are per page too
+    scope = (page_hint, tuple(sorted(categories)))
+    version = get_dataset_version(data)
+    cache = get_answer_cache() if not follow_up else None
+    if cache is not None:
+        cached = cache.get(version, scope, prompt)
+        if cached is not None:
+            yield cached
+            return
+
+    context = build_selective_context(data, categories, page_hint=page_hint,
+                                      question=prompt, chat_summary=chat_summary)
+
+    chunks: List[str] = []
+    try:
+        for chunk in stream_gemini(prompt, context, api_key):
+            chunks.append(chunk)
+            yield chunk
+    except Exception as e:
+        if chunks:
+            yield f"\n\n_(Response interrupted: {e})_"
+        elif is_rate_limited(e):
+            yield fallback_response(prompt, data)
+        else:
+            yield f"Error: {e}"
+        return
+
+    if not chunks:
+        yield "Error: Empty response from AI service."
+        return
+    if cache is not None:
+        cache.put(version, scope, prompt, clean_markdown("".join(chunks)))
+
+
+def _write_answer_stream(stream: Iterator[str], spinner_text: str) -> str:
+    """Spinner until the first chunk arrives, then stream into the chat bubble."""
+    with st.spinner(spinner_text):
+        first = next(stream, "")
+
+    def _chunks():
+        yield first
+        yield from stream
+
+    written = st.write_stream(_chunks())
+    return clean_markdown(written if isinstance(written, str) else "".join(map(str, written)))
 
 
 def _init_global_chat_state():
-    if "navs_widget_open" not in st.session_state:
-        st.session_state.navs_widget_open = False
     if "navs_global_history" not in st.session_state:
         st.session_state.navs_global_history = []
-    if "navs_global_summary" not in st.session_state:
-        st.session_state.navs_global_summary = ""
+    if "navs_global_memory" not in st.session_state:
+        st.session_state.navs_global_memory = RollingSummary()
     if "navs_global_pending" not in st.session_state:
         st.session_state.navs_global_pending = None
-    if "navs_global_tick" not in st.session_state:
-        st.session_state.navs_global_tick = 0
 
 
 def render_floating_widget(data: dict, page_hint: str = ""):
-    """Floating Ask Navs widget shown on every page."""
-    _init_global_chat_state()
+    """Floating Ask Navs widget shown on every page (see components.navs_widget)."""
+    from components.navs_widget import render_floating_widget as _render
+
+    _render(data, page_hint=page_hint)
 
-    api_key = st.secrets.get("gemini_api_key", "")
-    if not api_key:
-        return
 
+def render_widget_panel(data: dict, page_hint: str, api_key: str):
+    """Open state of the floating widget; loaded only once the bubble is clicked."""
+    _init_global_chat_state()
     avatar_base64 = get_avatar_base64()
     if avatar_base64:
         avatar_src = f"data:image/png;base64,{avatar_base64}"
     else:
         avatar_src = "https://ui-avatars.com/api/?name=AI+Naveen&background=A41034&color=fff&size=56"
 
-    # Always minimize by default when landing on a new page/tab
-    last_page = st.session_state.get("navs_widget_last_page")
-    if last_page != page_hint:
-        st.session_state.navs_widget_open = False
-        st.session_state.navs_widget_last_page = page_hint
-
-    # Widget container (positioned via CSS from app.py)
-    widget = st.container()
-    with widget:
-        if not st.session_state.navs_widget_open:
-            st.markdown('<div class="navs-bubble-marker"></div>', unsafe_allow_html=True)
-            if st.button("💬", key="navs_toggle", help="Ask Navs"):
-                st.session_state.navs_widget_open = True
-                st.rerun()
-            return
-
-        st.markdown('<div class="navs-panel-marker"></div>', unsafe_allow_html=True)
+    st.markdown('<div class="navs-panel-marker"></div>', unsafe_allow_html=True)
+
+    header_cols = st.columns([1, 0.12])
+    with header_cols[0]:
+        st.markdown(
+            f"""
+            <div class='navs-panel-title'>
+              <img src="{avatar_src}" class="navs-title-avatar" alt="Naveen"/>
+              <span>Ask Navs</span>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+    with header_cols[1]:
+        if st.button("✕", key="navs_close"):
+            st.session_state.navs_widget_open = False
+            st.rerun()
 
-        header_cols = st.columns([1, 0.12])
-        with header_cols[0]:
+    # Messages panel
+    panel = st.container(height=360)
+    with panel:
+        if not st.session_state.navs_global_history:
             st.markdown(
-                f"""
-                <div class='navs-panel-title'>
-                  <img src="{avatar_src}" class="navs-title-avatar" alt="Naveen"/>
-                  <span>Ask Navs</span>
-                </div>
-                """,
+                "<div style='color: rgba(255,255,255,0.7); font-size: 12px;'>"
+                "Ask me about this page. I can break down trends, yield, and headcount."
+                "</div>",
                 unsafe_allow_html=True,
             )
-        with header_cols[1]:
-            if st.button("✕", key="navs_close"):
-                st.session_state.navs_widget_open = False
-                st.rerun()
-
-        # Messages panel
-        panel = st.container(height=360)
-        with panel:
-            if not st.session_state.navs_global_history:
-                st.markdown(
-                    "<div style='color: rgba(255,255,255,0.7); font-size: 12px;'>"
-                    "Ask me about this page. I can break down trends, yield, and headcount."
-                    "</div>",
-                    unsafe_allow_html=True,
+        for msg in st.session_state.navs_global_history:
+            role = msg.get("role", "assistant")
+            with st.chat_message(role):
+                st.markdown(msg.get("content", ""))
+
+        # Pending response
+        if st.session_state.navs_global_pending:
+            prompt = st.session_state.navs_global_pending
+            with st.chat_message("assistant"):
+                response = _write_answer_stream(
+                    stream_answer(
+                        prompt,
+                        data,
+                        api_key,
+                        page_hint=page_hint,
+                        chat_summary=st.session_state.navs_global_memory.context(st.session_state.navs_global_history[:-1]),
+                    ),
+                    "Thinking...",
                 )
-            for msg in st.session_state.navs_global_history:
-                role = msg.get("role", "assistant")
-                with st.chat_message(role):
-                    st.markdown(msg.get("content", ""))
-
-            # Pending response
-            if st.session_state.navs_global_pending:
-                prompt = st.session_state.navs_global_pending
-                with st.chat_message("assistant"):
-                    with st.spinner("Thinking..."):
-                        categories = plan_data_needs(
-                            prompt,
-                            data,
-                            api_key,
-                            page_hint=page_hint,
-                        )
-                        context = build_selective_context(
-                            data,
-                            categories,
-                            page_hint=page_hint,
-                        )
-                        if st.session_state.navs_global_summary:
-                            context += "\n\nChat Summary:\n" + st.session_state.navs_global_summary
-                        try:
-                            response = query_gemini(prompt, context, api_key)
-                        except Exception as e:
-                            if "429" in str(e) or "Too Many Requests" in str(e):
-                                response = fallback_response(prompt, data)
-                            else:
-                                response = f"Error: {e}"
-
-                        response = clean_markdown(response)
-                        st.session_state.navs_global_history.append({"role": "assistant", "content": response})
-                        st.session_state.navs_global_pending = None
-
-                        # periodic summarization
-                        if len(st.session_state.navs_global_history) >= 6 and st.session_state.navs_global_tick % 2 == 0:
-                            summary = summarize_chat(st.session_state.navs_global_history, api_key)
-                            if summary:
-                                st.session_state.navs_global_summary = summary
-                        st.session_state.navs_global_tick += 1
-                        st.rerun()
+                st.session_state.navs_global_history.append({"role": "assistant", "content": response})
+                st.session_state.navs_global_pending = None
 
-        # Input area
-        with st.form("navs_widget_form", clear_on_submit=True):
-            cols = st.columns([1, 0.38])
-            with cols[0]:
-                user_input = st.text_input(
-                    "Message Naveen",
-                    key="navs_widget_input",
-                    label_visibility="collapsed",
-                    placeholder="Message Naveen…",
-                )
-            with cols[1]:
-                sent = st.form_submit_button("Send", use_container_width=True)
-        if sent and user_input:
-            st.session_state.navs_global_history.append({"role": "user", "content": user_input})
-            st.session_state.navs_global_pending = user_input
-            st.rerun()
+                # Fold the new turns into the summary in the background
+                st.session_state.navs_global_memory.schedule(st.session_state.navs_global_history, api_key)
+                st.rerun()
+
+    # Input area
+    with st.form("navs_widget_form", clear_on_submit=True):
+        cols = st.columns([1, 0.38])
+        with cols[0]:
+            user_input = st.text_input(
+                "Message Naveen",
+                key="navs_widget_input",
+                label_visibility="collapsed",
+                placeholder="Message Naveen…",
+            )
+        with cols[1]:
+            sent = st.form_submit_button("Send", use_container_width=True)
+    if sent and user_input:
+        st.session_state.navs_global_history.append({"role": "user", "content": user_input})
+        st.session_state.navs_global_pending = user_input
+        st.rerun()
 
 
 # Premium CSS Styles - Clean and minimal
@@ -679,9 +744,8 @@ def build_context(data: dict) -> str:
     return build_selective_context(data, list(DATA_CATEGORIES.keys()))
 
 
-def query_gemini(question: str, context: str, api_key: str) -> str:
-    """Send question to Gemini API with context. Retries on 429."""
-    prompt = (
+def _answer_prompt(question: str, context: str) -> str:
+    return (
         "You are Naveen, the AI and BI Engineering Manager for Stevens CPE. "
         "Personality: friendly bro vibe, confident and upbeat, but professional. "
         "Language: clear and respectful, no 'yo' or overly casual slang, no profanity. "
@@ -696,55 +760,35 @@ def query_gemini(question: str, context: str, api_key: str) -> str:
         f"Context:\n{context}\n\nQuestion: {question}"
     )
 
-    client = genai.Client(api_key=api_key)
-    last_error: Optional[Exception] = None
-    for attempt in range(3):
-        try:
-            response = client.models.generate_content(
-                model=GEMINI_MODEL,
-                contents=prompt,
-            )
-            if not response or not response.text:
-                raise RuntimeError("Empty response from AI service.")
-            return response.text
-        except Exception as e:
-            last_error = e
-            if "429" in str(e) or "Too Many Requests" in str(e):
-                time.sleep(1 + attempt)
-                continue
-            raise
 
-    if last_error is not None:
-        raise last_error
-    raise RuntimeError("AI service unavailable.")
+def query_gemini(question: str, context: str, api_key: str) -> str:
+    """Send question to Gemini API with context. Retries on 429 via the shared client."""
+    text = get_llm_client(api_key).generate(_answer_prompt(question, context))
+    if not text:
+        raise RuntimeError("Empty response from AI service.")
+    return text
 
 
-def summarize_chat(history: List[Dict], api_key: str) -> str:
-    """Summarize the chat history for context compression."""
+def stream_gemini(question: str, context: str, api_key: str) -> Iterator[str]:
+    """Streaming variant of query_gemini; yields text chunks as they arrive."""
+    return get_llm_client(api_key).stream(_answer_prompt(question, context))
+
+
+def summarize_chat(history: List[Dict], api_key: str, previous_summary: str = "") -> str:
+    """Fold ``history`` into ``previous_summary`` (blocking; the chat UI uses RollingSummary)."""
     if not history:
-        return ""
-    # Keep last 12 messages to summarize
-    recent = history[-12:]
-    transcript = "\n".join([f"{m['role']}: {m['content']}" for m in recent])
-    prompt = (
-        "Summarize this conversation in 4-6 short bullet points. "
-        "Focus on user intent, key facts, and decisions. "
-        "No fluff, no new facts.\n\n"
-        f"Transcript:\n{transcript}"
-    )
+        return previous_summary
     try:
-        client = genai.Client(api_key=api_key)
-        response = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-        )
-        return (response.text or "").strip()
+        return get_llm_client(api_key).generate(fold_prompt(previous_summary, history)).strip()
     except Exception:
-        return ""
+        return previous_summary
 
 
 def fallback_response(prompt: str, data: dict) -> str:
     """Provide a local response for common questions when API is rate-limited."""
+    local = answer_locally(prompt, data)
+    if local is not None:
+        return local
     prompt_lower = prompt.lower()
     apps_data = data.get('applications', {})
     program_stats = calculate_program_stats(apps_data.get('current'), apps_data.get('previous'))
@@ -793,32 +837,6 @@ def clean_markdown(text: str) -> str:
     return "".join(result)
 
 
-def get_avatar_base64() -> str:
-    """Load avatar image and convert to base64 for inline display."""
-    import base64
-    from pathlib import Path
-    import os
-    
-    # Get the dashboard root directory
-    dashboard_root = Path(__file__).parent.parent.resolve()
-    
-    # Try multiple paths relative to dashboard root
-    possible_paths = [
-        dashboard_root / "naveen-headshot.png",
-        dashboard_root / ".streamlit" / "static" / "naveen-headshot.png",
-    ]
-    
-    for img_path in possible_paths:
-        if img_path.exists():
-            try:
-                with open(img_path, "rb") as f:
-                    return base64.b64encode(f.read()).decode()
-            except Exception:
-                continue
-    
-    return ""
-
-
 def render(data: dict):
     """Render the premium Ask Navs chat interface."""
     
@@ -867,10 +885,8 @@ def render(data: dict):
     # Initialize session state
     if "chat_history" not in st.session_state:
         st.session_state.chat_history = []
-    if "chat_summary" not in st.session_state:
-        st.session_state.chat_summary = ""
-    if "summary_tick" not in st.session_state:
-        st.session_state.summary_tick = 0
+    if "chat_memory" not in st.session_state:
+        st.session_state.chat_memory = RollingSummary()
     if "pending_chip" not in st.session_state:
         st.session_state.pending_chip = None
 
@@ -900,8 +916,7 @@ def render(data: dict):
     st.markdown('<div class="new-chat-row">', unsafe_allow_html=True)
     if st.button("✨ New Chat", key="new_chat_btn"):
         st.session_state.chat_history = []
-        st.session_state.chat_summary = ""
-        st.session_state.summary_tick = 0
+        st.session_state.chat_memory = RollingSummary()
         st.session_state.pending_chip = None
         st.session_state.pending_response = None
         st.rerun()
@@ -931,42 +946,24 @@ def render(data: dict):
         # Show thinking indicator if we're waiting for a response
         if st.session_state.pending_response:
             with st.chat_message("assistant", avatar=avatar_path):
-                with st.spinner(random.choice(fun_quotes)):
-                    # Generate response
-                    prompt = st.session_state.pending_response
-                    needed_categories = plan_data_needs(
+                # Generate response
+                prompt = st.session_state.pending_response
+                response = _write_answer_stream(
+                    stream_answer(
                         prompt,
                         data,
                         api_key,
                         page_hint="Ask Navs Page",
-                    )
-                    context = build_selective_context(
-                        data,
-                        needed_categories,
-                        page_hint="Ask Navs Page",
-                    )
-                    if st.session_state.chat_summary:
-                        context += "\n\nChat Summary:\n" + st.session_state.chat_summary
-
-                    try:
-                        response = query_gemini(prompt, context, api_key)
-                    except Exception as e:
-                        if "429" in str(e) or "Too Many Requests" in str(e):
-                            response = fallback_response(prompt, data)
-                        else:
-                            response = f"Error: {e}"
-
-                    response = clean_markdown(response)
-                    st.session_state.chat_history.append({"role": "assistant", "content": response})
-                    st.session_state.pending_response = None
-
-                    # Summarize periodically
-                    if len(st.session_state.chat_history) >= 6 and st.session_state.summary_tick % 2 == 0:
-                        summary = summarize_chat(st.session_state.chat_history, api_key)
-                        if summary:
-                            st.session_state.chat_summary = summary
-                    st.session_state.summary_tick += 1
-                    st.rerun()
+                        chat_summary=st.session_state.chat_memory.context(st.session_state.chat_history[:-1]),
+                    ),
+                    random.choice(fun_quotes),
+                )
+                st.session_state.chat_history.append({"role": "assistant", "content": response})
+                st.session_state.pending_response = None
+
+                # Fold the new turns into the summary in the background
+                st.session_state.chat_memory.schedule(st.session_state.chat_history, api_key)
+                st.rerun()
 
     # Suggested questions (only when chat is empty)
     if not st.session_state.chat_history:
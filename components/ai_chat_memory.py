@@ -0,0 +1,76 @@
+"""
+Rolling chat summary for Ask Navs.
+
+Once FOLD_AFTER messages have accumulated, the turns not yet summarized
+are folded into the existing summary by a background LLM call (on the
+shared client's event loop), so the user never waits on summarization.  Each fold sends
+only the previous summary plus the new turns, each clipped, so the tokens
+sent per turn stay constant however long the conversation gets.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+from components.ai_client import get_llm_client
+
+
+# Messages (three question + answer turns) before folding.  Until then
+# context() passes the unfolded turns verbatim, so a summarization call is
+# made every third exchange instead of after every reply.
+FOLD_AFTER = 6
+MAX_MESSAGE_CHARS = 600  # clip long answers; the summary needs the gist only
+
+
+def fold_prompt(summary: str, messages: List[Dict]) -> str:
+    turns = "\n".join(f"{m['role']}: {m['content'][:MAX_MESSAGE_CHARS]}" for m in messages)
+    return (
+        "Update the running summary of this conversation with the new turns. "
+        "Return 4-6 short bullet points covering user intent, key facts, and decisions. "
+        "Drop details that no longer matter. No fluff, no new facts.\n\n"
+        f"Summary so far:\n{summary or '(none)'}\n\n"
+        f"New turns:\n{turns}"
+    )
+
+
+class RollingSummary:
+    """Per-conversation summary, updated incrementally off the request path."""
+
+    def __init__(self):
+        self.summary = ""
+        self.folded = 0  # history messages already reflected in the summary
+        self._pending: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    def context(self, history: List[Dict]) -> str:
+        """Latest finished summary plus the clipped turns of ``history`` it does not cover yet (never blocks)."""
+        with self._lock:
+            summary, recent = self.summary, history[self.folded:]
+        parts = [summary] if summary else []
+        parts += [f"{m['role']}: {m['content'][:MAX_MESSAGE_CHARS]}" for m in recent]
+        return "\n".join(parts)
+
+    def schedule(self, history: List[Dict], api_key: str):
+        """Fold messages added since the last fold, in the background."""
+        with self._lock:
+            if self._pending is not None and not self._pending.done():
+                return  # the next reply picks these turns up
+            new = history[self.folded:]
+            if len(new) < FOLD_AFTER or not api_key:
+                return
+            upto = len(history)
+            client = get_llm_client(api_key)
+            future = client.submit(client.agenerate(fold_prompt(self.summary, new)))
+            self._pending = future
+        future.add_done_callback(lambda f: self._apply(f, upto))
+
+    def _apply(self, future: Future, upto: int):
+        try:
+            text = (future.result() or "").strip()
+        except Exception as e:
+            print(f"[NAVS] chat summary fold failed: {e}")
+            return
+        if text:
+            with self._lock:
+                self.summary = text
+                self.folded = upto
@@ -0,0 +1,171 @@
+"""
+Shared Gemini client for the AI features.
+
+One pooled ``genai.Client`` per API key and process (its HTTP connection
+pool is reused by every session), a process-wide token-bucket rate limiter,
+and retries on 429 with jittered exponential backoff.  Both blocking and
+streaming calls are provided, plus an asyncio generate that runs on a
+single background event loop, so background work (chat summaries) does not
+block the Streamlit script thread.
+
+For local testing, point the client at a mock server with the
+``GEMINI_BASE_URL`` environment variable or the ``gemini_base_url`` secret
+(see ``scripts/mock_llm_server.py``).
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Coroutine, Iterator, Optional
+
+import streamlit as st
+
+from utils.lazy import lazy_import
+
+# The SDK is large; import it when the first client is created, not with this module
+genai = lazy_import("google.genai")
+types = lazy_import("google.genai.types")
+
+
+GEMINI_MODEL = "gemini-3-flash-preview"
+
+RATE_PER_SECOND = 4.0   # sustained requests/second across all sessions
+BURST = 8               # bucket capacity
+MAX_ATTEMPTS = 4
+BACKOFF_BASE = 0.5      # seconds; doubled per attempt, then jittered
+
+
+def is_rate_limited(err: Exception) -> bool:
+    return getattr(err, "code", None) == 429 or "429" in str(err) or "Too Many Requests" in str(err)
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every caller in the process."""
+
+    def __init__(self, rate: float = RATE_PER_SECOND, capacity: int = BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token; return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, BACKOFF_BASE * (2 ** attempt))
+
+
+class LLMClient:
+    """Pooled Gemini client with rate limiting, retries and streaming."""
+
+    def __init__(self, api_key: str, base_url: str = "", model: str = GEMINI_MODEL,
+                 limiter: Optional[TokenBucket] = None):
+        http_options = types.HttpOptions(base_url=base_url) if base_url else None
+        self.client = genai.Client(api_key=api_key, http_options=http_options)
+        self.model = model
+        self.limiter = limiter or TokenBucket()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    # ── Blocking ───────────────────────────────────────────────────
+    def generate(self, prompt: str) -> str:
+        for attempt in range(MAX_ATTEMPTS):
+            self.limiter.acquire()
+            try:
+                response = self.client.models.generate_content(model=self.model, contents=prompt)
+                return (getattr(response, "text", "") or "")
+            except Exception as e:
+                if not is_rate_limited(e) or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(_backoff(attempt))
+        raise RuntimeError("AI service unavailable.")
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        """
+        Yield response text as it arrives.
+
+        A 429 before the first chunk is retried; once text has been yielded
+        errors propagate, since the caller has already shown partial output.
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            self.limiter.acquire()
+            started = False
+            try:
+                for chunk in self.client.models.generate_content_stream(model=self.model, contents=prompt):
+                    text = getattr(chunk, "text", "") or ""
+                    if text:
+                        started = True
+                        yield text
+                return
+            except Exception as e:
+                if started or not is_rate_limited(e) or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(_backoff(attempt))
+
+    # ── Async ──────────────────────────────────────────────────────
+    async def agenerate(self, prompt: str) -> str:
+        for attempt in range(MAX_ATTEMPTS):
+            await self.limiter.acquire_async()
+            try:
+                response = await self.client.aio.models.generate_content(model=self.model, contents=prompt)
+                return (getattr(response, "text", "") or "")
+            except Exception as e:
+                if not is_rate_limited(e) or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(_backoff(attempt))
+        raise RuntimeError("AI service unavailable.")
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the client's background event loop."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="llm-client", daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+
+def _base_url() -> str:
+    env = os.getenv("GEMINI_BASE_URL", "")
+    if env:
+        return env
+    try:
+        return st.secrets.get("gemini_base_url", "")
+    except Exception:
+        return ""
+
+
+@st.cache_resource(show_spinner=False)
+def _shared_limiter() -> TokenBucket:
+    return TokenBucket()
+
+
+@st.cache_resource(show_spinner=False)
+def _pooled_client(api_key: str, base_url: str) -> LLMClient:
+    return LLMClient(api_key, base_url=base_url, limiter=_shared_limiter())
+
+
+def get_llm_client(api_key: str) -> LLMClient:
+    """The process-wide client for ``api_key`` (created on first use)."""
+    return _pooled_client(api_key, _base_url())
@@ -0,0 +1,228 @@
+"""
+Token-budgeted context packing for Ask Navs prompts.
+
+The rendered context fragments hold every row (all programs, all NTR
+rows, all cohorts).  For each question the packer estimates token counts
+locally, ranks rows by relevance to the question plus their original
+ranking, and fills a token budget: the leading rows of each selected
+fragment first, then the best remaining rows, with the chat summary
+competing for space like any other block (follow-up questions give it
+priority).  Ranking questions ("which programs have the best yield?") keep
+the list they ask about in its own order instead: row text cannot tell the
+best-yield rows from the rest, since every row mentions yield.  pack_context
+also returns a report of what was kept.
+
+The budget defaults to DEFAULT_TOKEN_BUDGET and can be changed with the
+``NAVS_CONTEXT_TOKENS`` environment variable or ``navs_context_tokens`` secret.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+import os
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import streamlit as st
+
+from utils.text_similarity import TfidfIndex, tokenize
+
+
+DEFAULT_TOKEN_BUDGET = 1000
+ANCHOR_ROWS = 3           # leading (top-ranked) rows of each list, packed first
+RELEVANCE_WEIGHT = 2.0    # question similarity vs. original ranking
+PRIOR_WEIGHT = 0.5
+
+RANKING = re.compile(
+    r"\b(top|best|worst|highest|lowest|most|fewest|least|largest|smallest|"
+    r"biggest|leading|bottom|rank|ranking|ranked)\b"
+)
+BOTTOM = re.compile(r"\b(worst|lowest|fewest|least|smallest|bottom)\b")
+
+FOLLOW_UP = re.compile(
+    r"\b(it|that|those|these|they|them|same|more|else|also|again|earlier|above|"
+    r"previous(?:ly)?|what about|how about)\b"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English and numbers)."""
+    return (len(text or "") + 3) // 4
+
+
+def context_token_budget() -> int:
+    env = os.getenv("NAVS_CONTEXT_TOKENS", "")
+    if env.isdigit():
+        return int(env)
+    try:
+        return int(st.secrets.get("navs_context_tokens", DEFAULT_TOKEN_BUDGET))
+    except Exception:
+        return DEFAULT_TOKEN_BUDGET
+
+
+@dataclass
+class _Line:
+    text: str
+    fragment: str
+    is_row: bool
+    rank: int = 0               # position within its list (0 = first)
+    parent: Optional[int] = None  # index of the header/sub-header line above it
+
+
+@dataclass
+class PackReport:
+    budget: int
+    tokens: int = 0
+    rows: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # fragment -> (kept, total)
+    chat_summary: str = "none"  # none | kept | dropped
+
+    def describe(self) -> str:
+        parts = [f"{k} {kept}/{total}" for k, (kept, total) in self.rows.items() if kept < total]
+        trimmed = ", ".join(parts) if parts else "all rows kept"
+        return (f"{self.tokens:,}/{self.budget:,} tokens | {trimmed} | "
+                f"chat summary {self.chat_summary}")
+
+
+def _parse(key: str, text: str) -> List[_Line]:
+    """Split a fragment into header lines and ranked rows."""
+    lines: List[_Line] = []
+    header: Optional[int] = None
+    sub: Optional[int] = None
+    ranks: Dict[Optional[int], int] = {}
+    for raw in (text or "").splitlines():
+        if not raw.strip():
+            continue
+        stripped = raw.lstrip()
+        if not stripped.startswith("- "):
+            header, sub = len(lines), None
+            lines.append(_Line(raw, key, False))
+            continue
+        nested = raw.startswith("  ")
+        if not nested and stripped.endswith(":"):
+            sub = len(lines)
+            lines.append(_Line(raw, key, False, parent=header))
+            continue
+        parent = sub if nested and sub is not None else header
+        if not nested:
+            sub = None
+        rank = ranks.get(parent, 0)
+        ranks[parent] = rank + 1
+        lines.append(_Line(raw, key, True, rank=rank, parent=parent))
+    return lines
+
+
+def _ranked_lists(question: str, lines: List[_Line], rows: List[int]) -> Dict[int, bool]:
+    """
+    For a ranking question, the lists it asks about: header index -> whether
+    to take rows from the bottom.  Lists are matched on their header text
+    ("Top by yield" for a yield question); empty for other questions.
+    """
+    text = (question or "").lower()
+    if not RANKING.search(text) or not tokenize(question):
+        return {}
+    headers = sorted({lines[i].parent for i in rows if lines[i].parent is not None})
+    if not headers:
+        return {}
+    scores = TfidfIndex([lines[h].text for h in headers]).similarities(question)
+    best = max(scores)
+    if best <= 0:
+        return {}
+    bottom = bool(BOTTOM.search(text))
+    return {h: bottom for h, score in zip(headers, scores) if score == best}
+
+
+def pack_context(question: str, required: Sequence[str], fragments: Sequence[Tuple[str, str]],
+                 chat_summary: str = "", budget: Optional[int] = None) -> Tuple[str, PackReport]:
+    """
+    Pack ``required`` blocks plus as much of ``fragments`` (key, text) as fits.
+
+    Returns the context text and a report of what was kept.
+    """
+    budget = budget or context_token_budget()
+    report = PackReport(budget=budget)
+    required = [r for r in required if r]
+    used = sum(estimate_tokens(r) + 1 for r in required)
+
+    lines: List[_Line] = []
+    spans: Dict[str, Tuple[int, int]] = {}
+    for key, text in fragments:
+        start = len(lines)
+        for ln in _parse(key, text):
+            if ln.parent is not None:
+                ln.parent += start
+            lines.append(ln)
+        spans[key] = (start, len(lines))
+    # Headers are cheap and keep the structure readable; always pay for them
+    used += sum(estimate_tokens(ln.text) + 1 for ln in lines if not ln.is_row)
+
+    rows = [i for i, ln in enumerate(lines) if ln.is_row]
+    relevance = [0.0] * len(rows)
+    if rows and tokenize(question):
+        relevance = TfidfIndex([lines[i].text for i in rows]).similarities(question)
+
+    # (tier, -score, line index or -1 for the chat summary); tier 0 = anchors / follow-up
+    # summary, tier 1 = the rest of a ranked list the question asks about, in list order
+    focus = _ranked_lists(question, lines, rows)
+    sizes = Counter(lines[i].parent for i in rows)
+    candidates: List[tuple] = []
+    for i, rel in zip(rows, relevance):
+        ln = lines[i]
+        if ln.parent in focus:
+            order = sizes[ln.parent] - 1 - ln.rank if focus[ln.parent] else ln.rank
+            if order >= ANCHOR_ROWS:
+                candidates.append((1, order, i))
+                continue
+        else:
+            order = ln.rank
+        score = RELEVANCE_WEIGHT * rel + PRIOR_WEIGHT / (1 + order)
+        candidates.append((0 if order < ANCHOR_ROWS else 2, -score, i))
+    summary_block = f"Chat Summary:\n{chat_summary}" if chat_summary else ""
+    if summary_block:
+        follow_up = bool(FOLLOW_UP.search((question or "").lower())) or len(tokenize(question)) < 3
+        rel = TfidfIndex([chat_summary]).similarities(question)[0] if tokenize(question) else 0.0
+        candidates.append((0 if follow_up else 2, -(RELEVANCE_WEIGHT * rel + PRIOR_WEIGHT), -1))
+    candidates.sort()
+
+    kept = set()
+    full = set()  # ranked lists that ran out of room; later rows would leave a gap
+    summary_kept = False
+    for tier, _, i in candidates:
+        ranked = tier == 1
+        if ranked and lines[i].parent in full:
+            continue
+        cost = estimate_tokens(summary_block if i < 0 else lines[i].text) + 1
+        if used + cost > budget:
+            if ranked:
+                full.add(lines[i].parent)
+            continue
+        used += cost
+        if i < 0:
+            summary_kept = True
+        else:
+            kept.add(i)
+
+    # Emit in the original order; drop sub-headers whose rows were all dropped
+    has_rows = {lines[i].parent for i in kept}
+    blocks: List[str] = list(required)
+    for key, _ in fragments:
+        start, end = spans[key]
+        out = []
+        for idx in range(start, end):
+            ln = lines[idx]
+            if ln.is_row:
+                if idx in kept:
+                    out.append(ln.text)
+            elif ln.parent is None:
+                out.append(("\n" if out else "") + ln.text)
+            elif idx in has_rows:
+                out.append(ln.text)
+        report.rows[key] = (sum(1 for idx in range(start, end) if idx in kept),
+                            sum(1 for idx in range(start, end) if lines[idx].is_row))
+        if out:
+            blocks.append("\n".join(out))
+    if summary_kept:
+        blocks.append(summary_block)
+    report.chat_summary = "kept" if summary_kept else ("dropped" if summary_block else "none")
+
+    text = "\n\n".join(blocks)
+    report.tokens = estimate_tokens(text)
+    return text, report
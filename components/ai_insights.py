@@ -6,13 +6,10 @@ Provides reusable insight generation for Executive Summary and Ask Navs.
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 import streamlit as st
-import google.genai as genai
 
 from analytics import calculate_summary_stats, calculate_program_stats, get_funnel_by_category
 from utils.formatting import format_number, format_percent, format_currency
-
-
-GEMINI_MODEL = "gemini-3-flash-preview"
+from components.ai_client import get_llm_client
 
 
 @dataclass
@@ -42,12 +39,13 @@ def analyze_data_for_insights(data: dict) -> List[InsightCard]:
         apps_data.get('current'),
         apps_data.get('previous'),
         apps_data.get('two_years_ago'),
-        census_data
+        census_data,
+        pace=data.get('pace'),
     )
     
     current = summary_stats['overall'][2026]
     previous = summary_stats['overall'][2025]
-    yoy = summary_stats['yoy']['2026_vs_2025']
+    yoy = (summary_stats.get('yoy_to_date') or summary_stats['yoy'])['2026_vs_2025']
     by_category = summary_stats.get('by_category', {})
     
     # HIGHLIGHT: Find best performing metric
@@ -207,11 +205,12 @@ def generate_executive_summary_text(data: dict, api_key: str) -> str:
         apps_data.get('current'),
         apps_data.get('previous'),
         apps_data.get('two_years_ago'),
-        census_data
+        census_data,
+        pace=data.get('pace'),
     )
     
     current = summary_stats['overall'][2026]
-    yoy = summary_stats['yoy']['2026_vs_2025']
+    yoy = (summary_stats.get('yoy_to_date') or summary_stats['yoy'])['2026_vs_2025']
     breakdown = summary_stats.get('enrollment_breakdown')
     by_category = summary_stats.get('by_category', {})
     
@@ -263,13 +262,9 @@ def generate_executive_summary_text(data: dict, api_key: str) -> str:
     )
     
     try:
-        client = genai.Client(api_key=api_key)
-        response = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-        )
-        if response and response.text:
-            return response.text.strip()
+        text = get_llm_client(api_key).generate(prompt)
+        if text:
+            return text.strip()
     except Exception:
         pass
     
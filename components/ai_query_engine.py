@@ -0,0 +1,457 @@
+"""
+Local structured query engine for Ask Navs.
+
+Numeric questions ("admits for Beacon in 2025", "yield by school", "top 5
+programs by enrollments", "NTR by degree") are parsed into metric, group-by,
+filter and year operations and answered from aggregates precomputed once
+per dataset version, without calling the LLM.  Anything that reads as a
+narrative question ("why", "how do we", "recommend") or that the parser
+cannot fully resolve returns None and goes down the LLM path.
+"""
+
+from dataclasses import dataclass, field
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import streamlit as st
+
+from data_loader import get_dataset_version
+from sql_layer import get_sql_layer
+from utils.formatting import format_currency, format_number, format_percent, safe_divide
+
+
+YEARS = (2026, 2025, 2024)
+CURRENT_YEAR = YEARS[0]
+DEFAULT_TOP_N = 5
+
+# Funnel cube dimensions: (key, source column)
+FUNNEL_DIMS: List[Tuple[str, str]] = [
+    ("school", "School (Expanded)"),
+    ("category", "Application Category"),
+    ("degree", "Degree Type"),
+    ("program", "Program Cleaned"),
+]
+NTR_DIMS = ("category", "degree")
+
+# metric key -> (label, kind, phrases).  kind: count | rate | currency
+METRICS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "apps": ("Applications", "count", ("applications", "application", "apps", "applicants", "applied")),
+    "admits": ("Admits", "count", ("admits", "admitted", "admissions", "admit count")),
+    "enrolls": ("Enrollments", "count", ("enrollments", "enrollment", "enrolled", "enrolls")),
+    "yield": ("Yield", "rate", ("yield", "yield rate")),
+    "admit_rate": ("Admit Rate", "rate", ("admit rate", "admission rate", "acceptance rate")),
+    "ntr": ("NTR", "currency", ("ntr", "net tuition revenue", "tuition revenue", "revenue")),
+    "credits": ("Credits", "count", ("credits", "credit hours")),
+    "students": ("Students", "count", ("census students", "ntr students")),
+}
+FUNNEL_METRICS = ("apps", "admits", "enrolls", "yield", "admit_rate")
+NTR_METRICS = ("ntr", "credits", "students")
+
+GROUP_WORDS: Dict[str, Tuple[str, ...]] = {
+    "school": ("school", "schools"),
+    "category": ("category", "categories", "application category", "segment", "segments", "channel"),
+    "degree": ("degree", "degrees", "degree type", "degree types"),
+    "program": ("program", "programs"),
+}
+
+# Other ways people name dimension values (alias -> lower-cased values it means)
+VALUE_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "certificate": ("graduate certificate",),
+    "certificates": ("graduate certificate",),
+    "master": ("masters",),
+    "master's": ("masters",),
+    "select professional": ("select professional online",),
+}
+
+# Words a question may use besides metric, dimension, value, year and ranking
+# terms.  Any other word ("percentage of", "december", "trending", "women") is
+# a qualifier the cube cannot apply, so the question goes to the LLM.
+FILLER_WORDS = frozenset("""
+    a an the what what's whats how many much is are was were do does did we our us i me show give list tell
+    get got have has had total number count of for in on to and by per each every across which vs versus
+    compared compare with all overall current this last previous prior year years two ago over yoy change
+    top bottom best worst highest lowest most least fewest smallest largest rank ranking ranked breakdown
+    split please
+""".split())
+
+# Follow-ups that only make sense with the previous turns ("what about 2025?", "and for Beacon")
+FOLLOW_UP = re.compile(
+    r"^(and|but|also|so|then|what about|how about|same|now)\b|"
+    r"\b(it|its|that|those|these|them|they|there|same|instead|above|previous answer)\b"
+)
+
+MIN_RATE_BASE = 10  # admits (yield) or applications (admit rate) a group needs to be ranked by rate
+
+NARRATIVE = re.compile(
+    r"\b(why|how (?:do|can|could|should|would) (?:we|i)|should|explain|recommend\w*|suggest\w*|"
+    r"strateg\w*|driv\w*|caus\w*|improv\w*|insight\w*|think|plan|close|reason\w*|forecast\w*|predict\w*)\b"
+)
+
+
+@dataclass
+class QueryPlan:
+    metrics: List[str]
+    group_by: Optional[str] = None
+    filters: Dict[str, List[str]] = field(default_factory=dict)
+    years: List[int] = field(default_factory=lambda: [CURRENT_YEAR])
+    top_n: Optional[int] = None
+    ascending: bool = False
+
+
+@dataclass
+class Aggregates:
+    """
+    Per-version aggregates the engine answers from.
+
+    Kept as plain record lists: a few hundred rows are filtered and summed
+    faster in Python than pandas can set up a groupby.
+    """
+    funnel: List[dict]            # one record per year x school x category x degree x program
+    ntr: List[dict]               # one record per census category x degree (current term)
+    ntr_totals: Optional[object]  # NTRSummary
+    funnel_values: Dict[str, List[str]]
+    ntr_values: Dict[str, List[str]]
+    funnel_aliases: List[tuple] = field(default_factory=list)  # (pattern, dim, value), longest first
+    ntr_aliases: List[tuple] = field(default_factory=list)
+
+
+# ── Precomputation ───────────────────────────────────────────────────────
+
+def _funnel_frame(df: pd.DataFrame, year: int) -> pd.DataFrame:
+    """Funnel counts per dimension combination (same rules as calculate_funnel_metrics)."""
+    if df is None or df.empty:
+        return pd.DataFrame()
+    work = pd.DataFrame({
+        key: (df[col].astype(str) if col in df.columns else "") for key, col in FUNNEL_DIMS
+    })
+    work["apps"] = df["Is Application"].astype(int) if "Is Application" in df.columns else 1
+    work["admits"] = (df["Admit Status"] == "admitted").astype(int) if "Admit Status" in df.columns else 0
+    work["enrolls"] = (df["Enrolled"] == "yes").astype(int) if "Enrolled" in df.columns else 0
+    grouped = work.groupby([k for k, _ in FUNNEL_DIMS], as_index=False, sort=False)[["apps", "admits", "enrolls"]].sum()
+    grouped.insert(0, "year", year)
+    return grouped
+
+
+def _funnel_records(data: dict) -> List[dict]:
+    """The funnel cube: one GROUP BY in the SQL layer, or per-year pandas groupbys without duckdb."""
+    layer = get_sql_layer(data)
+    if layer is not None and "funnel" in layer.views:
+        cube = layer.aggregate(["year"] + [k for k, _ in FUNNEL_DIMS], ("apps", "admits", "enrolls"),
+                               where={"year": list(YEARS)}, order_by="year")
+        return cube.to_dict("records")
+    apps = data.get("applications", {})
+    frames = [_funnel_frame(apps.get(key), year)
+              for key, year in zip(("current", "previous", "two_years_ago"), YEARS)]
+    return [r for f in frames if not f.empty for r in f.to_dict("records")]
+
+
+def build_aggregates(data: dict) -> Aggregates:
+    funnel = _funnel_records(data)
+    for r in funnel:
+        r.update(year=int(r["year"]), apps=int(r["apps"]), admits=int(r["admits"]), enrolls=int(r["enrolls"]))
+
+    ntr, ntr_totals = [], data.get("ntr_summary")
+    census_df = data.get("census", {}).get("raw_df")
+    if census_df is not None and not getattr(census_df, "empty", True):
+        try:
+            from ntr_calculator import calculate_ntr_from_census
+
+            summary, breakdown, _ = calculate_ntr_from_census(census_df)
+            ntr_totals = ntr_totals or summary
+            ntr = [{"year": CURRENT_YEAR, "category": c.category, "degree": c.degree_type,
+                    "ntr": c.total_ntr, "credits": c.total_credits, "students": c.total_students}
+                   for c in breakdown]
+        except Exception:
+            ntr = []
+
+    funnel_values = {k: sorted({r[k] for r in funnel if r[k]}) for k, _ in FUNNEL_DIMS}
+    ntr_values = {k: sorted({r[k] for r in ntr if r[k]}) for k in NTR_DIMS}
+    return Aggregates(funnel, ntr, ntr_totals, funnel_values, ntr_values,
+                      _alias_patterns(funnel_values), _alias_patterns(ntr_values))
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _aggregates_cached(version: str, _data: dict) -> Aggregates:
+    """Read-only aggregates shared by every session for one dataset version."""
+    return build_aggregates(_data)
+
+
+def get_aggregates(data: dict) -> Aggregates:
+    return _aggregates_cached(get_dataset_version(data), data)
+
+
+# ── Parsing ──────────────────────────────────────────────────────────────
+
+def _has(text: str, phrase: str) -> bool:
+    return re.search(rf"(?<![\w']){re.escape(phrase)}(?![\w'])", text) is not None
+
+
+def _value_aliases(value: str) -> List[str]:
+    """The value itself, its parenthesised short form, and any VALUE_ALIASES."""
+    v = value.lower()
+    aliases = [v]
+    inner = re.search(r"\(([^)]+)\)", v)
+    if inner:
+        aliases.append(inner.group(1))
+    aliases.extend(alias for alias, targets in VALUE_ALIASES.items() if v in targets)
+    return aliases
+
+
+def _alias_patterns(values: Dict[str, List[str]]) -> List[tuple]:
+    """Compiled word-boundary patterns for every value alias, longest alias first."""
+    candidates = [(alias, dim, value) for dim, vals in values.items()
+                  for value in vals for alias in _value_aliases(value)]
+    candidates.sort(key=lambda c: len(c[0]), reverse=True)
+    return [(re.compile(rf"(?<![\w']){re.escape(alias)}(?![\w'])"), dim, value)
+            for alias, dim, value in candidates]
+
+
+def _match_filters(text: str, values: Dict[str, List[str]], patterns: List[tuple]) -> Dict[str, List[str]]:
+    """Dimension values named in the question; longer names win over their substrings."""
+    found: Dict[str, List[str]] = {}
+    taken: List[Tuple[int, int]] = []
+    for pattern, dim, value in patterns:
+        m = pattern.search(text)
+        if not m:
+            continue
+        span = m.span()
+        # The same words may name values in two dimensions; a shorter alias inside a longer match may not
+        if any(s != span and s[0] < span[1] and span[0] < s[1] for s in taken):
+            continue
+        taken.append(span)
+        vals = found.setdefault(dim, [])
+        if value not in vals:
+            vals.append(value)
+
+    # A name shared by two dimensions (e.g. "CPE" school and category) counts once:
+    # keep the dimension the question mentions, else the first one.
+    dims = list(values)
+    for i, a in enumerate(dims):
+        for b in dims[i + 1:]:
+            if a in found and b in found and \
+                    [v.lower() for v in found[a]] == [v.lower() for v in found[b]]:
+                mentions_b = any(_has(text, w) for w in GROUP_WORDS[b])
+                del found[a if mentions_b else b]
+    return found
+
+
+def is_follow_up(question: str) -> bool:
+    """True when ``question`` refers back to earlier turns of the conversation."""
+    text = re.sub(r"\s+", " ", (question or "").lower().replace("’", "'")).strip()
+    return FOLLOW_UP.search(text) is not None
+
+
+def _uncovered_words(text: str, aggregates: Aggregates, ntr_query: bool,
+                     filters: Dict[str, List[str]]) -> List[str]:
+    """Words of ``text`` that are neither understood terms nor FILLER_WORDS."""
+    phrases = [p for _, _, ps in METRICS.values() for p in ps] + ["funnel", "year over year"]
+    phrases += [w for words in GROUP_WORDS.values() for w in words]
+    spans = [m.span() for p in phrases
+             for m in re.finditer(rf"(?<![\w']){re.escape(p)}(?![\w'])", text)]
+    patterns = aggregates.ntr_aliases if ntr_query else aggregates.funnel_aliases
+    spans += [m.span() for pattern, dim, value in patterns if value in filters.get(dim, ())
+              for m in pattern.finditer(text)]
+    spans += [m.span() for m in re.finditer(r"\b\d+\b", text)]
+    chars = list(text)
+    for start, end in spans:
+        chars[start:end] = " " * (end - start)
+    return [w for w in re.findall(r"[a-z0-9']+", "".join(chars)) if w not in FILLER_WORDS]
+
+
+def _years(text: str) -> List[int]:
+    years = [int(y) for y in re.findall(r"\b(20\d\d)\b", text)]
+    if _has(text, "two years ago"):
+        years.append(YEARS[2])
+    if re.search(r"\b(last|previous|prior) year\b", text) or _has(text, "yoy") or "year over year" in text:
+        years.append(YEARS[1])
+    if re.search(r"\bthis year\b", text) or ((_has(text, "yoy") or "year over year" in text) and CURRENT_YEAR not in years):
+        years.append(CURRENT_YEAR)
+    if len(years) == 1 and re.search(r"\b(vs|versus|compared?)\b", text) and years[0] != CURRENT_YEAR:
+        years.append(CURRENT_YEAR)
+    ordered = sorted(set(years), reverse=True)
+    return ordered or [CURRENT_YEAR]
+
+
+def _clean_text(question: str) -> str:
+    return re.sub(r"\s+", " ", (question or "").lower().replace("’", "'")).strip()
+
+
+def named_values(question: str, aggregates: Aggregates) -> Dict[str, List[str]]:
+    """Funnel dimension values (school, category, degree, program) the question names."""
+    return _match_filters(_clean_text(question), aggregates.funnel_values, aggregates.funnel_aliases)
+
+
+def parse_question(question: str, aggregates: Aggregates) -> Optional[QueryPlan]:
+    """Structured plan for a numeric question, or None if it needs the LLM."""
+    text = _clean_text(question)
+    if not text or NARRATIVE.search(text):
+        return None
+
+    metrics = [m for m, (_, _, phrases) in METRICS.items() if any(_has(text, p) for p in phrases)]
+    if "admit_rate" in metrics and "admits" in metrics and not any(_has(text, p) for p in ("admits", "admitted", "admissions")):
+        metrics.remove("admits")
+    if _has(text, "funnel"):
+        metrics = list(dict.fromkeys(metrics + ["apps", "admits", "enrolls", "yield"]))
+    if not metrics:
+        return None
+    ntr_query = any(m in NTR_METRICS for m in metrics)
+    if ntr_query and any(m in FUNNEL_METRICS for m in metrics):
+        return None  # mixed sources; let the LLM combine them
+    if ntr_query and not aggregates.ntr and aggregates.ntr_totals is None:
+        return None  # no census loaded; the LLM explains what is missing
+    values = aggregates.ntr_values if ntr_query else aggregates.funnel_values
+    patterns = aggregates.ntr_aliases if ntr_query else aggregates.funnel_aliases
+
+    group_by = None
+    for dim in (("category", "degree") if ntr_query else ("program", "school", "category", "degree")):
+        words = GROUP_WORDS[dim]
+        if any(re.search(rf"\b(by|per|each|every|which|what|across|top|bottom|\d+)( \w+)? {w}\b", text) or
+               re.search(rf"\b{w} (breakdown|ranking|split)\b", text) for w in words):
+            group_by = dim
+            break
+
+    filters = _match_filters(text, values, patterns)
+    if group_by is None:
+        # "corporate vs retail": several values of one dimension are compared side by side
+        group_by = next((dim for dim, vals in filters.items() if len(vals) > 1), None)
+    years = _years(text)
+    if ntr_query and years != [CURRENT_YEAR]:
+        return None  # census NTR exists for the current term only
+
+    top = re.search(r"\b(top|bottom|best|worst|highest|lowest) (\d+)\b", text)
+    top_n = int(top.group(2)) if top else None
+    ascending = bool(re.search(r"\b(lowest|least|worst|bottom|fewest|smallest)\b", text))
+    if group_by == "program" and top_n is None:
+        top_n = DEFAULT_TOP_N
+
+    if group_by is None and not filters and re.search(r"\b(which|what) \w+ (has|have|had)\b", text):
+        return None  # asks for a ranking over a dimension we could not identify
+    if _uncovered_words(text, aggregates, ntr_query, filters):
+        return None  # a qualifier (time range, demographic, trend, share) the cube cannot apply
+    return QueryPlan(metrics, group_by, filters, years, top_n, ascending)
+
+
+# ── Execution ────────────────────────────────────────────────────────────
+
+def _metric_value(metric: str, sums: Dict[str, float]) -> float:
+    if metric == "yield":
+        return safe_divide(sums["enrolls"], sums["admits"]) * 100
+    if metric == "admit_rate":
+        return safe_divide(sums["admits"], sums["apps"]) * 100
+    return float(sums[metric])
+
+
+def _fmt(metric: str, value: float) -> str:
+    kind = METRICS[metric][1]
+    if kind == "rate":
+        return format_percent(value)
+    if kind == "currency":
+        return format_currency(value)
+    return format_number(value)
+
+
+def _change(metric: str, current: float, previous: float) -> str:
+    if METRICS[metric][1] == "rate":
+        return f"{current - previous:+.1f} pts"
+    if not previous:
+        return "n/a"
+    return f"{safe_divide(current - previous, previous) * 100:+.1f}%"
+
+
+def execute(plan: QueryPlan, aggregates: Aggregates) -> str:
+    ntr_query = plan.metrics[0] in NTR_METRICS
+    if ntr_query and not plan.group_by and not plan.filters and aggregates.ntr_totals is not None:
+        t = aggregates.ntr_totals
+        return "\n".join([
+            "**NTR (current term)** — local data:",
+            f"- Total NTR: {format_currency(t.total_ntr)} of {format_currency(t.ntr_goal)} goal "
+            f"({format_percent(t.percentage_of_goal)})",
+            f"- Gap to goal: {format_currency(t.gap_to_goal)}",
+            f"- New NTR {format_currency(t.new_ntr)}; Current NTR {format_currency(t.current_ntr)}",
+            f"- Students {format_number(t.total_students)}; Credits {format_number(t.total_credits)}",
+        ])
+    records = aggregates.ntr if ntr_query else aggregates.funnel
+    sum_cols = NTR_METRICS if ntr_query else ("apps", "admits", "enrolls")
+    years = [CURRENT_YEAR] if ntr_query else plan.years
+
+    # Filter and sum in one pass: (year, group) -> column sums
+    sums: Dict[Tuple[int, str], Dict[str, float]] = {}
+    groups: List[str] = []
+    for r in records:
+        if r["year"] not in years or any(r[dim] not in vals for dim, vals in plan.filters.items()):
+            continue
+        group = r[plan.group_by] if plan.group_by else ""
+        if plan.group_by and not group:
+            continue
+        acc = sums.get((r["year"], group))
+        if acc is None:
+            acc = sums[(r["year"], group)] = dict.fromkeys(sum_cols, 0)
+            if group not in groups:
+                groups.append(group)
+        for c in sum_cols:
+            acc[c] += r[c]
+
+    labels = ", ".join(METRICS[m][0] for m in plan.metrics)
+    scope = "; ".join(", ".join(v) for v in plan.filters.values())
+    when = "current term" if ntr_query else " vs ".join(str(y) for y in years)
+    title = f"**{labels}{' by ' + plan.group_by if plan.group_by else ''}"
+    title += f"{' for ' + scope if scope else ''} ({when})** — local data:"
+    if not groups:
+        return f"{title}\n- No matching records."
+
+    empty = dict.fromkeys(sum_cols, 0)
+
+    def value(metric: str, year: int, group: str) -> float:
+        return _metric_value(metric, sums.get((year, group), empty))
+
+    def render(group: str) -> str:
+        parts = []
+        for m in plan.metrics:
+            vals = [value(m, y, group) for y in years]
+            if len(vals) == 1:
+                parts.append(f"{METRICS[m][0]} {_fmt(m, vals[0])}")
+            else:
+                shown = " vs ".join(f"{_fmt(m, v)} ({y})" for v, y in zip(vals, years))
+                parts.append(f"{METRICS[m][0]} {shown}, {_change(m, vals[0], vals[1])}")
+        return "; ".join(parts)
+
+    if not plan.group_by:
+        return f"{title}\n- {render('')}"
+    primary = plan.metrics[0]
+    base = {"yield": "admits", "admit_rate": "apps"}.get(primary)
+    if base:
+        # A program with one admit and one enrollment is not a 100% yield leader
+        groups = [g for g in groups if sums.get((years[0], g), empty)[base] >= MIN_RATE_BASE]
+        title += f"\n_(groups with at least {MIN_RATE_BASE} {METRICS[base][0].lower()} in {years[0]})_"
+        if not groups:
+            return f"{title}\n- No group has enough volume to rank."
+    groups.sort(key=lambda g: value(primary, years[0], g), reverse=not plan.ascending)
+    if plan.top_n:
+        groups = groups[: plan.top_n]
+    return "\n".join([title] + [f"- {g}: {render(g)}" for g in groups])
+
+
+def answer_locally(question: str, data: dict, chat_summary: str = "") -> Optional[str]:
+    """
+    Answer a numeric question from precomputed aggregates, or None for the
+    LLM.  Follow-ups in a conversation (``chat_summary`` set) always go to
+    the LLM, which sees the earlier turns.
+    """
+    if chat_summary and is_follow_up(question):
+        return None
+    try:
+        aggregates = get_aggregates(data)
+        start = time.perf_counter()
+        plan = parse_question(question, aggregates)
+        if plan is None:
+            return None
+        answer = execute(plan, aggregates)
+    except Exception as e:
+        print(f"[QUERY] local engine failed, using LLM: {e}")
+        return None
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"[QUERY] answered locally in {elapsed:.1f}ms: metrics={plan.metrics} "
+          f"group_by={plan.group_by} filters={plan.filters} years={plan.years}")
+    return answer
@@ -0,0 +1,162 @@
+"""
+Local question router for Ask Navs.
+
+Picks DATA_CATEGORIES keys for a question without an LLM call, using a
+TF-IDF classifier whose per-category "documents" are the category
+descriptions, hand-picked keywords, and the suggestion chips labelled with
+the categories they need.  A question that names a school, category, degree
+or program always gets that dimension's breakdown, since the headline
+fragments carry no per-value figures.  When the best score is below the
+confidence threshold the caller falls back to the LLM planner.  Decisions are counted
+(see QuestionRouter.stats) so the thresholds can be tuned.
+"""
+
+from dataclasses import dataclass, field
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import streamlit as st
+
+from components.ai_insights import InsightCard, get_suggestion_chips
+from utils.text_similarity import TfidfIndex, tokenize
+
+
+# Extra vocabulary per category (beyond its DATA_CATEGORIES description)
+CATEGORY_KEYWORDS: Dict[str, str] = {
+    "summary": "overall overview snapshot status headline kpi total how many number of count funnel "
+               "applications apps admits admitted "
+               "enrollments enrolled yield how are we doing new students",
+    "yoy": "year over year yoy last year previous year prior year compared versus vs change growth "
+           "trend trending increase decrease decline up down momentum",
+    "programs": "program programs top programs best programs worst programs major area of study "
+                "which program highest lowest ranking",
+    "ntr": "ntr net tuition revenue tuition revenue dollars money goal target gap to goal credits "
+           "budget financial",
+    "cohorts": "corporate cohort cohorts company companies employer employers partner partners "
+               "sponsor sponsored sponsoring which companies send the most students",
+    "by_school": "school schools by school ses ssb cpe schaefer business engineering systems",
+    "by_degree": "degree degree type degree types masters master's certificate certificates graduate certificate "
+                 "professional certificate dual degree",
+    "by_category": "category categories application category segment channel retail corporate "
+                   "select professional online asap beacon noodle",
+}
+
+# Suggestion chips (see ai_insights.get_suggestion_chips) and the categories they need
+CHIP_CATEGORIES: List[Tuple[str, List[str]]] = [
+    ("What's driving enrollment growth?", ["summary", "yoy", "by_category"]),
+    ("Which programs have the highest yield?", ["programs"]),
+    ("Why is {cat} yield low?", ["summary", "by_category"]),
+    ("How do we close the NTR gap?", ["summary", "ntr"]),
+    ("What's causing the application trend?", ["summary", "yoy", "by_category"]),
+    ("Compare corporate vs retail", ["summary", "by_category"]),
+    ("Give me a YoY performance summary", ["summary", "yoy"]),
+]
+
+# Breakdown category for each funnel dimension (see ai_query_engine.FUNNEL_DIMS)
+DIMENSION_CATEGORIES: Dict[str, str] = {
+    "school": "by_school",
+    "category": "by_category",
+    "degree": "by_degree",
+    "program": "programs",
+}
+
+MAX_CATEGORIES = 4
+MIN_CONFIDENCE = 0.60   # below this the LLM planner decides
+FULL_SCORE = 0.15       # best-category similarity that counts as a clear match
+RELATIVE_CUTOFF = 0.70  # keep categories scoring at least this share of the best
+
+
+@dataclass
+class RouteDecision:
+    categories: List[str]
+    confidence: float
+    confident: bool
+    scores: Dict[str, float] = field(default_factory=dict)
+
+
+def _chip_examples() -> List[Tuple[str, List[str]]]:
+    """Chips exactly as get_suggestion_chips renders them, with their labels."""
+    probe = [
+        InsightCard("alert", "Low Yield Alert", "Retail yield is low", "", "", ""),
+        InsightCard("alert", "NTR Gap", "NTR gap", "", "", ""),
+        InsightCard("trend", "Apps Trend Up", "Applications up", "", "", ""),
+    ]
+    rendered = get_suggestion_chips({}, probe)
+    examples = []
+    for template, cats in CHIP_CATEGORIES:
+        prefix = template.split("{")[0]
+        matches = [c for c in rendered if c.startswith(prefix)] or [template.replace("{cat}", "")]
+        examples.extend((m, cats) for m in matches)
+    return examples
+
+
+class QuestionRouter:
+    """TF-IDF nearest-category router with confidence-gated fallback."""
+
+    def __init__(self, categories: Dict[str, str]):
+        self.keys = list(categories)
+        docs = {k: [categories[k], CATEGORY_KEYWORDS.get(k, "")] for k in self.keys}
+        for text, cats in _chip_examples():
+            for k in cats:
+                if k in docs:
+                    docs[k].append(text)
+        self.index = TfidfIndex([" ".join(docs[k]) for k in self.keys])
+        self._lock = threading.Lock()
+        self.routed = 0
+        self.fallbacks = 0
+
+    def _coverage(self, tokens: List[str]) -> float:
+        """IDF-weighted share of question words that appear in the training vocabulary."""
+        weights = {t: self.index.idf.get(t, self.index._default_idf) for t in set(tokens)}
+        known = sum(w for t, w in weights.items() if t in self.index.idf)
+        return known / sum(weights.values())
+
+    def route(self, question: str, named: Optional[Dict[str, List[str]]] = None) -> RouteDecision:
+        """
+        Categories for ``question``.  ``named`` maps funnel dimensions to the
+        values the question names (ai_query_engine.named_values); each one
+        adds its breakdown, and one without a breakdown here is not confident.
+        """
+        tokens = tokenize(question)
+        if not tokens:
+            return self._record(RouteDecision([], 0.0, False))
+        scores = dict(zip(self.keys, self.index.similarities(question)))
+        best = max(scores.values())
+        ranked = [k for k in self.keys if scores[k] >= max(best * RELATIVE_CUTOFF, 1e-9)]
+        ranked.sort(key=scores.__getitem__, reverse=True)
+
+        dims = [d for d, values in (named or {}).items() if values]
+        needed = [DIMENSION_CATEGORIES[d] for d in dims if DIMENSION_CATEGORIES.get(d) in self.keys]
+        chosen = list(dict.fromkeys(needed + ranked))
+        # Planner rule: summary anchors everything except purely program questions
+        if "summary" in self.keys and chosen != ["programs"]:
+            chosen = ["summary"] + [k for k in chosen if k != "summary"]
+        keep = set(chosen[:MAX_CATEGORIES]) | set(needed)
+        chosen = [k for k in chosen if k in keep]
+
+        # Confidence = recognised share of the question x strength of the best match
+        confidence = self._coverage(tokens) * min(1.0, best / FULL_SCORE)
+        covered = len(needed) == len(dims)
+        decision = RouteDecision(chosen, confidence, covered and confidence >= MIN_CONFIDENCE,
+                                 {k: round(v, 3) for k, v in scores.items()})
+        return self._record(decision)
+
+    def _record(self, decision: RouteDecision) -> RouteDecision:
+        with self._lock:
+            if decision.confident:
+                self.routed += 1
+            else:
+                self.fallbacks += 1
+        return decision
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.routed + self.fallbacks
+            return {"routed": self.routed, "fallbacks": self.fallbacks,
+                    "fallback_rate": self.fallbacks / total if total else 0.0}
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_router(categories: Tuple[Tuple[str, str], ...]) -> QuestionRouter:
+    """Shared router for a category set (pass ``tuple(DATA_CATEGORIES.items())``)."""
+    return QuestionRouter(dict(categories))
@@ -0,0 +1,164 @@
+"""
+Chart rendering service for report exports.
+
+Keeps one warm Kaleido browser per process and rasterizes Plotly figures
+concurrently across its tabs.  Finished PNGs are cached by a hash of the
+figure spec and output size, so re-exporting an unchanged scenario never
+touches the browser.
+
+Usage:
+    from components.chart_renderer import get_renderer
+    pngs = get_renderer().render_many([(fig, 720, 380), ...])
+"""
+
+from __future__ import annotations
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Iterable
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+
+DEFAULT_TABS = 4          # concurrent Kaleido tabs (figures in flight)
+DEFAULT_CACHE_SIZE = 256  # PNGs kept in memory
+RENDER_SCALE = 2
+
+
+def figure_key(fig: go.Figure, width: int, height: int, scale: int = RENDER_SCALE) -> str:
+    """Stable hash of a figure spec and its output size."""
+    spec = pio.to_json(fig, validate=False, pretty=False)
+    raw = f"{spec}|{width}x{height}@{scale}".encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+class ChartRenderer:
+    """
+    One long-lived Kaleido instance driven from a private event-loop thread.
+
+    The browser is started lazily on first use and reused for every later
+    call; ``render_many`` submits all uncached figures at once so they are
+    rasterized in parallel across ``tabs`` browser tabs.
+    """
+
+    def __init__(self, tabs: int = DEFAULT_TABS, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.tabs = tabs
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._kaleido = None
+        self.hits = 0
+        self.misses = 0
+
+    # ── Lifecycle ──────────────────────────────────────────────────
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._kaleido is not None:
+                return
+            import kaleido
+
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="chart-renderer", daemon=True)
+            thread.start()
+
+            async def _open():
+                k = kaleido.Kaleido(n=self.tabs)
+                await k.open()
+                return k
+
+            try:
+                self._kaleido = asyncio.run_coroutine_threadsafe(_open(), loop).result()
+            except Exception:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join(timeout=5)
+                loop.close()
+                raise
+            self._loop, self._thread = loop, thread
+
+    def close(self):
+        """Shut the browser down; the next render starts a fresh one."""
+        with self._start_lock:
+            if self._kaleido is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._kaleido.close(), self._loop).result(timeout=30)
+            except Exception:
+                pass
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+            self._kaleido = self._loop = self._thread = None
+
+    # ── Cache ──────────────────────────────────────────────────────
+    def _cache_get(self, key: str) -> bytes | None:
+        with self._cache_lock:
+            png = self._cache.get(key)
+            if png is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            return png
+
+    def _cache_put(self, key: str, png: bytes):
+        with self._cache_lock:
+            self._cache[key] = png
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._cache_lock:
+            return {"hits": self.hits, "misses": self.misses, "cached": len(self._cache)}
+
+    # ── Rendering ──────────────────────────────────────────────────
+    async def _render_all(self, jobs: list[tuple[dict, int, int]]) -> list[bytes]:
+        return await asyncio.gather(*(
+            self._kaleido.calc_fig(
+                fig_dict,
+                opts=dict(format="png", width=width, height=height, scale=RENDER_SCALE),
+            )
+            for fig_dict, width, height in jobs
+        ))
+
+    def render_many(self, figures: Iterable[tuple[go.Figure, int, int]]) -> list[bytes]:
+        """PNG bytes for each ``(fig, width, height)``, in input order."""
+        figures = list(figures)
+        keys = [figure_key(fig, w, h) for fig, w, h in figures]
+        out: list[bytes | None] = [self._cache_get(k) for k in keys]
+
+        # Uncached figures, de-duplicated by key
+        pending: dict[str, tuple[dict, int, int]] = {}
+        for key, png, (fig, w, h) in zip(keys, out, figures):
+            if png is None and key not in pending:
+                pending[key] = (fig.to_dict(), w, h)
+
+        if pending:
+            self._ensure_started()
+            fut = asyncio.run_coroutine_threadsafe(self._render_all(list(pending.values())), self._loop)
+            rendered = dict(zip(pending, fut.result()))
+            with self._cache_lock:
+                self.misses += len(rendered)
+            for key, png in rendered.items():
+                self._cache_put(key, png)
+            out = [png if png is not None else rendered[key] for key, png in zip(keys, out)]
+        return out
+
+    def render(self, fig: go.Figure, width: int, height: int) -> bytes:
+        return self.render_many([(fig, width, height)])[0]
+
+
+_renderer: ChartRenderer | None = None
+_renderer_lock = threading.Lock()
+
+
+def get_renderer() -> ChartRenderer:
+    """The process-wide renderer (created on first call)."""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = ChartRenderer()
+        return _renderer
@@ -373,7 +373,8 @@ def render(data: dict):
         apps_data.get('current'),
         apps_data.get('previous'),
         apps_data.get('two_years_ago'),
-        census_summary
+        census_summary,
+        pace=data.get('pace'),
     )
     
     # Funnel Stage Cards
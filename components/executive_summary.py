@@ -48,11 +48,12 @@ def render_ai_insights_section(data: dict):
         apps_data.get('current'),
         apps_data.get('previous'),
         apps_data.get('two_years_ago'),
-        census_summary
+        census_summary,
+        pace=data.get('pace'),
     )
     
     current = summary_stats['overall'][2026]
-    yoy = summary_stats['yoy']['2026_vs_2025']
+    yoy = (summary_stats.get('yoy_to_date') or summary_stats['yoy'])['2026_vs_2025']
     
     # Build quick summary text
     summary_parts = []
@@ -380,7 +381,8 @@ def render(data: dict):
         apps_data.get('current'),
         apps_data.get('previous'),
         apps_data.get('two_years_ago'),
-        census_summary
+        census_summary,
+        pace=data.get('pace'),
     )
     
     # KPI Cards
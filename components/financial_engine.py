@@ -7,6 +7,8 @@ returns pandas DataFrames or scalars.
 """
 
 from __future__ import annotations
+import hashlib
+import json
 import numpy as np
 import pandas as pd
 from math import ceil
@@ -433,3 +435,360 @@ def compute_scenario(inputs: dict) -> dict[str, Any]:
         "total_margin":     totals["Net Margin %"],
         "term_labels":      generate_term_labels(inputs),
     }
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Scenario identity & compact storage
+# ─────────────────────────────────────────────────────────────────────
+
+def _canonical(value):
+    """Normalise numbers so 25, 25.0 and np.int64(25) hash identically."""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return float(value)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_canonical(v) for v in value]
+    return str(value)
+
+
+def scenario_key(inputs: dict) -> str:
+    """Stable short hash of a scenario's inputs (order- and type-insensitive)."""
+    payload = json.dumps(_canonical(inputs), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def compact_results(results: dict) -> dict[str, Any]:
+    """
+    Fiscal-year arrays and headline totals from a compute_scenario result.
+
+    A few hundred bytes per scenario, versus the full cohort / revenue /
+    cost tables; use expand_pl_summary to rebuild the P&L table, or
+    compute_scenario on the saved inputs for everything else.
+    """
+    pl = results["pl_summary"]
+    return {
+        "fiscal_years":    pl["Fiscal Year"].tolist(),
+        "revenue":         pl["Revenue"].to_numpy(dtype=float),
+        "cost":            pl["Cost"].to_numpy(dtype=float),
+        "net":             pl["Net"].to_numpy(dtype=float),
+        "cumulative":      pl["Cumulative"].to_numpy(dtype=float),
+        "margin":          pl["Net Margin %"].to_numpy(dtype=float),
+        "break_even_year": results["break_even_year"],
+        "total_revenue":   float(results["total_revenue"]),
+        "total_cost":      float(results["total_cost"]),
+        "total_net":       float(results["total_net"]),
+        "total_margin":    float(results["total_margin"]),
+    }
+
+
+def expand_pl_summary(compact: dict) -> pd.DataFrame:
+    """Rebuild the compute_pl_summary table from compact_results output."""
+    return pd.DataFrame({
+        "Fiscal Year":  compact["fiscal_years"],
+        "Revenue":      compact["revenue"],
+        "Cost":         compact["cost"],
+        "Net":          compact["net"],
+        "Cumulative":   compact["cumulative"],
+        "Net Margin %": compact["margin"],
+    })
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Batched evaluation (one input varied across many candidate values)
+# ─────────────────────────────────────────────────────────────────────
+
+# Inputs the goal-seek solver may vary: (lower bound, upper bound, integer?).
+# Bounds mirror the Program Financial Estimation widgets.  Structural inputs
+# (projection years, summer term, credits, graduation curve) change the
+# shape of the model and are deliberately not solvable.
+SOLVABLE_INPUTS: dict[str, tuple[float, float, bool]] = {
+    "initial_intake":                (1, 1000, True),
+    "tuition_per_credit":            (0, 10_000, True),
+    "fall_growth_rate":              (-0.50, 2.00, False),
+    "spring_growth_rate":            (-0.50, 2.00, False),
+    "summer_growth_rate":            (-0.50, 2.00, False),
+    "early_retention_rate":          (0.0, 1.0, False),
+    "late_retention_rate":           (0.0, 1.0, False),
+    "tuition_inflation_pct":         (0.0, 0.20, False),
+    "dev_cost_per_course":           (0, 500_000, True),
+    "faculty_cost_per_section":      (0, 100_000, True),
+    "variable_overhead_per_student": (0, 10_000, True),
+    "fixed_overhead_per_term":       (0, 500_000, True),
+    "cac_per_student":               (0, 50_000, True),
+    "cost_inflation_pct":            (0.0, 0.30, False),
+}
+
+GOAL_SEEK_METRICS = ("break_even_year", "total_net", "total_margin")
+
+# compute_cohort_matrix rounds intakes with Python's round() (correctly
+# rounded on the binary value); everything downstream is np.float64 and
+# rounds like np.round.  Half-cent ties differ between the two.
+_py_round = np.frompyfunc(round, 2, 1)
+
+
+def compute_pl_batch(inputs: dict, field: str, values) -> dict[str, np.ndarray]:
+    """
+    Evaluate the P&L for K candidate values of one input in a single pass.
+
+    Mirrors compute_scenario (including its cent rounding) but carries a
+    leading batch axis instead of building per-term DataFrames.  Returns
+    arrays of shape (K, years) for "revenue", "cost", "net" and
+    "cumulative", plus (K,) arrays "total_net", "total_margin" and
+    "break_even_index" (-1 when the horizon never breaks even).
+    """
+    if field not in SOLVABLE_INPUTS:
+        raise ValueError(f"'{field}' cannot be varied in a batch evaluation")
+
+    vals = np.asarray(values, dtype=float).reshape(-1)
+    k = len(vals)
+
+    def p(key: str, default: float = 0.0) -> np.ndarray:
+        if key == field:
+            return vals
+        return np.full(k, float(inputs.get(key, default)))
+
+    tpy = _terms_per_year(inputs)
+    years = inputs["projection_years"]
+    n_cal = years * tpy
+    grad_curve = _get_graduation_curve(inputs)
+    max_active = len(grad_curve)
+    year_idx = np.arange(n_cal) // tpy
+
+    # Cohort intakes, grown term over term as in compute_cohort_intakes
+    growth = {
+        "Fall":   p("fall_growth_rate"),
+        "Spring": p("spring_growth_rate"),
+        "Summer": p("summer_growth_rate"),
+    }
+    intakes = np.zeros((k, n_cal))
+    intakes[:, 0] = p("initial_intake")
+    for t in range(1, n_cal):
+        intakes[:, t] = intakes[:, t - 1] * (1 + growth[get_term_type(t, inputs)])
+
+    # Cohort matrix (K, cohorts, internal terms), same arithmetic as
+    # _compute_single_cohort so results agree to the cent
+    ret_early = p("early_retention_rate")[:, None]
+    ret_late  = p("late_retention_rate")[:, None]
+    threshold = inputs["retention_threshold_term"]
+    active = np.zeros((k, n_cal, max_active))
+    active[:, :, 0] = intakes
+    for t in range(1, max_active):
+        retention = ret_early if t < threshold else ret_late
+        retained = active[:, :, t - 1] * retention
+        cum_now  = grad_curve[t - 1]
+        cum_prev = grad_curve[t - 2] if (t - 2) >= 0 else 0.0
+        graduates = np.maximum(0.0, (cum_now - cum_prev) * intakes)
+        active[:, :, t] = np.maximum(0.0, retained - np.minimum(retained, graduates))
+
+    # Total active per calendar term = Σ_c active[c, t - c]
+    total_active = np.zeros((k, n_cal))
+    for c in range(n_cal):
+        span = min(max_active, n_cal - c)
+        total_active[:, c:c + span] += active[:, c, :span]
+
+    students = np.round(total_active, 2)
+    new = np.round(_py_round(intakes, 2).astype(float), 2)
+
+    # Revenue
+    t_mult = (1 + p("tuition_inflation_pct")[:, None]) ** year_idx
+    revenue = np.round(
+        students * p("tuition_per_credit")[:, None] * inputs["credits_per_term"] * t_mult, 2
+    )
+
+    # Costs
+    sessions = 2 if inputs["delivery_format"] == "8-week" else 1
+    ta_ratio = float(inputs["ta_student_ratio"])
+    ta_const = (
+        inputs["ta_hourly_rate"] * inputs["ta_hours_per_week"]
+        * inputs["weeks_per_session"] * sessions
+    ) / ta_ratio if ta_ratio > 0 else 0.0
+    total_course = (
+        inputs["courses_to_develop"] * p("dev_cost_per_course")
+        + inputs["courses_to_revise"] * p("dev_cost_per_course") * inputs["revision_cost_pct"]
+    )
+    amort = max(inputs["dev_amortization_terms"], 1)
+    course_dev = np.where(np.arange(n_cal) < amort, (total_course / amort)[:, None], 0.0)
+
+    base = (
+        (p("faculty_cost_per_section") * inputs["sections_per_term"])[:, None]
+        + students * ta_const
+        + course_dev
+        + students * p("variable_overhead_per_student")[:, None]
+        + p("fixed_overhead_per_term")[:, None]
+        + new * p("cac_per_student")[:, None]
+    )
+    c_mult = (1 + p("cost_inflation_pct")[:, None]) ** year_idx
+    cost = np.round(base * c_mult, 2)
+
+    # Fiscal-year roll-up (same rounding order as compute_pl_summary)
+    rev_fy = revenue.reshape(k, years, tpy).sum(axis=2)
+    cost_fy = cost.reshape(k, years, tpy).sum(axis=2)
+    net_fy = rev_fy - cost_fy
+    cumulative = np.round(np.cumsum(net_fy, axis=1), 2)
+    rev_fy = np.round(rev_fy, 2)
+    cost_fy = np.round(cost_fy, 2)
+
+    # Sequential sums (cumsum) rather than np.sum's pairwise reduction
+    total_rev = np.cumsum(rev_fy, axis=1)[:, -1]
+    total_net = total_rev - np.cumsum(cost_fy, axis=1)[:, -1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total_margin = np.where(total_rev != 0, total_net / total_rev * 100, 0.0)
+
+    broke_even = cumulative >= 0
+    be_index = np.where(broke_even.any(axis=1), broke_even.argmax(axis=1), -1)
+
+    return {
+        "values":           vals,
+        "revenue":          rev_fy,
+        "cost":             cost_fy,
+        "net":              np.round(net_fy, 2),
+        "cumulative":       cumulative,
+        "total_net":        np.round(total_net, 2),
+        "total_margin":     np.round(total_margin, 2),
+        "break_even_index": be_index,
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Goal seek
+# ─────────────────────────────────────────────────────────────────────
+
+def _break_even_target_index(inputs: dict, target) -> int:
+    """Convert 2028 / 'FY2028' to a 0-based year index within the horizon."""
+    fy = int(str(target).upper().replace("FY", "").strip())
+    idx = fy - inputs.get("start_fy", 2026)
+    if not 0 <= idx < inputs["projection_years"]:
+        raise ValueError(f"FY{fy} is outside the projection horizon")
+    return idx
+
+
+def _goal_gap(batch: dict, metric: str, target, inputs: dict) -> np.ndarray:
+    """Signed distance to the goal; >= 0 means the goal is met."""
+    if metric == "break_even_year":
+        return batch["cumulative"][:, _break_even_target_index(inputs, target)]
+    if metric == "total_net":
+        return batch["total_net"] - float(target)
+    if metric == "total_margin":
+        return batch["total_margin"] - float(target)
+    raise ValueError(f"Unknown goal-seek metric '{metric}'")
+
+
+def _metric_value(batch: dict, i: int, metric: str, inputs: dict):
+    if metric == "break_even_year":
+        be = int(batch["break_even_index"][i])
+        return f"FY{inputs.get('start_fy', 2026) + be}" if be >= 0 else None
+    return float(batch[metric][i])
+
+
+def goal_seek(
+    inputs: dict,
+    field: str,
+    metric: str,
+    target,
+    bounds: tuple[float, float] | None = None,
+    points: int = 9,
+    max_batches: int = 12,
+    tol: float | None = None,
+) -> dict[str, Any]:
+    """
+    Solve for the value of ``field`` at which ``metric`` reaches ``target``.
+
+    metric
+        "break_even_year" – cumulative net is >= 0 by fiscal year ``target``
+                            (e.g. 2028 or "FY2028")
+        "total_net"       – total net over the horizon >= ``target`` dollars
+        "total_margin"    – total net margin >= ``target`` percent
+
+    Each round evaluates ``points`` evenly spaced candidates in one
+    compute_pl_batch call and narrows the bracket to the pair that
+    straddles the goal, so the bracket shrinks by (points - 1)× per call.
+    Integer inputs converge to the exact boundary integer.
+
+    Returns a dict with the solved ``value`` (None when the goal cannot be
+    met anywhere in ``bounds``), the metric achieved at that value, the
+    updated ``inputs`` and the number of batched engine calls used.
+    """
+    if metric not in GOAL_SEEK_METRICS:
+        raise ValueError(f"Unknown goal-seek metric '{metric}'")
+    if field not in SOLVABLE_INPUTS:
+        raise ValueError(f"'{field}' is not a solvable input")
+
+    default_lo, default_hi, is_int = SOLVABLE_INPUTS[field]
+    lo, hi = bounds if bounds is not None else (default_lo, default_hi)
+    lo, hi = float(min(lo, hi)), float(max(lo, hi))
+    if is_int:
+        lo, hi = float(ceil(lo)), float(int(hi))
+    if tol is None:
+        tol = 1.0 if is_int else (hi - lo) * 1e-4
+    points = max(3, int(points))
+
+    def grid(a: float, b: float) -> np.ndarray:
+        xs = np.linspace(a, b, points)
+        return np.unique(np.round(xs)) if is_int else xs
+
+    xs = grid(lo, hi)
+    batch = compute_pl_batch(inputs, field, xs)
+    gap = _goal_gap(batch, metric, target, inputs)
+    batches, evaluations = 1, len(xs)
+    met = gap >= 0
+
+    # Which side of the range satisfies the goal (e.g. higher intake helps,
+    # higher CAC hurts)?  Decided from the first round's end points.
+    increasing = gap[-1] >= gap[0]
+    result: dict[str, Any] = {
+        "field": field,
+        "metric": metric,
+        "target": target,
+        "value": None,
+        "metric_value": None,
+        "satisfied": False,
+        "at_bound": False,
+        "converged": False,
+        "batches": batches,
+        "evaluations": evaluations,
+        "inputs": None,
+    }
+
+    if not met.any():
+        best = int(np.argmax(gap))
+        result["metric_value"] = _metric_value(batch, best, metric, inputs)
+        return result
+
+    if met.all():
+        i = 0 if increasing else len(xs) - 1
+        value = xs[i]
+        result.update(satisfied=True, at_bound=True, converged=True,
+                      metric_value=_metric_value(batch, i, metric, inputs))
+    else:
+        # Narrow to the adjacent pair that straddles the goal: the first
+        # unmet→met flip when higher values help, the last met→unmet flip
+        # when they hurt.
+        while True:
+            flips = np.nonzero(met[:-1] != met[1:])[0]
+            j = int(flips[0] if increasing else flips[-1])
+            sat = j + 1 if met[j + 1] else j
+            value = xs[sat]
+            metric_value = _metric_value(batch, sat, metric, inputs)
+            a, b = xs[j], xs[j + 1]
+            if b - a <= tol or batches >= max_batches:
+                break
+            xs = grid(a, b)
+            if len(xs) <= 2:
+                break
+            batch = compute_pl_batch(inputs, field, xs)
+            gap = _goal_gap(batch, metric, target, inputs)
+            met = gap >= 0
+            batches += 1
+            evaluations += len(xs)
+        result.update(satisfied=True, converged=bool(b - a <= tol or len(xs) <= 2),
+                      metric_value=metric_value)
+
+    value = int(value) if is_int else float(value)
+    solved = dict(inputs)
+    solved[field] = value
+    result.update(value=value, inputs=solved,
+                  batches=batches, evaluations=evaluations)
+    return result
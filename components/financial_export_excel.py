@@ -16,6 +16,7 @@ import io
 from typing import Any
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import (
     Alignment, Border, Font, PatternFill, Side, NamedStyle, numbers,
 )
@@ -56,103 +57,137 @@ _ALIGN_LEFT   = Alignment(horizontal="left", vertical="center")
 
 
 # ── Utility ───────────────────────────────────────────────────────────
+#
+# The workbook is written in openpyxl's write-only (streaming) mode: rows
+# are serialised as they are appended instead of being held as a cell grid,
+# so memory stays flat as projections get longer.  Column widths, merges,
+# tab colours and freeze panes must therefore be set *before* the first
+# row is appended, and widths are computed from the source values rather
+# than by re-reading cells.
 
 def _set_col_widths(ws, widths: dict[str, float]):
     for col, w in widths.items():
         ws.column_dimensions[col].width = w
 
 
-def _write_header_row(ws, row: int, values: list[str], start_col: int = 1):
+def _apply_widths(ws, columns: list, min_width: float = 10, max_width: float = 22):
+    """
+    Size each column from the values that will be written to it.
+
+    ``columns[i]`` holds every value destined for column i+1, either as an
+    iterable or a pandas Series (measured vectorised).
+    """
+    for i, values in enumerate(columns):
+        if isinstance(values, pd.Series):
+            longest = int(values.astype(str).str.len().max()) if len(values) else 0
+        else:
+            longest = max((len(str(v)) for v in values if v is not None), default=0)
+        width = max(min_width, min(longest + 2, max_width))
+        ws.column_dimensions[get_column_letter(i + 1)].width = width
+
+
+def _cell(ws, value, font: Font = _BODY_FONT, fill: PatternFill | None = None,
+          alignment: Alignment | None = None, border: Border | None = None,
+          fmt: str | None = None) -> WriteOnlyCell:
+    cell = WriteOnlyCell(ws, value=value)
+    cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    if border is not None:
+        cell.border = border
+    if fmt:
+        cell.number_format = fmt
+    return cell
+
+
+def _header_cells(ws, values: list[str]) -> list[WriteOnlyCell]:
+    return [_cell(ws, v, _HEADER_FONT, _HEADER_FILL, _ALIGN_CENTER) for v in values]
+
+
+def _data_cells(ws, values: list, bold: bool = False, fmt: str | None = None,
+                alt: bool = False, fmts: list[str | None] | None = None) -> list[WriteOnlyCell]:
+    """Styled body row; ``fmts`` gives per-column number formats (else ``fmt``)."""
+    cells = []
     for i, val in enumerate(values):
-        cell = ws.cell(row=row, column=start_col + i, value=val)
-        cell.font = _HEADER_FONT
-        cell.fill = _HEADER_FILL
-        cell.alignment = _ALIGN_CENTER
+        is_num = isinstance(val, (int, float)) and not isinstance(val, bool)
+        col_fmt = fmts[i] if fmts is not None else fmt
+        cells.append(_cell(
+            ws, val,
+            font=_BOLD_FONT if bold else _BODY_FONT,
+            fill=_ALT_FILL if alt else None,
+            alignment=_ALIGN_RIGHT if is_num else _ALIGN_LEFT,
+            border=_THIN_BORDER,
+            fmt=col_fmt if is_num else None,
+        ))
+    return cells
 
 
-def _write_data_row(ws, row: int, values: list, start_col: int = 1,
-                    bold: bool = False, fmt: str | None = None, alt: bool = False):
-    for i, val in enumerate(values):
-        cell = ws.cell(row=row, column=start_col + i, value=val)
-        cell.font = _BOLD_FONT if bold else _BODY_FONT
-        cell.alignment = _ALIGN_RIGHT if isinstance(val, (int, float)) else _ALIGN_LEFT
-        cell.border = _THIN_BORDER
-        if alt:
-            cell.fill = _ALT_FILL
-        if fmt and isinstance(val, (int, float)):
-            cell.number_format = fmt
-
-
-def _auto_width(ws, min_width: float = 10, max_width: float = 22):
-    for col_cells in ws.columns:
-        max_len = min_width
-        col_letter = get_column_letter(col_cells[0].column)
-        for cell in col_cells:
-            if cell.value is not None:
-                max_len = max(max_len, min(len(str(cell.value)) + 2, max_width))
-        ws.column_dimensions[col_letter].width = max_len
+def _frame_rows(df: pd.DataFrame):
+    """Yield DataFrame rows as lists of plain Python scalars."""
+    for row in df.itertuples(index=False, name=None):
+        yield [v.item() if hasattr(v, "item") else v for v in row]
 
 
 # ═══════════════════════════ SHEET BUILDERS ═══════════════════════════
 
 def _build_executive_summary(wb: Workbook, inputs: dict, results: dict):
-    ws = wb.active
-    ws.title = "Executive Summary"
+    ws = wb.create_sheet("Executive Summary")
     ws.sheet_properties.tabColor = _RED_HEX
 
-    # Title block
-    ws.merge_cells("A1:G1")
-    c = ws["A1"]
-    c.value = f"{inputs['program_name']} - Financial Estimation"
-    c.font = _TITLE_FONT
-    c.alignment = _ALIGN_LEFT
-
-    ws.merge_cells("A2:G2")
-    c = ws["A2"]
     start = inputs.get("start_fy", 2026)
-    c.value = f"{inputs['projection_years']}-Year Outlook  |  FY{start}-FY{start + inputs['projection_years'] - 1}  |  {inputs['delivery_format']} delivery"
-    c.font = Font(name="Calibri", size=10, italic=True, color=_GRAY_HEX)
-
-    # KPI row (row 4)
+    title = f"{inputs['program_name']} - Financial Estimation"
+    subtitle = (f"{inputs['projection_years']}-Year Outlook  |  FY{start}-FY{start + inputs['projection_years'] - 1}"
+                f"  |  {inputs['delivery_format']} delivery")
     kpis = [
         ("Total Revenue", results["total_revenue"], _MONEY_FMT),
         ("Total Cost",    results["total_cost"],    _MONEY_FMT),
         ("Net P&L",       results["total_net"],     _MONEY_NEG),
         ("Break-Even",    results["break_even_year"] or "N/A", None),
     ]
-    for i, (label, val, fmt) in enumerate(kpis):
-        col = 1 + i * 2
-        lbl_cell = ws.cell(row=4, column=col, value=label)
-        lbl_cell.font = _KPI_LABEL
-        val_cell = ws.cell(row=5, column=col, value=val)
-        val_cell.font = _KPI_FONT
-        if fmt and isinstance(val, (int, float)):
-            val_cell.number_format = fmt
+    kpis = [(lbl, val.item() if hasattr(val, "item") else val, fmt) for lbl, val, fmt in kpis]
 
-    # P&L table
     pl = results["pl_summary"]
-    header_row = 7
     cols = list(pl.columns)
-    _write_header_row(ws, header_row, cols)
+    header_row = 7
+    last_data_row = header_row + len(pl)
 
-    for r_idx, (_, row) in enumerate(pl.iterrows()):
-        is_total = row["Fiscal Year"] == "Total"
-        is_alt = r_idx % 2 == 1 and not is_total
-        vals = []
-        for col in cols:
-            v = row[col]
-            vals.append(v)
-        data_row = header_row + 1 + r_idx
-        _write_data_row(ws, data_row, vals, bold=is_total, alt=is_alt)
-        # Apply formats
-        for ci, col_name in enumerate(cols):
-            cell = ws.cell(row=data_row, column=1 + ci)
-            if col_name in ("Revenue", "Cost", "Net", "Cumulative"):
-                cell.number_format = _MONEY_NEG
-            elif col_name == "Net Margin %":
-                cell.number_format = '0.0"%"'
+    # Widths from the values each column receives
+    widths = [[h] + pl[h].tolist() for h in cols]
+    widths += [[] for _ in range(7 - len(widths))]
+    widths[0] += [title, subtitle]
+    for i, (label, val, _) in enumerate(kpis):
+        widths[i * 2] += [label, val]
+    _apply_widths(ws, widths)
+    ws.merged_cells.add("A1:G1")
+    ws.merged_cells.add("A2:G2")
+    ws.freeze_panes = f"A{header_row + 1}"
 
-    last_data_row = header_row + len(pl)
+    # Title block (rows 1-2)
+    ws.append([_cell(ws, title, _TITLE_FONT, alignment=_ALIGN_LEFT)])
+    ws.append([_cell(ws, subtitle, Font(name="Calibri", size=10, italic=True, color=_GRAY_HEX))])
+    ws.append([])
+
+    # KPI row (rows 4-5)
+    labels: list = [None] * 7
+    values: list = [None] * 7
+    for i, (label, val, fmt) in enumerate(kpis):
+        labels[i * 2] = _cell(ws, label, _KPI_LABEL)
+        values[i * 2] = _cell(ws, val, _KPI_FONT,
+                              fmt=fmt if isinstance(val, (int, float)) else None)
+    ws.append(labels)
+    ws.append(values)
+    ws.append([])
+
+    # P&L table
+    ws.append(_header_cells(ws, cols))
+    fmts = [_MONEY_NEG if c in ("Revenue", "Cost", "Net", "Cumulative")
+            else '0.0"%"' if c == "Net Margin %" else None for c in cols]
+    for r_idx, vals in enumerate(_frame_rows(pl)):
+        is_total = vals[0] == "Total"
+        is_alt = r_idx % 2 == 1 and not is_total
+        ws.append(_data_cells(ws, vals, bold=is_total, alt=is_alt, fmts=fmts))
 
     # Bar chart: Revenue vs Cost
     chart = BarChart()
@@ -190,40 +225,39 @@ def _build_executive_summary(wb: Workbook, inputs: dict, results: dict):
         line.series[0].graphicalProperties.line.solidFill = _RED_HEX
     ws.add_chart(line, f"A{last_data_row + 18}")
 
-    _auto_width(ws)
-    ws.freeze_panes = f"A{header_row + 1}"
-
 
 def _build_cohort_matrix(wb: Workbook, inputs: dict, results: dict):
     ws = wb.create_sheet("Cohort Matrix")
     ws.sheet_properties.tabColor = _DGRAY_HEX
 
-    cm = results["cohort_matrix"]
+    sums = results["cohort_matrix"].sum().round(1)
+    cm = results["cohort_matrix"].round(1)
+    labels = results["term_labels"]
+    active = [round(float(v), 1) for v in results["total_active"]]
     headers = ["Cohort"] + list(cm.columns)
-    _write_header_row(ws, 1, headers)
+    last_row = 1 + len(cm)
+    chart_start = last_row + 3
 
-    for r_idx, (idx_label, row) in enumerate(cm.iterrows()):
-        vals = [idx_label] + [round(v, 1) for v in row.values]
-        _write_data_row(ws, 2 + r_idx, vals, alt=r_idx % 2 == 1, fmt='#,##0.0')
+    index = pd.Series(cm.index.astype(str))
+    widths = [pd.concat([index, pd.Series(["Cohort", "Sum", "Term"] + labels)])]
+    for i, col in enumerate(cm.columns):
+        extra = [col, sums[col]] + (["Total Active"] + active if i == 0 else [])
+        widths.append(pd.concat([cm[col], pd.Series(extra)]))
+    _apply_widths(ws, widths)
+    ws.freeze_panes = "B2"
 
-    last_row = 1 + len(cm)
+    ws.append(_header_cells(ws, headers))
+    for r_idx, (idx_label, vals) in enumerate(zip(cm.index, cm.to_numpy().tolist())):
+        ws.append(_data_cells(ws, [idx_label] + vals, alt=r_idx % 2 == 1, fmt='#,##0.0'))
 
     # Sum row
-    sum_vals = ["Sum"]
-    for col in cm.columns:
-        sum_vals.append(round(cm[col].sum(), 1))
-    _write_data_row(ws, last_row + 1, sum_vals, bold=True, fmt='#,##0.0')
-
-    # Area chart: total active per term
-    labels = results["term_labels"]
-    active = results["total_active"]
+    ws.append(_data_cells(ws, ["Sum"] + sums.tolist(), bold=True, fmt='#,##0.0'))
+    ws.append([])
 
-    chart_start = last_row + 3
-    ws.cell(row=chart_start, column=1, value="Term").font = _HEADER_FONT
-    ws.cell(row=chart_start, column=2, value="Total Active").font = _HEADER_FONT
-    for i, (lbl, val) in enumerate(zip(labels, active)):
-        ws.cell(row=chart_start + 1 + i, column=1, value=lbl)
-        ws.cell(row=chart_start + 1 + i, column=2, value=round(val, 1))
+    # Area chart data: total active per term
+    ws.append([_cell(ws, "Term", _HEADER_FONT), _cell(ws, "Total Active", _HEADER_FONT)])
+    for lbl, val in zip(labels, active):
+        ws.append([lbl, val])
 
     chart = AreaChart()
     chart.title = "Total Active Students per Term"
@@ -238,9 +272,6 @@ def _build_cohort_matrix(wb: Workbook, inputs: dict, results: dict):
         chart.series[0].graphicalProperties.solidFill = _RED_HEX
     ws.add_chart(chart, f"D{last_row + 3}")
 
-    _auto_width(ws)
-    ws.freeze_panes = "B2"
-
 
 def _build_revenue(wb: Workbook, inputs: dict, results: dict):
     ws = wb.create_sheet("Revenue")
@@ -248,25 +279,23 @@ def _build_revenue(wb: Workbook, inputs: dict, results: dict):
 
     rev = results["revenue_df"]
     headers = list(rev.columns)
-    _write_header_row(ws, 1, headers)
-
-    for r_idx, (_, row) in enumerate(rev.iterrows()):
-        vals = list(row.values)
-        _write_data_row(ws, 2 + r_idx, vals, alt=r_idx % 2 == 1)
-        for ci, col in enumerate(headers):
-            cell = ws.cell(row=2 + r_idx, column=1 + ci)
-            if col in ("Base Revenue", "Revenue", "Tuition/Credit"):
-                cell.number_format = _MONEY_FMT
-            elif col == "Active Students":
-                cell.number_format = '#,##0.0'
-
     last_row = 1 + len(rev)
 
     # Sum row
     sum_vals = ["Total", "", "", "",
-                round(rev["Base Revenue"].sum(), 2),
-                round(rev["Revenue"].sum(), 2)]
-    _write_data_row(ws, last_row + 1, sum_vals, bold=True, fmt=_MONEY_FMT)
+                round(float(rev["Base Revenue"].sum()), 2),
+                round(float(rev["Revenue"].sum()), 2)]
+
+    _apply_widths(ws, [pd.concat([rev[h], pd.Series([h, sum_vals[i]])])
+                       for i, h in enumerate(headers)])
+    ws.freeze_panes = "A2"
+
+    ws.append(_header_cells(ws, headers))
+    fmts = [_MONEY_FMT if col in ("Base Revenue", "Revenue", "Tuition/Credit")
+            else '#,##0.0' if col == "Active Students" else None for col in headers]
+    for r_idx, vals in enumerate(_frame_rows(rev)):
+        ws.append(_data_cells(ws, vals, alt=r_idx % 2 == 1, fmts=fmts))
+    ws.append(_data_cells(ws, sum_vals, bold=True, fmt=_MONEY_FMT))
 
     # Bar chart
     chart = BarChart()
@@ -283,9 +312,6 @@ def _build_revenue(wb: Workbook, inputs: dict, results: dict):
         chart.series[0].graphicalProperties.solidFill = _RED_HEX
     ws.add_chart(chart, f"A{last_row + 3}")
 
-    _auto_width(ws)
-    ws.freeze_panes = "A2"
-
 
 def _build_costs(wb: Workbook, inputs: dict, results: dict):
     ws = wb.create_sheet("Costs")
@@ -293,23 +319,20 @@ def _build_costs(wb: Workbook, inputs: dict, results: dict):
 
     cost = results["cost_df"]
     headers = list(cost.columns)
-    _write_header_row(ws, 1, headers)
-
-    for r_idx, (_, row) in enumerate(cost.iterrows()):
-        vals = list(row.values)
-        _write_data_row(ws, 2 + r_idx, vals, alt=r_idx % 2 == 1)
-        for ci, col in enumerate(headers):
-            cell = ws.cell(row=2 + r_idx, column=1 + ci)
-            if col != "Term":
-                cell.number_format = _MONEY_FMT
-
     last_row = 1 + len(cost)
 
     # Sum row
-    sum_vals = ["Total"]
-    for col in headers[1:]:
-        sum_vals.append(round(cost[col].sum(), 2))
-    _write_data_row(ws, last_row + 1, sum_vals, bold=True, fmt=_MONEY_FMT)
+    sum_vals = ["Total"] + [round(float(cost[col].sum()), 2) for col in headers[1:]]
+
+    _apply_widths(ws, [pd.concat([cost[h], pd.Series([h, sum_vals[i]])])
+                       for i, h in enumerate(headers)])
+    ws.freeze_panes = "A2"
+
+    ws.append(_header_cells(ws, headers))
+    fmts = [None] + [_MONEY_FMT] * (len(headers) - 1)
+    for r_idx, vals in enumerate(_frame_rows(cost)):
+        ws.append(_data_cells(ws, vals, alt=r_idx % 2 == 1, fmts=fmts))
+    ws.append(_data_cells(ws, sum_vals, bold=True, fmt=_MONEY_FMT))
 
     # Stacked bar chart
     cost_cols = ["Faculty", "TA", "Course Dev", "Variable OH", "Fixed OH", "CAC"]
@@ -333,16 +356,11 @@ def _build_costs(wb: Workbook, inputs: dict, results: dict):
         s.graphicalProperties.solidFill = colours[i % len(colours)]
     ws.add_chart(chart, f"A{last_row + 3}")
 
-    _auto_width(ws)
-    ws.freeze_panes = "A2"
-
 
 def _build_assumptions(wb: Workbook, inputs: dict, results: dict):
     ws = wb.create_sheet("Assumptions")
     ws.sheet_properties.tabColor = _GRAY_HEX
 
-    _write_header_row(ws, 1, ["Parameter", "Value"])
-
     sections: list[tuple[str, list[tuple[str, Any, str | None]]]] = [
         ("Program Structure", [
             ("Program Name",        inputs["program_name"], None),
@@ -392,34 +410,33 @@ def _build_assumptions(wb: Workbook, inputs: dict, results: dict):
         ]),
     ]
 
+    _set_col_widths(ws, {"A": 30, "B": 20})
+    ws.freeze_panes = "A2"
+
     row = 2
+    rows = []
     for section_name, params in sections:
-        # Section header
-        ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=2)
-        cell = ws.cell(row=row, column=1, value=section_name)
-        cell.font = _SUB_FONT
-        cell.fill = PatternFill("solid", fgColor=_LGRAY_HEX)
+        # Section header (merged across both columns)
+        ws.merged_cells.add(f"A{row}:B{row}")
+        rows.append([_cell(ws, section_name, _SUB_FONT, PatternFill("solid", fgColor=_LGRAY_HEX))])
         row += 1
 
         for label, value, fmt in params:
-            ws.cell(row=row, column=1, value=label).font = _BODY_FONT
-            vc = ws.cell(row=row, column=2, value=value)
-            vc.font = _BODY_FONT
-            vc.alignment = _ALIGN_RIGHT
-            if fmt:
-                vc.number_format = fmt
+            rows.append([_cell(ws, label), _cell(ws, value, alignment=_ALIGN_RIGHT, fmt=fmt)])
             row += 1
-        row += 1  # blank row between sections
+        rows.append([])  # blank row between sections
+        row += 1
 
-    _set_col_widths(ws, {"A": 30, "B": 20})
-    ws.freeze_panes = "A2"
+    ws.append(_header_cells(ws, ["Parameter", "Value"]))
+    for r in rows:
+        ws.append(r)
 
 
 # ═══════════════════════════ PUBLIC API ════════════════════════════════
 
 def generate_excel(inputs: dict, results: dict) -> bytes:
     """Build the complete workbook and return its bytes."""
-    wb = Workbook()
+    wb = Workbook(write_only=True)
 
     _build_executive_summary(wb, inputs, results)
     _build_cohort_matrix(wb, inputs, results)
@@ -4,7 +4,10 @@ PDF report export for the Program Financial Estimation.
 Generates a leadership-quality, multi-page branded PDF aligned with
 the Stevens CPE Brand Guidelines (Oct 2025).
 
-Uses fpdf2 for PDF layout and kaleido/plotly for chart images.
+Uses fpdf2 for PDF layout and kaleido/plotly for chart images.  All
+figures of a report are built up front and rasterized together by the
+shared chart renderer (see ``chart_renderer``), so page layout only embeds
+finished PNGs.
 """
 
 from __future__ import annotations
@@ -14,7 +17,8 @@ from typing import Any
 
 from fpdf import FPDF
 import plotly.graph_objects as go
-import plotly.io as pio
+
+from components.chart_renderer import get_renderer
 
 # ── Brand colours (RGB tuples) ─────────────────────────────────────────
 _RED   = (163, 38, 56)     # #A32638
@@ -38,8 +42,8 @@ def _fmt(v: float) -> str:
     return f"${v:,.0f}"
 
 
-def _chart_to_png(fig: go.Figure, width: int = 700, height: int = 380) -> bytes:
-    """Render a Plotly figure to PNG bytes."""
+def _style_chart(fig: go.Figure) -> go.Figure:
+    """Apply the print theme shared by every report chart."""
     fig.update_layout(
         paper_bgcolor="white",
         plot_bgcolor="white",
@@ -47,7 +51,7 @@ def _chart_to_png(fig: go.Figure, width: int = 700, height: int = 380) -> bytes:
         font_family="Arial, sans-serif",
         margin=dict(l=50, r=30, t=50, b=50),
     )
-    return pio.to_image(fig, format="png", width=width, height=height, scale=2)
+    return fig
 
 
 def _logo_path() -> str | None:
@@ -179,18 +183,101 @@ class _Report(FPDF):
             if is_last:
                 self.set_font(self._brand_font, "", 9)
 
-    def add_chart_image(self, fig: go.Figure, w: float = 180, h: float = 95):
-        """Render a Plotly figure and embed it."""
-        png_bytes = _chart_to_png(fig, width=int(w * 4), height=int(h * 4))
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            tmp.write(png_bytes)
-            tmp.flush()
-            self.image(tmp.name, x=self.get_x(), y=self.get_y(), w=w)
-            self.ln(h + 5)
-        try:
-            os.unlink(tmp.name)
-        except OSError:
-            pass
+    def add_chart_image(self, png: bytes, w: float = 180, h: float = 95):
+        """Embed a pre-rendered chart PNG."""
+        self.image(io.BytesIO(png), x=self.get_x(), y=self.get_y(), w=w)
+        self.ln(h + 5)
+
+
+# ═══════════════════════════ CHARTS ═══════════════════════════════════
+#
+# Figures are built from the results alone so the whole set can be handed
+# to the renderer in one batch before any page is laid out.
+
+_DEFAULT_CHART_MM = (180, 95)
+_COSTS_CHART_MM = (185, 90)
+
+
+def _fig_revenue_cost(results: dict) -> go.Figure:
+    pl = results["pl_summary"]
+    fy = pl[pl["Fiscal Year"] != "Total"]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=fy["Fiscal Year"], y=fy["Revenue"], name="Revenue",
+                         marker_color=_RED_HEX))
+    fig.add_trace(go.Bar(x=fy["Fiscal Year"], y=fy["Cost"], name="Cost",
+                         marker_color=_DGRAY_HEX))
+    fig.update_layout(barmode="group", title="Revenue vs Cost by Fiscal Year",
+                      legend=dict(orientation="h", y=-0.15))
+    fig.update_yaxes(tickprefix="$", tickformat=",")
+    return fig
+
+
+def _fig_cumulative(results: dict) -> go.Figure:
+    pl = results["pl_summary"]
+    fy = pl[pl["Fiscal Year"] != "Total"]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=fy["Fiscal Year"], y=fy["Cumulative"],
+                             mode="lines+markers", name="Cumulative Net",
+                             line=dict(color=_RED_HEX, width=3)))
+    fig.add_hline(y=0, line_dash="dash", line_color=_GRAY_HEX, annotation_text="Break-Even")
+    fig.update_layout(title="Cumulative Net P&L")
+    fig.update_yaxes(tickprefix="$", tickformat=",")
+    return fig
+
+
+def _fig_margin(results: dict) -> go.Figure:
+    pl = results["pl_summary"]
+    fy = pl[pl["Fiscal Year"] != "Total"]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=fy["Fiscal Year"], y=fy["Net Margin %"],
+                             mode="lines+markers", fill="tozeroy",
+                             line=dict(color=_RED_HEX, width=2),
+                             fillcolor="rgba(163,38,56,0.15)"))
+    fig.update_layout(title="Net Margin % Trend")
+    fig.update_yaxes(ticksuffix="%")
+    return fig
+
+
+def _fig_active(results: dict) -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=results["term_labels"], y=results["total_active"].tolist(),
+                             fill="tozeroy", mode="lines",
+                             line=dict(color=_RED_HEX, width=2),
+                             fillcolor="rgba(163,38,56,0.2)"))
+    fig.update_layout(title="Total Active Students per Term")
+    return fig
+
+
+def _fig_costs(results: dict) -> go.Figure:
+    cost = results["cost_df"]
+    labels = results["term_labels"]
+    cost_cols = ["Faculty", "TA", "Course Dev", "Variable OH", "Fixed OH", "CAC"]
+    colours = [_RED_HEX, _DGRAY_HEX, _GRAY_HEX, "#E4E5E6", "#5A6577", "#2E7D32"]
+    fig = go.Figure()
+    for i, col in enumerate(cost_cols):
+        fig.add_trace(go.Bar(x=labels, y=cost[col], name=col,
+                             marker_color=colours[i]))
+    fig.update_layout(barmode="stack", title="Cost Components by Term",
+                      legend=dict(orientation="h", y=-0.2))
+    fig.update_yaxes(tickprefix="$", tickformat=",")
+    return fig
+
+
+_CHARTS = {
+    "revenue_cost": (_fig_revenue_cost, _DEFAULT_CHART_MM),
+    "cumulative":   (_fig_cumulative,   _DEFAULT_CHART_MM),
+    "margin":       (_fig_margin,       _DEFAULT_CHART_MM),
+    "active":       (_fig_active,       _DEFAULT_CHART_MM),
+    "costs":        (_fig_costs,        _COSTS_CHART_MM),
+}
+
+
+def _render_charts(results: dict) -> dict[str, bytes]:
+    """Build every report figure and rasterize them in one concurrent batch."""
+    jobs = []
+    for build, (w, h) in _CHARTS.values():
+        jobs.append((_style_chart(build(results)), int(w * 4), int(h * 4)))
+    return dict(zip(_CHARTS, get_renderer().render_many(jobs)))
 
 
 # ═══════════════════════════ PAGE BUILDERS ════════════════════════════
@@ -285,7 +372,7 @@ def _page_executive_summary(pdf: _Report, inputs: dict, results: dict):
     pdf.body_text(narrative)
 
 
-def _page_pl_summary(pdf: _Report, inputs: dict, results: dict):
+def _page_pl_summary(pdf: _Report, inputs: dict, results: dict, charts: dict[str, bytes]):
     pdf.add_page()
     pdf.section_title("Profit & Loss Summary")
 
@@ -306,47 +393,21 @@ def _page_pl_summary(pdf: _Report, inputs: dict, results: dict):
     pdf.ln(6)
 
     # Revenue vs Cost chart
-    fy = pl[pl["Fiscal Year"] != "Total"]
-    fig = go.Figure()
-    fig.add_trace(go.Bar(x=fy["Fiscal Year"], y=fy["Revenue"], name="Revenue",
-                         marker_color=_RED_HEX))
-    fig.add_trace(go.Bar(x=fy["Fiscal Year"], y=fy["Cost"], name="Cost",
-                         marker_color=_DGRAY_HEX))
-    fig.update_layout(barmode="group", title="Revenue vs Cost by Fiscal Year",
-                      legend=dict(orientation="h", y=-0.15))
-    fig.update_yaxes(tickprefix="$", tickformat=",")
-    pdf.add_chart_image(fig)
+    pdf.add_chart_image(charts["revenue_cost"], *_DEFAULT_CHART_MM)
 
 
-def _page_trajectory(pdf: _Report, inputs: dict, results: dict):
+def _page_trajectory(pdf: _Report, inputs: dict, results: dict, charts: dict[str, bytes]):
     pdf.add_page()
     pdf.section_title("Financial Trajectory")
 
-    pl = results["pl_summary"]
-    fy = pl[pl["Fiscal Year"] != "Total"]
-
     # Cumulative chart
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=fy["Fiscal Year"], y=fy["Cumulative"],
-                             mode="lines+markers", name="Cumulative Net",
-                             line=dict(color=_RED_HEX, width=3)))
-    fig.add_hline(y=0, line_dash="dash", line_color=_GRAY_HEX, annotation_text="Break-Even")
-    fig.update_layout(title="Cumulative Net P&L")
-    fig.update_yaxes(tickprefix="$", tickformat=",")
-    pdf.add_chart_image(fig)
+    pdf.add_chart_image(charts["cumulative"], *_DEFAULT_CHART_MM)
 
     # Net Margin chart
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=fy["Fiscal Year"], y=fy["Net Margin %"],
-                             mode="lines+markers", fill="tozeroy",
-                             line=dict(color=_RED_HEX, width=2),
-                             fillcolor="rgba(163,38,56,0.15)"))
-    fig.update_layout(title="Net Margin % Trend")
-    fig.update_yaxes(ticksuffix="%")
-    pdf.add_chart_image(fig)
+    pdf.add_chart_image(charts["margin"], *_DEFAULT_CHART_MM)
 
 
-def _page_cohort(pdf: _Report, inputs: dict, results: dict):
+def _page_cohort(pdf: _Report, inputs: dict, results: dict, charts: dict[str, bytes]):
     pdf.add_page()
     pdf.section_title("Cohort Enrollment")
 
@@ -367,21 +428,14 @@ def _page_cohort(pdf: _Report, inputs: dict, results: dict):
     pdf.ln(4)
 
     # Area chart
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=labels, y=active.tolist(),
-                             fill="tozeroy", mode="lines",
-                             line=dict(color=_RED_HEX, width=2),
-                             fillcolor="rgba(163,38,56,0.2)"))
-    fig.update_layout(title="Total Active Students per Term")
-    pdf.add_chart_image(fig)
+    pdf.add_chart_image(charts["active"], *_DEFAULT_CHART_MM)
 
 
-def _page_costs(pdf: _Report, inputs: dict, results: dict):
+def _page_costs(pdf: _Report, inputs: dict, results: dict, charts: dict[str, bytes]):
     pdf.add_page()
     pdf.section_title("Cost Breakdown")
 
     cost = results["cost_df"]
-    labels = results["term_labels"]
 
     # Summary table (condensed)
     headers = ["Term", "Faculty", "TA", "Dev", "OH", "CAC", "Total"]
@@ -401,21 +455,11 @@ def _page_costs(pdf: _Report, inputs: dict, results: dict):
     pdf.ln(4)
 
     # Stacked bar chart
-    cost_cols = ["Faculty", "TA", "Course Dev", "Variable OH", "Fixed OH", "CAC"]
-    colours = [_RED_HEX, _DGRAY_HEX, _GRAY_HEX, "#E4E5E6", "#5A6577", "#2E7D32"]
-    fig = go.Figure()
-    for i, col in enumerate(cost_cols):
-        fig.add_trace(go.Bar(x=labels, y=cost[col], name=col,
-                             marker_color=colours[i]))
-    fig.update_layout(barmode="stack", title="Cost Components by Term",
-                      legend=dict(orientation="h", y=-0.2))
-    fig.update_yaxes(tickprefix="$", tickformat=",")
-
     if pdf.get_y() + 100 > pdf.h - 20:
         pdf.add_page()
         pdf.section_title("Cost Breakdown (cont.)")
 
-    pdf.add_chart_image(fig, w=185, h=90)
+    pdf.add_chart_image(charts["costs"], *_COSTS_CHART_MM)
 
 
 def _page_assumptions(pdf: _Report, inputs: dict, results: dict):
@@ -487,15 +531,17 @@ def _page_assumptions(pdf: _Report, inputs: dict, results: dict):
 
 def generate_pdf(inputs: dict, results: dict) -> bytes:
     """Build the full branded PDF report and return its bytes."""
+    charts = _render_charts(results)
+
     pdf = _Report()
     pdf.alias_nb_pages()
 
     _page_cover(pdf, inputs, results)
     _page_executive_summary(pdf, inputs, results)
-    _page_pl_summary(pdf, inputs, results)
-    _page_trajectory(pdf, inputs, results)
-    _page_cohort(pdf, inputs, results)
-    _page_costs(pdf, inputs, results)
+    _page_pl_summary(pdf, inputs, results, charts)
+    _page_trajectory(pdf, inputs, results, charts)
+    _page_cohort(pdf, inputs, results, charts)
+    _page_costs(pdf, inputs, results, charts)
     _page_assumptions(pdf, inputs, results)
 
     buf = io.BytesIO()
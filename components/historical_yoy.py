@@ -6,7 +6,7 @@ Displays historical trends and year-over-year comparisons.
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
-from utils.formatting import format_number, format_percent
+from utils.formatting import format_currency, format_number, format_percent
 from utils.constants import (
     STEVENS_RED, STEVENS_GRAY_DARK, STEVENS_GRAY_LIGHT, STEVENS_WHITE,
     CHART_SUCCESS
@@ -162,11 +162,150 @@ def render_yoy_table(summary_stats: dict):
         for col in ['Applications', 'Admits', 'Enrollments']:
             df[col] = df[col].astype(str)
         
-        df = pd.concat([df, pd.DataFrame([change_row])], ignore_index=True)
+        rows = [change_row]
+        
+        to_date = (summary_stats.get('yoy_to_date') or {}).get('2026_vs_2025')
+        if to_date is not None:
+            rows.append({
+                'Year': f"YoY Change (to {to_date.as_of:%b %d})",
+                'Applications': calc_change(to_date.current.applications, to_date.previous.applications),
+                'Admits': '—',  # no decision dates; compared on cycle totals above
+                'Enrollments': calc_change(to_date.current.enrollments, to_date.previous.enrollments),
+                'Admit Rate': '—',
+                'Yield Rate': '—'
+            })
+        
+        df = pd.concat([df, pd.DataFrame(rows)], ignore_index=True)
     
     st.dataframe(df, width="stretch", hide_index=True)
 
 
+# pace.DATED_METRICS only: admits and offers have no decision date to pace by
+PACE_METRIC_LABELS = {
+    'applications': 'Applications',
+    'enrollments': 'Enrollments',
+}
+PACE_DIMENSIONS = {
+    'Overall': None,
+    'Category': 'Application Category',
+    'School': 'School (Expanded)',
+    'Degree Type': 'Degree Type',
+}
+PACE_YEAR_COLORS = {2024: STEVENS_GRAY_LIGHT, 2025: STEVENS_GRAY_DARK, 2026: STEVENS_RED}
+
+
+def render_pace_view(pace):
+    """Cumulative pace per cycle on a shared calendar, with same-date totals."""
+    if pace is None:
+        st.info("Pace data not available (no Submitted dates)")
+        return
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        metric = st.selectbox("Metric", list(PACE_METRIC_LABELS),
+                              format_func=PACE_METRIC_LABELS.get, key="pace_metric")
+    with col2:
+        dimension = st.selectbox("Breakdown", list(PACE_DIMENSIONS), key="pace_dimension")
+    field = PACE_DIMENSIONS[dimension]
+    value = None
+    with col3:
+        if field:
+            options = [v for v in pace.values(field) if v]
+            options.sort(key=lambda v: -pace.metrics(pace.current_year, None, field, v).applications)
+            value = st.selectbox(dimension, options, key="pace_value")
+    
+    label = PACE_METRIC_LABELS[metric]
+    as_of = pace.as_of
+    
+    fig = go.Figure()
+    for year in pace.years:
+        curve = pace.curve(year, metric, field, value)
+        fig.add_trace(go.Scatter(
+            x=curve.index,
+            y=curve.to_numpy(),
+            mode='lines',
+            name=str(year),
+            line=dict(color=PACE_YEAR_COLORS.get(year, CHART_SUCCESS), width=3 if year == pace.current_year else 2)
+        ))
+    fig.add_vline(x=pd.Timestamp(as_of).timestamp() * 1000, line_dash="dash", line_color=STEVENS_WHITE,
+                  annotation_text=f"As of {as_of:%b %d}", annotation_font_color=STEVENS_WHITE)
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font={'color': STEVENS_WHITE},
+        height=380,
+        margin=dict(l=40, r=20, t=40, b=40),
+        xaxis=dict(gridcolor='#333', tickformat='%b %d', title='Date in the current cycle (earlier cycles shifted 52 weeks per year)'),
+        yaxis=dict(gridcolor='#333', title=f"Cumulative {label}"),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5)
+    )
+    st.plotly_chart(fig, width="stretch")
+    
+    rows = []
+    previous = None
+    for year in pace.years:
+        count = getattr(pace.metrics(year, as_of, field, value), metric)
+        change = (f"{(count - previous) / previous * 100:+.1f}%" if previous else "—")
+        rows.append({'Cycle': str(year), f"{label} as of {as_of:%b %d}": format_number(count), 'vs Prior Cycle': change})
+        previous = count
+    st.dataframe(pd.DataFrame(rows), width="stretch", hide_index=True)
+
+
+FORECAST_LABELS = {'apps': 'Applications', 'admits': 'Admits', 'enrolls': 'Enrollments', 'ntr': 'NTR'}
+
+
+def _forecast_rows(ranges: dict, current_label: str) -> list:
+    rows = []
+    for key, label in FORECAST_LABELS.items():
+        r = ranges[key]
+        fmt = format_currency if key == 'ntr' else format_number
+        rows.append({
+            'Metric': label,
+            current_label: fmt(r['current']),
+            'Low': fmt(r['low']),
+            'Mid': fmt(r['mid']),
+            'High': fmt(r['high']),
+            'Prior Cycle': fmt(r['previousYear']),
+            'YoY (Mid)': f"{r['yoyChange']:+.1f}%",
+        })
+    return rows
+
+
+def render_forecast(data: dict):
+    """Low/mid/high forecast for the current cycle (forecasting.py)."""
+    from forecasting import generate_forecast
+    
+    forecast = generate_forecast(data.get('applications', {}), data.get('pace'))
+    if not forecast:
+        st.info("Forecast not available (no current-cycle Submitted dates)")
+        return
+    
+    params = forecast['params']
+    cutoff = pd.Timestamp(forecast['cutoffDate'])
+    st.dataframe(pd.DataFrame(_forecast_rows(forecast['metrics'], f"As of {cutoff:%b %d}")),
+                 width="stretch", hide_index=True)
+    st.caption(
+        f"Partial-to-final ratio {params['partialRatio']:.0%}, run rate {params['weeklyRunRate']:.1f} apps/week "
+        f"with {params['weeksRemaining']:.1f} weeks to the deadline; growth x{params['growthMultiplierLow']:.2f}"
+        f"-x{params['growthMultiplierHigh']:.2f}, yield {params['avgHistoricalYield']:.0%}. "
+        f"NTR assumes {forecast['avgCredits']} credits at {format_currency(forecast['avgCPC'])} per credit."
+    )
+    
+    with st.expander("Forecast by category"):
+        rows = [
+            {
+                'Category': f"{c['category']} ({c['degreeType']})",
+                'Apps (Mid)': format_number(c['apps']['mid']),
+                'Enrollments': f"{format_number(c['enrolls']['low'])} – {format_number(c['enrolls']['high'])}",
+                'NTR (Mid)': format_currency(c['ntr']['mid']),
+                'Yield': format_percent(c['historicalYield'] * 100),
+                'Apps YoY': f"{c['apps']['yoyChange']:+.1f}%",
+            }
+            for c in forecast['byCategory']
+        ]
+        st.dataframe(pd.DataFrame(rows), width="stretch", hide_index=True)
+
+
 def render_category_yoy(summary_stats: dict):
     """Render YoY comparison by category."""
     categories = summary_stats.get('by_category', {})
@@ -423,7 +562,8 @@ def render(data: dict):
         apps_data.get('current'),
         apps_data.get('previous'),
         apps_data.get('two_years_ago'),
-        census_summary
+        census_summary,
+        pace=data.get('pace'),
     )
     
     # Multi-metric trend chart
@@ -443,6 +583,16 @@ def render(data: dict):
     
     st.markdown("---")
     
+    st.markdown("### Same-Date Pace")
+    render_pace_view(data.get('pace'))
+    
+    st.markdown("---")
+    
+    st.markdown("### 2026 Forecast")
+    render_forecast(data)
+    
+    st.markdown("---")
+    
     col1, col2 = st.columns(2)
     
     with col1:
@@ -0,0 +1,60 @@
+"""
+Ask Navs floating widget - closed state.
+
+Rendered on every page, so it imports nothing beyond Streamlit: the bubble
+needs no data or AI code.  The chat panel (components.ai_assistant, with
+the LLM client, planner and context builders) is imported only once the
+user opens it.
+"""
+
+import base64
+from pathlib import Path
+
+import streamlit as st
+
+
+@st.cache_resource(show_spinner=False)
+def get_avatar_base64() -> str:
+    """Avatar image as base64 for inline display (read and encoded once per process)."""
+    dashboard_root = Path(__file__).parent.parent.resolve()
+    possible_paths = [
+        dashboard_root / "naveen-headshot.png",
+        dashboard_root / ".streamlit" / "static" / "naveen-headshot.png",
+    ]
+    for img_path in possible_paths:
+        if img_path.exists():
+            try:
+                return base64.b64encode(img_path.read_bytes()).decode()
+            except Exception:
+                continue
+    return ""
+
+
+def render_floating_widget(data: dict, page_hint: str = ""):
+    """Floating Ask Navs widget shown on every page."""
+    if "navs_widget_open" not in st.session_state:
+        st.session_state.navs_widget_open = False
+
+    api_key = st.secrets.get("gemini_api_key", "")
+    if not api_key:
+        return
+
+    # Always minimize by default when landing on a new page/tab
+    last_page = st.session_state.get("navs_widget_last_page")
+    if last_page != page_hint:
+        st.session_state.navs_widget_open = False
+        st.session_state.navs_widget_last_page = page_hint
+
+    # Widget container (positioned via CSS from app.py)
+    widget = st.container()
+    with widget:
+        if not st.session_state.navs_widget_open:
+            st.markdown('<div class="navs-bubble-marker"></div>', unsafe_allow_html=True)
+            if st.button("💬", key="navs_toggle", help="Ask Navs"):
+                st.session_state.navs_widget_open = True
+                st.rerun()
+            return
+
+        from components.ai_assistant import render_widget_panel
+
+        render_widget_panel(data, page_hint, api_key)
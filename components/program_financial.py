@@ -19,12 +19,17 @@ from components.financial_engine import (
     generate_term_labels,
     program_duration_terms,
     generate_default_graduation_curve,
+    goal_seek,
+    scenario_key,
+    compact_results,
+    expand_pl_summary,
+    SOLVABLE_INPUTS,
 )
 from utils.constants import (
     STEVENS_RED, STEVENS_GRAY_DARK, STEVENS_GRAY_LIGHT, STEVENS_WHITE,
     BACKGROUND_CARD, CHART_COLORS,
 )
-from utils.formatting import format_currency
+from utils.formatting import format_currency, safe_filename
 
 # Brand colours for charts
 _RED   = "#A32638"
@@ -50,7 +55,7 @@ def _ss():
     if _SS_KEY not in st.session_state:
         st.session_state[_SS_KEY] = {
             "inputs": get_default_inputs(),
-            "scenarios": [],      # list of {name, inputs, results}
+            "scenarios": [],      # list of {name, key, inputs, summary}
         }
     return st.session_state[_SS_KEY]
 
@@ -59,6 +64,26 @@ def _inputs() -> dict:
     return _ss()["inputs"]
 
 
+# ────────────────────────── memoised evaluation ───────────────────────
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _compute_scenario_cached(key: str, _inputs: dict) -> dict:
+    """compute_scenario memoised by canonical input hash; shared across sessions."""
+    return compute_scenario(_inputs)
+
+
+def _evaluate(inputs: dict) -> dict:
+    """Full results for ``inputs``, recomputed only when the inputs change."""
+    return _compute_scenario_cached(scenario_key(inputs), inputs)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _excel_bytes_cached(key: str, _inputs: dict, _results: dict) -> bytes:
+    """Finished workbook for a scenario; reruns with unchanged inputs reuse it."""
+    from components.financial_export_excel import generate_excel
+    return generate_excel(_inputs, _results)
+
+
 # ────────────────────────── formatting helpers ────────────────────────
 
 def _fmt_cur(v: float) -> str:
@@ -207,11 +232,12 @@ def _render_inputs() -> dict:
 # ═══════════════════════════ RESULTS SECTION ══════════════════════════
 
 def _render_results(inputs: dict, results: dict):
-    tab_exec, tab_cohort, tab_detail, tab_compare = st.tabs([
+    tab_exec, tab_cohort, tab_detail, tab_compare, tab_goal = st.tabs([
         "Executive Summary",
         "Cohort Details",
         "Revenue & Cost Breakdown",
         "Scenario Comparison",
+        "Goal Seek",
     ])
 
     with tab_exec:
@@ -222,6 +248,8 @@ def _render_results(inputs: dict, results: dict):
         _render_revenue_cost_detail(inputs, results)
     with tab_compare:
         _render_scenario_comparison()
+    with tab_goal:
+        _render_goal_seek(inputs)
 
 
 # ── Executive Summary ─────────────────────────────────────────────────
@@ -380,7 +408,7 @@ def _render_scenario_comparison():
     for i, sc in enumerate(chosen):
         with cols[i]:
             st.markdown(f"**{sc['name']}**")
-            pl = sc["results"]["pl_summary"].copy()
+            pl = expand_pl_summary(sc["summary"])
             for col in ["Revenue", "Cost", "Net", "Cumulative"]:
                 pl[col] = pl[col].apply(_fmt_cur)
             pl["Net Margin %"] = pl["Net Margin %"].apply(lambda v: f"{v:.1f}%")
@@ -390,7 +418,7 @@ def _render_scenario_comparison():
     fig = go.Figure()
     line_styles = ["solid", "dash", "dot"]
     for i, sc in enumerate(chosen):
-        fy = sc["results"]["pl_summary"]
+        fy = expand_pl_summary(sc["summary"])
         fy = fy[fy["Fiscal Year"] != "Total"]
         fig.add_trace(go.Scatter(
             x=fy["Fiscal Year"], y=fy["Cumulative"],
@@ -403,6 +431,99 @@ def _render_scenario_comparison():
     st.plotly_chart(fig, use_container_width=True)
 
 
+# ── Goal Seek ────────────────────────────────────────────────────────
+
+# Display labels for the solvable inputs; percentage inputs are stored as
+# fractions and shown ×100.
+_GOAL_SEEK_LABELS = {
+    "initial_intake":                ("Initial Fall-1 Intake (students)", False),
+    "tuition_per_credit":            ("Tuition per Credit ($)", False),
+    "fall_growth_rate":              ("Fall Growth %", True),
+    "spring_growth_rate":            ("Spring Growth %", True),
+    "summer_growth_rate":            ("Summer Growth %", True),
+    "early_retention_rate":          ("Early Retention %", True),
+    "late_retention_rate":           ("Late Retention %", True),
+    "tuition_inflation_pct":         ("Tuition Inflation % / year", True),
+    "dev_cost_per_course":           ("Dev Cost per Course ($)", False),
+    "faculty_cost_per_section":      ("Faculty $ per Section/Term", False),
+    "variable_overhead_per_student": ("Variable OH per Student ($)", False),
+    "fixed_overhead_per_term":       ("Fixed OH per Term ($)", False),
+    "cac_per_student":               ("CAC per New Student ($)", False),
+    "cost_inflation_pct":            ("Cost Inflation % / year", True),
+}
+
+_GOAL_SEEK_METRIC_LABELS = {
+    "break_even_year": "Break even by fiscal year",
+    "total_net":       "Total net P&L ($)",
+    "total_margin":    "Total net margin (%)",
+}
+
+
+def _fmt_goal_value(field: str, value) -> str:
+    label, is_pct = _GOAL_SEEK_LABELS[field]
+    if is_pct:
+        return f"{value * 100:.1f}%"
+    if "$" in label:
+        return _fmt_cur(value)
+    return f"{value:,}"
+
+
+def _render_goal_seek(inputs: dict):
+    st.caption("Solve for the one input that hits a target, holding every other input fixed.")
+    fields = [f for f in _GOAL_SEEK_LABELS if f in SOLVABLE_INPUTS]
+    if not inputs.get("include_summer", True):
+        fields.remove("summer_growth_rate")
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        field = st.selectbox("Solve For", fields,
+                             format_func=lambda f: _GOAL_SEEK_LABELS[f][0],
+                             key="goal_seek_field")
+    with c2:
+        metric = st.selectbox("Target Metric", list(_GOAL_SEEK_METRIC_LABELS),
+                              format_func=_GOAL_SEEK_METRIC_LABELS.get,
+                              key="goal_seek_metric")
+    with c3:
+        start = int(inputs.get("start_fy", 2026))
+        if metric == "break_even_year":
+            last = start + int(inputs["projection_years"]) - 1
+            target = st.selectbox("Target", [f"FY{y}" for y in range(start, last + 1)],
+                                  index=min(2, last - start), key="goal_seek_target_fy")
+        elif metric == "total_net":
+            target = st.number_input("Target ($)", value=0, step=50_000, key="goal_seek_target_net")
+        else:
+            target = st.number_input("Target (%)", value=10.0, step=1.0, key="goal_seek_target_margin")
+
+    if st.button("Solve", type="primary", key="goal_seek_solve"):
+        _ss()["goal_seek"] = goal_seek(inputs, field, metric, target)
+
+    res = _ss().get("goal_seek")
+    if not res or (res["field"], res["metric"], res["target"]) != (field, metric, target):
+        return
+
+    label = _GOAL_SEEK_LABELS[field][0]
+    if not res["satisfied"]:
+        lo, hi, _ = SOLVABLE_INPUTS[field]
+        best = res["metric_value"]
+        if metric == "total_net":
+            best = _fmt_cur(best)
+        elif metric == "total_margin":
+            best = f"{best:.1f}%"
+        st.warning(
+            f"No value of **{label}** between {_fmt_goal_value(field, lo)} and "
+            f"{_fmt_goal_value(field, hi)} reaches the target (best: {best or 'no break-even'})."
+        )
+        return
+
+    note = " (the target is already met across the whole range)" if res["at_bound"] else ""
+    st.success(f"**{label}** = **{_fmt_goal_value(field, res['value'])}**{note}")
+    st.caption(f"Solved in {res['batches']} batched evaluations ({res['evaluations']} candidate points).")
+    if st.button("Apply to Inputs", key="goal_seek_apply"):
+        _inputs()[field] = res["value"]
+        _ss().pop("goal_seek", None)
+        st.rerun()
+
+
 # ═══════════════════════════ SCENARIO CONTROLS ════════════════════════
 
 def _render_scenario_controls(inputs: dict, results: dict):
@@ -416,10 +537,13 @@ def _render_scenario_controls(inputs: dict, results: dict):
         st.markdown("")
         st.markdown("")
         if st.button("Save Scenario", use_container_width=True, type="primary"):
+            # Inputs + fiscal-year arrays only; full tables are rehydrated
+            # through the shared cache when needed.
             _ss()["scenarios"].append({
                 "name": name,
+                "key": scenario_key(inputs),
                 "inputs": copy.deepcopy(inputs),
-                "results": results,
+                "summary": compact_results(results),
             })
             st.success(f"Saved '{name}'")
     with c3:
@@ -431,41 +555,74 @@ def _render_scenario_controls(inputs: dict, results: dict):
 
     if _ss()["scenarios"]:
         st.caption(f"Saved scenarios: {', '.join(s['name'] for s in _ss()['scenarios'])}")
+        names = [s["name"] for s in _ss()["scenarios"]]
+        c1, c2, _ = st.columns([2, 1, 1])
+        with c1:
+            idx = st.selectbox("Load Saved Scenario", range(len(names)),
+                               format_func=names.__getitem__,
+                               key="scenario_load_select")
+        with c2:
+            st.markdown("")
+            st.markdown("")
+            if st.button("Load Scenario", use_container_width=True):
+                # Full tables are rebuilt from the saved inputs on the next run
+                # (usually a cache hit).
+                _ss()["inputs"] = copy.deepcopy(_ss()["scenarios"][idx]["inputs"])
+                st.session_state.pop("grad_curve_editor", None)
+                st.rerun()
 
 
 # ═══════════════════════════ EXPORT BUTTONS ═══════════════════════════
 
+# Generation errors by (format, scenario key).  Deferred download data runs
+# on a worker thread where Streamlit calls are ignored, so a failure (e.g.
+# kaleido cannot find Chrome) is recorded here and shown on the next rerun.
+_EXPORT_ERRORS: dict = {}
+
+
+def _pdf_bytes(inputs: dict, results: dict) -> bytes:
+    from components.financial_export_pdf import generate_pdf
+    return generate_pdf(inputs, results)
+
+
+def _guarded(fmt: str, key: str, build):
+    def data() -> bytes:
+        try:
+            return build()
+        except Exception as e:
+            print(f"[EXPORT] {fmt} generation failed: {e}")
+            _EXPORT_ERRORS[(fmt, key)] = str(e)
+            raise
+    return data
+
+
+def _export_button(label: str, fmt: str, key: str, build, file_name: str, mime: str):
+    error = _EXPORT_ERRORS.pop((fmt, key), None)
+    if error is not None:
+        # Disabled for this rerun only; the next one offers a retry
+        st.button(label, disabled=True, use_container_width=True,
+                  help=f"{fmt} generation error: {error}")
+        st.error(f"{fmt} generation failed: {error}")
+        return
+    st.download_button(label, data=_guarded(fmt, key, build), file_name=file_name,
+                       mime=mime, use_container_width=True)
+
+
 def _render_export_buttons(inputs: dict, results: dict):
+    # Files (and the fpdf/kaleido/openpyxl imports) are produced only when a button is clicked
+    stem = safe_filename(inputs['program_name'], 'Program')
+    key = scenario_key(inputs)
     c1, c2, _ = st.columns([1, 1, 2])
     with c1:
-        try:
-            from components.financial_export_pdf import generate_pdf
-            pdf_bytes = generate_pdf(inputs, results)
-            st.download_button(
-                "Download PDF Report",
-                data=pdf_bytes,
-                file_name=f"{inputs['program_name'].replace(' ','_')}_Financial_Report.pdf",
-                mime="application/pdf",
-                use_container_width=True,
-            )
-        except Exception as e:
-            st.button("Download PDF Report", disabled=True, use_container_width=True,
-                      help=f"PDF generation error: {e}")
+        _export_button("Download PDF Report", "PDF", key,
+                       lambda: _pdf_bytes(inputs, results),
+                       f"{stem}_Financial_Report.pdf", "application/pdf")
 
     with c2:
-        try:
-            from components.financial_export_excel import generate_excel
-            xl_bytes = generate_excel(inputs, results)
-            st.download_button(
-                "Download Excel Workbook",
-                data=xl_bytes,
-                file_name=f"{inputs['program_name'].replace(' ','_')}_Financial_Model.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                use_container_width=True,
-            )
-        except Exception as e:
-            st.button("Download Excel Workbook", disabled=True, use_container_width=True,
-                      help=f"Excel generation error: {e}")
+        _export_button("Download Excel Workbook", "Excel", key,
+                       lambda: _excel_bytes_cached(key, inputs, results),
+                       f"{stem}_Financial_Model.xlsx",
+                       "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 
 
 # ═══════════════════════════ MAIN RENDER ══════════════════════════════
@@ -478,8 +635,8 @@ def render(data: dict):
     # Inputs
     inputs = _render_inputs()
 
-    # Compute
-    results = compute_scenario(inputs)
+    # Compute (memoised on the canonical input hash)
+    results = _evaluate(inputs)
 
     # Export buttons
     _render_export_buttons(inputs, results)
@@ -9,6 +9,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 import numpy as np
+from graduation import BUCKET_LABELS as GRADUATION_BUCKETS, GRADUATING, category_rollup, compute_graduation
 from utils.formatting import format_number, format_percent
 from utils.constants import (
     STEVENS_RED, STEVENS_GRAY_DARK, STEVENS_GRAY_LIGHT, STEVENS_WHITE,
@@ -26,14 +27,8 @@ def render_kpi_cards(df: pd.DataFrame):
     avg_gpa = valid_gpa.mean() if len(valid_gpa) > 0 else 0
     
     # Graduating this term calculation
-    credits_remaining_col = 'Census_1_CREDITS_REMAINING_FROM_PROGRAM_REQUIREMENTS'
-    credits_this_term_col = 'Census_1_CENSUS3_TOTAL_NUMBER_OF_CREDIT_HOURS'
-    graduating_count = 0
-    if credits_remaining_col in df.columns and credits_this_term_col in df.columns:
-        df_grad = df.copy()
-        df_grad[credits_remaining_col] = pd.to_numeric(df_grad[credits_remaining_col], errors='coerce').fillna(999)
-        df_grad[credits_this_term_col] = pd.to_numeric(df_grad[credits_this_term_col], errors='coerce').fillna(0)
-        graduating_count = len(df_grad[df_grad[credits_remaining_col] - df_grad[credits_this_term_col] <= 0])
+    rollup = compute_graduation(df)
+    graduating_count = rollup.counts[GRADUATING] if rollup else 0
     
     # New vs Continuing
     status_col = 'Census_1_STUDENT_STATUS'
@@ -435,38 +430,25 @@ def render_graduation_tracking(df: pd.DataFrame):
     """Render graduation tracking section."""
     st.markdown("### Graduation Tracking")
     
-    credits_remaining_col = 'Census_1_CREDITS_REMAINING_FROM_PROGRAM_REQUIREMENTS'
-    credits_this_term_col = 'Census_1_CENSUS3_TOTAL_NUMBER_OF_CREDIT_HOURS'
     credits_completed_col = 'Census_1_UNITS_COMPLETED_FROM_PROGRAM_REQUIREMENTS'
     credits_required_col = 'Census_1_UNITS_REQUIRED_FROM_PROGRAM_REQUIREMENTS'
     
-    required_cols = [credits_remaining_col, credits_this_term_col]
-    if not all(col in df.columns for col in required_cols):
+    # Buckets and category counts from the shared engine (same numbers as the React dashboard)
+    rollup = compute_graduation(df)
+    if rollup is None:
         st.info("Graduation tracking data not available. Required columns: CREDITS_REMAINING, CREDITS_THIS_TERM")
         return
+    credits_remaining_col = rollup.remaining_col
+    credits_this_term_col = rollup.this_term_col
     
-    # Prepare data
-    grad_df = df.copy()
-    grad_df[credits_remaining_col] = pd.to_numeric(grad_df[credits_remaining_col], errors='coerce').fillna(999)
-    grad_df[credits_this_term_col] = pd.to_numeric(grad_df[credits_this_term_col], errors='coerce').fillna(0)
-    
+    grad_df = rollup.students
     if credits_completed_col in grad_df.columns:
         grad_df[credits_completed_col] = pd.to_numeric(grad_df[credits_completed_col], errors='coerce').fillna(0)
     if credits_required_col in grad_df.columns:
         grad_df[credits_required_col] = pd.to_numeric(grad_df[credits_required_col], errors='coerce').fillna(0)
     
-    # Calculate credits after this term
-    grad_df['Credits_After_Term'] = grad_df[credits_remaining_col] - grad_df[credits_this_term_col]
-    
-    # Students graduating this term (remaining - this_term <= 0)
-    graduating = grad_df[grad_df['Credits_After_Term'] <= 0]
-    
-    # Progress categories
-    grad_df['Progress_Category'] = pd.cut(
-        grad_df[credits_remaining_col],
-        bins=[-float('inf'), 0, 10, 20, 30, float('inf')],
-        labels=['Complete', '1-10 remaining', '11-20 remaining', '21-30 remaining', '30+ remaining']
-    )
+    graduating = rollup.graduating
+    counts = rollup.counts
     
     col1, col2 = st.columns(2)
     
@@ -481,23 +463,25 @@ def render_graduation_tracking(df: pd.DataFrame):
                 </div>
                 <div style="display: flex; justify-content: space-between; margin-bottom: 8px;">
                     <span style="color: {STEVENS_GRAY_LIGHT};">Within 10 Credits:</span>
-                    <span style="color: #FFA500; font-weight: 600;">{len(grad_df[(grad_df[credits_remaining_col] > 0) & (grad_df[credits_remaining_col] <= 10)]):,}</span>
+                    <span style="color: #FFA500; font-weight: 600;">{counts[GRADUATION_BUCKETS[1]]:,}</span>
+                </div>
+                <div style="display: flex; justify-content: space-between; margin-bottom: 8px;">
+                    <span style="color: {STEVENS_GRAY_LIGHT};">11-20 Credits Remaining:</span>
+                    <span style="color: #17a2b8; font-weight: 600;">{counts[GRADUATION_BUCKETS[2]]:,}</span>
                 </div>
                 <div style="display: flex; justify-content: space-between;">
-                    <span style="color: {STEVENS_GRAY_LIGHT};">30+ Credits Remaining:</span>
-                    <span style="color: {STEVENS_GRAY_LIGHT};">{len(grad_df[grad_df[credits_remaining_col] > 30]):,}</span>
+                    <span style="color: {STEVENS_GRAY_LIGHT};">20+ Credits Remaining:</span>
+                    <span style="color: {STEVENS_GRAY_LIGHT};">{counts[GRADUATION_BUCKETS[3]]:,}</span>
                 </div>
             </div>
         """, unsafe_allow_html=True)
         
-        # Progress distribution pie
-        progress_counts = grad_df['Progress_Category'].value_counts()
-        
+        # Progress distribution pie (credits remaining after this term)
         fig = go.Figure(data=[go.Pie(
-            labels=progress_counts.index.tolist(),
-            values=progress_counts.values.tolist(),
+            labels=list(counts.keys()),
+            values=list(counts.values()),
             hole=0.4,
-            marker_colors=[CHART_SUCCESS, '#FFA500', '#17a2b8', STEVENS_GRAY_DARK, STEVENS_RED],
+            marker_colors=[CHART_SUCCESS, '#FFA500', '#17a2b8', STEVENS_GRAY_DARK],
             textinfo='label+percent',
             textposition='outside',
             textfont=dict(size=10, color=STEVENS_WHITE)
@@ -530,6 +514,18 @@ def render_graduation_tracking(df: pd.DataFrame):
         else:
             st.info("No students identified as graduating this term")
     
+    # Per-category rollup
+    by_category = category_rollup(rollup)
+    if by_category:
+        st.markdown("#### Graduation Progress by Category")
+        st.dataframe(
+            pd.DataFrame(by_category).rename(columns={
+                'category': 'Category', 'graduating': 'Graduating', 'within10': '1-10 Remaining',
+                'within20': '11-20 Remaining', 'continuing': 'Continuing', 'total': 'Total',
+            }),
+            width="stretch", hide_index=True,
+        )
+    
     # Full progress table with search
     st.markdown("#### Student Credit Progress")
     
@@ -541,7 +537,7 @@ def render_graduation_tracking(df: pd.DataFrame):
         display_cols.append(credits_required_col)
     if credits_completed_col in grad_df.columns:
         display_cols.append(credits_completed_col)
-    display_cols.extend([credits_remaining_col, credits_this_term_col, 'Credits_After_Term', 'Progress_Category'])
+    display_cols.extend([credits_remaining_col, credits_this_term_col, 'Credits_After_Term', 'Graduation_Bucket'])
     display_cols = [c for c in display_cols if c in grad_df.columns]
     
     progress_df = grad_df[display_cols].copy()
@@ -556,7 +552,7 @@ def render_graduation_tracking(df: pd.DataFrame):
         credits_remaining_col: 'Remaining',
         credits_this_term_col: 'This Term',
         'Credits_After_Term': 'After Term',
-        'Progress_Category': 'Progress'
+        'Graduation_Bucket': 'Progress'
     }
     progress_df = progress_df.rename(columns=col_rename)
     
@@ -604,7 +600,7 @@ def _categorize_and_type_students(df: pd.DataFrame) -> pd.DataFrame:
     Apply categorization logic matching ntr_calc_v5.py exactly.
     Adds Student_Category and Student_Type columns.
     """
-    df = df.copy()
+    df = df.copy(deep=False)
     
     # Ensure required columns exist
     if 'Census_1_SCHOOL' not in df.columns:
@@ -678,7 +674,7 @@ def render_ntr_analysis(df: pd.DataFrame):
     st.markdown("### NTR Analysis")
     
     # Calculate NTR for each student
-    df = df.copy()
+    df = df.copy(deep=False)
     df['NTR'] = df.apply(_calculate_ntr, axis=1)
     
     # Summary by category
@@ -878,9 +874,9 @@ def render(data: dict):
         st.warning("No census data available. Please ensure census data is loaded.")
         return
     
-    # Work with a copy and apply categorization matching ntr_calc_v5.py
-    df = census_df.copy()
-    df = _categorize_and_type_students(df)
+    # Apply categorization matching ntr_calc_v5.py (adds columns to a
+    # copy-on-write view; the shared census frame is never duplicated)
+    df = _categorize_and_type_students(census_df)
     
     # Apply filters
     df = render_filters(df)
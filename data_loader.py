@@ -5,7 +5,10 @@ Matches automatedv6.py logic for Slate transformations.
 """
 
 from typing import Optional, Tuple, Dict, List
+from collections import OrderedDict
 import hashlib
+import threading
+import weakref
 
 import streamlit as st
 import pandas as pd
@@ -14,10 +17,14 @@ import requests
 import io
 import os
 import glob
-import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from forecasting import FORECAST_FIELDS
+from pace import build_pace_index
+from utils.snapshots import copy_if_changed
+
+
 
 # ============================================================================
 # CONFIGURATION
@@ -927,7 +934,6 @@ def load_applications_data(
 # MAIN DATA LOADING FUNCTION
 # ============================================================================
 
-@st.cache_data(ttl=3*60*60, show_spinner="Loading data...")
 def load_all_data(
     census_uploaded_bytes: Optional[bytes] = None,
     census_uploaded_name: str = "",
@@ -937,6 +943,9 @@ def load_all_data(
     """
     Load all data sources and return a comprehensive data dictionary.
     Uses Slate data for applications and Census data for enrollments/NTR.
+
+    Not cached itself: the app goes through load_shared_data, which holds
+    one copy per dataset for the whole process.
     """
     # Load applications data (Slate API by default; uploads/local file optional)
     applications, apps_time = load_applications_data(
@@ -948,18 +957,179 @@ def load_all_data(
         uploaded_name=census_uploaded_name,
     )
     
+    loaded_at = datetime.now()
     data = {
         'applications': applications,
         'census': census_data,
-        'last_refresh': datetime.now(),
+        'pace': build_pace_index(applications, FORECAST_FIELDS),  # forecast breakdowns too
+        'last_refresh': loaded_at,
     }
+    data['version'] = get_dataset_version(data)
     
-    return data, datetime.now()
+    return data, loaded_at
+
+
+def get_dataset_version(data: Dict) -> str:
+    """
+    Short identifier for a loaded dataset.
+
+    Stamped by load_all_data and stable for as long as that dataset is
+    shared; derived caches (AI context, aggregates) key on it so they are
+    rebuilt exactly when the data is reloaded.
+    """
+    if not data:
+        return "empty"
+    if data.get('version'):
+        return data['version']
+    parts = [str(data.get('last_refresh', ''))]
+    for key, value in sorted((data.get('applications') or {}).items()):
+        parts.append(f"apps.{key}={getattr(value, 'shape', '')}")
+    raw_df = (data.get('census') or {}).get('raw_df')
+    parts.append(f"census={getattr(raw_df, 'shape', '')}")
+    return _hash_bytes("|".join(parts).encode("utf-8"))
+
+
+# ============================================================================
+# SHARED DATASET (one copy per process)
+# ============================================================================
+
+SHARED_VERSIONS_KEPT = 2  # datasets no session is on, kept for reuse (most recent first)
+_SESSION_REF_KEY = "_shared_dataset_ref"
+_shared_lock = threading.Lock()
+
+
+class _DatasetRef:
+    """Held in a session's state; the dataset it names is never evicted while the session lives."""
+
+    __slots__ = ('version', '__weakref__')
+
+    def __init__(self, version: str):
+        self.version = version
+
+
+@st.cache_resource(show_spinner=False)
+def _shared_registry() -> "OrderedDict[str, Dict]":
+    """Loaded datasets by version, most recently used last."""
+    return OrderedDict()
+
+
+@st.cache_resource(show_spinner=False)
+def _shared_refs() -> "weakref.WeakSet[_DatasetRef]":
+    """One _DatasetRef per live session; entries vanish with the session state."""
+    return weakref.WeakSet()
+
+
+def _session_ref(version: str) -> Optional[_DatasetRef]:
+    """Point this session's ref at ``version`` (None outside a Streamlit session)."""
+    try:
+        ref = st.session_state.get(_SESSION_REF_KEY)
+        if ref is None:
+            ref = st.session_state[_SESSION_REF_KEY] = _DatasetRef(version)
+        ref.version = version
+        return ref
+    except Exception:
+        return None
+
+
+@st.cache_resource(ttl=3*60*60, max_entries=4, show_spinner="Loading data...")
+def _load_shared(census_key: str, _census_bytes: Optional[bytes], census_name: str,
+                 apps_key: str, _apps_bytes: Optional[bytes], apps_name: str) -> Tuple[Dict, datetime]:
+    return load_all_data(
+        census_uploaded_bytes=_census_bytes,
+        census_uploaded_name=census_name,
+        apps_uploaded_bytes=_apps_bytes,
+        apps_uploaded_name=apps_name,
+    )
 
 
-def get_last_refresh_info() -> Tuple[datetime, timedelta]:
-    """Get the last refresh time and time until next refresh."""
-    data, last_refresh = load_all_data()
+def load_shared_data(
+    census_uploaded_bytes: Optional[bytes] = None,
+    census_uploaded_name: str = "",
+    apps_uploaded_bytes: Optional[bytes] = None,
+    apps_uploaded_name: str = "",
+) -> Tuple[str, datetime]:
+    """
+    Load (or reuse) the process-wide dataset and return its version.
+
+    Each dataset (keyed by the upload digests) is loaded once and held as a
+    resource shared by all sessions; sessions keep only the version string
+    and read the data through get_shared_data.  Versions a live session is
+    on are never evicted, so sessions with different uploads cannot push
+    each other's data out; beyond those, the SHARED_VERSIONS_KEPT most
+    recently used are kept.
+    """
+    data, loaded_at = _load_shared(
+        _hash_bytes(census_uploaded_bytes) if census_uploaded_bytes else "",
+        census_uploaded_bytes,
+        census_uploaded_name,
+        _hash_bytes(apps_uploaded_bytes) if apps_uploaded_bytes else "",
+        apps_uploaded_bytes,
+        apps_uploaded_name,
+    )
+    version = get_dataset_version(data)
+    with _shared_lock:
+        registry, refs = _shared_registry(), _shared_refs()
+        registry[version] = data
+        registry.move_to_end(version)
+        ref = _session_ref(version)
+        if ref is not None:
+            refs.add(ref)
+        in_use = {r.version for r in refs}
+        idle = [v for v in registry if v not in in_use]
+        for stale in idle[:max(len(idle) - SHARED_VERSIONS_KEPT, 0)]:
+            del registry[stale]
+    return version, loaded_at
+
+
+def _copy_on_write() -> bool:
+    """Whether pandas Copy-on-Write is active (always in pandas 3)."""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return bool(pd.get_option('mode.copy_on_write'))
+
+
+def enable_copy_on_write():
+    """Turn on pandas Copy-on-Write (pandas 2) so get_shared_data can hand out shallow copies."""
+    if not _copy_on_write():
+        pd.set_option('mode.copy_on_write', True)
+
+
+def _cow_view(value, deep: bool = False):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=deep)
+    if isinstance(value, dict):
+        return {k: _cow_view(v, deep) for k, v in value.items()}
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def get_shared_data(version: Optional[str]) -> Dict:
+    """
+    The shared dataset for ``version`` as a copy-on-write view.
+
+    With Copy-on-Write on (see enable_copy_on_write) frames are shallow
+    copies: they share memory with the process-wide dataset, and any change
+    a page makes copies only what it touches and stays local to that view.
+    Without it they are deep copies.  Returns {} for an unknown version.
+    """
+    with _shared_lock:
+        data = _shared_registry().get(version or "")
+    return _cow_view(data, deep=not _copy_on_write()) if data else {}
+
+
+def get_last_refresh_info(version: Optional[str] = None) -> Tuple[datetime, timedelta]:
+    """
+    Last refresh time and time until the next refresh of the shared dataset
+    ``version`` (default: the most recently loaded one).  Read-only: raises
+    LookupError instead of loading data when nothing is loaded.
+    """
+    with _shared_lock:
+        registry = _shared_registry()
+        data = registry.get(version) if version else next(reversed(registry.values()), None)
+    if not data:
+        raise LookupError("no dataset loaded")
+    last_refresh = data['last_refresh']
     next_refresh = last_refresh + timedelta(hours=3)
     time_until_refresh = next_refresh - datetime.now()
     
@@ -995,7 +1165,9 @@ def _refresh_census_snapshot():
     # Copy to snapshot folder
     dest = os.path.join(snapshot_folder, "census_latest.csv")
     try:
-        shutil.copy2(latest_file, dest)
+        if not copy_if_changed(latest_file, dest):
+            print(f"[REFRESH] Census snapshot unchanged: {dest}")
+            return False
         print(f"[REFRESH] Census snapshot updated: {latest_file} -> {dest}")
         return True
     except Exception as e:
@@ -1028,7 +1200,9 @@ def _refresh_apps_snapshot():
     # Copy to snapshot folder
     dest = os.path.join(snapshot_folder, "apps_latest.xlsx")
     try:
-        shutil.copy2(latest_file, dest)
+        if not copy_if_changed(latest_file, dest):
+            print(f"[REFRESH] Apps snapshot unchanged: {dest}")
+            return False
         print(f"[REFRESH] Apps snapshot updated: {latest_file} -> {dest}")
         return True
     except Exception as e:
@@ -1043,7 +1217,7 @@ def force_refresh():
     _refresh_apps_snapshot()
     
     # Then clear all caches so data is reloaded
-    load_all_data.clear()
+    _load_shared.clear()
     fetch_slate_data.clear()
     load_applications_data.clear()
     load_census_data.clear()
\ No newline at end of file
@@ -0,0 +1,348 @@
+"""
+Enrollment forecasting engine for the CPE Funnel Dashboard.
+
+Server-side port of iris-react/src/lib/forecasting.ts, shared by the
+Streamlit app and the React data pipeline (iris-react/scripts/process_data.py),
+which ships the result in dashboard.json so the browser no longer scans every
+student record to build it.
+
+Low/mid/high ranges for applications, admits, enrollments and NTR average two
+projections of the current cycle's applications:
+
+1. Partial-to-final ratio: the share of each earlier cycle's applications
+   that had arrived by the same date (read from the pace index).
+2. Weekly run rate: applications over the last LOOKBACK_WEEKS, carried to
+   the deadline.
+
+The resulting growth multipliers are applied to every category/degree type
+and program at once as array operations over pace-index tables.  Admits grow
+with applications, enrollments are admits times the historical yield, and
+NTR is enrollments times average credits times average cost per credit.
+
+"Today" is the data's as-of date (latest current-cycle submission), not the
+wall clock, so rebuilding the same snapshot gives the same forecast; the
+TypeScript engine anchors its filtered forecasts to the same date.  Current
+admits and enrollments are those of the applications submitted by the cutoff
+(funnelStage in forecasting.ts), and NTR is rounded to whole dollars.
+"""
+
+from dataclasses import replace
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from pace import FIELD_SEP, PACE_FIELDS, PaceIndex, build_pace_index
+
+
+HISTORIC_YEARS = (2024, 2025)
+FORECAST_YEAR = 2026
+LOOKBACK_WEEKS = 4
+DEADLINE = date(2026, 1, 10)
+
+CATEGORY_FIELD = ('Application Category', 'Degree Type')
+PROGRAM_FIELD = 'Program Cleaned'
+FORECAST_FIELDS = PACE_FIELDS + (CATEGORY_FIELD, PROGRAM_FIELD)
+PROGRAM_META = {'category': 'Application Category', 'degreeType': 'Degree Type', 'school': 'School (Expanded)'}
+UNKNOWN = 'Unknown'
+
+DEFAULT_PARTIAL_RATIO = 0.85
+RATIO_BOUNDS = (0.30, 1.0)
+RATIO_VARIANCE = 0.05       # +/- 5% on the completion ratio
+RUN_RATE_SPREAD = 0.30      # run rate 30% slower / faster for low / high
+MULTIPLIER_BOUNDS = (0.5, 3.0)
+
+DEFAULT_YIELD = 0.78
+YIELD_BOUNDS = (0.30, 1.0)
+FIXED_YIELDS = {'ASAP': 0.30, 'CPE': 0.40}  # categories without a usable history
+
+DEFAULT_AVG_CREDITS = 6
+DEFAULT_AVG_CPC = 1650
+MAX_REASONABLE_NTR = 20_000_000  # Spring term
+BACKTEST_MAPE = 4.2
+
+BANDS = ('low', 'mid', 'high')
+FUNNEL = (('apps', 'applications'), ('admits', 'admits'), ('enrolls', 'enrollments'))
+
+
+def _round(values) -> np.ndarray:
+    """Half-up rounding (JavaScript Math.round), so results match the TypeScript engine."""
+    return np.floor(np.asarray(values, dtype=float) + 0.5)
+
+
+def _round_to(values, digits: int):
+    scale = 10 ** digits
+    return _round(np.asarray(values, dtype=float) * scale) / scale
+
+
+def yoy_change(current, previous) -> np.ndarray:
+    """Percent change to one decimal; 100 (or 0) when there is no previous value."""
+    current = np.asarray(current, dtype=float)
+    previous = np.asarray(previous, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = _round_to((current - previous) / previous * 100, 1)
+    return np.where(previous == 0, np.where(current > 0, 100.0, 0.0), change)
+
+
+def sanitize_ntr(values) -> np.ndarray:
+    return np.clip(np.asarray(values, dtype=float), 0, MAX_REASONABLE_NTR)
+
+
+def forecast_multipliers(current: int, partial_ratio: float, run_rate: float,
+                         weeks_remaining: float) -> np.ndarray:
+    """
+    Low/mid/high growth multipliers for ``current`` applications: the average
+    of the ratio and run-rate projections, clamped to MULTIPLIER_BOUNDS.
+    """
+    if current == 0:
+        return np.ones(len(BANDS))
+    ratio = np.clip(partial_ratio, *RATIO_BOUNDS)
+    ratios = np.clip([ratio + RATIO_VARIANCE, ratio, ratio - RATIO_VARIANCE], *RATIO_BOUNDS)
+    by_ratio = _round(current / ratios)
+    rates = run_rate * np.array([1 - RUN_RATE_SPREAD, 1, 1 + RUN_RATE_SPREAD])
+    by_run_rate = current + _round(rates * weeks_remaining)
+    combined = _round((by_ratio + by_run_rate) / 2)
+    return np.clip(combined / current, *MULTIPLIER_BOUNDS)
+
+
+def _ranges(current: np.ndarray, low_mid_high: np.ndarray, previous: np.ndarray) -> List[Dict]:
+    """ForecastRange dicts (forecasting.ts) from arrays: current (n,), bands (n, 3), previous (n,)."""
+    yoy = yoy_change(low_mid_high[:, 1], previous)
+    return [
+        {'current': _number(c), 'low': _number(lo), 'mid': _number(mid), 'high': _number(hi),
+         'previousYear': _number(p), 'yoyChange': float(y)}
+        for c, (lo, mid, hi), p, y in zip(current, low_mid_high, previous, yoy)
+    ]
+
+
+def _number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+class _Counts:
+    """Per-group current and previous-cycle counts, one array per funnel metric."""
+
+    def __init__(self, current: pd.DataFrame, previous: pd.DataFrame):
+        self.index = current.index
+        self.current = {key: current[metric].to_numpy(dtype=float) for key, metric in FUNNEL}
+        self.previous = {key: previous[metric].to_numpy(dtype=float) for key, metric in FUNNEL}
+
+    def project(self, multipliers: np.ndarray, yields: np.ndarray) -> Dict[str, Dict[str, np.ndarray]]:
+        """Current/low-mid-high/previous arrays for apps, admits and enrolls."""
+        apps = _round(np.outer(self.current['apps'], multipliers))
+        admits = _round(np.outer(self.current['admits'], multipliers))
+        enrolls = _round(admits * np.asarray(yields, dtype=float).reshape(-1, 1))
+        return {
+            key: {'current': self.current[key], 'bands': bands, 'previous': self.previous[key]}
+            for key, bands in (('apps', apps), ('admits', admits), ('enrolls', enrolls))
+        }
+
+
+def _grouped_counts(pace: PaceIndex, field, labels) -> _Counts:
+    """
+    Current-cycle totals per group and the previous cycle's totals for the
+    same groups; ``labels`` maps raw field values to group labels.
+    """
+    current = pace.table(FORECAST_YEAR, field, final=True)
+    previous = pace.table(FORECAST_YEAR - 1, field, final=True)
+    current = current.groupby(labels(current.index), sort=True).sum()
+    previous = previous.groupby(labels(previous.index), sort=True).sum()
+    return _Counts(current, previous.reindex(current.index, fill_value=0))
+
+
+def _category_label(values: pd.Index) -> pd.Series:
+    return pd.Series(values, index=values).str.replace('Stevens Online (', '', regex=False).str.replace(
+        ')', '', regex=False).replace('', UNKNOWN)
+
+
+def _category_keys(index: pd.Index) -> pd.Index:
+    parts = pd.Series(index, index=index).str.split(FIELD_SEP, n=1, expand=True)
+    category = _category_label(pd.Index(parts[0])).to_numpy()
+    degree = parts[1].replace('', UNKNOWN).to_numpy()
+    return pd.Index(category + FIELD_SEP + degree)
+
+
+def _program_keys(index: pd.Index) -> pd.Index:
+    return pd.Index(pd.Series(index, index=index).replace('', UNKNOWN).to_numpy())
+
+
+def _yields(previous_admits: np.ndarray, previous_enrolls: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(previous_admits > 0, previous_enrolls / previous_admits, DEFAULT_YIELD)
+
+
+def _ntr(enrolls, ntr_per_student: float, sanitize: bool = False) -> np.ndarray:
+    """Enrollments times NTR per student, in whole dollars."""
+    values = _round(np.asarray(enrolls, dtype=float) * ntr_per_student)
+    return sanitize_ntr(values) if sanitize else values
+
+
+def _with_ntr(projected: Dict, ntr_per_student: float, sanitize: bool = False) -> Dict:
+    enrolls = projected['enrolls']
+    projected['ntr'] = {
+        key: _ntr(enrolls[key], ntr_per_student, sanitize) for key in ('current', 'bands', 'previous')
+    }
+    return projected
+
+
+def _range_rows(projected: Dict) -> List[Dict[str, Dict]]:
+    """One {apps, admits, enrolls, ntr} dict of ForecastRanges per group."""
+    columns = {key: _ranges(p['current'], p['bands'], p['previous']) for key, p in projected.items()}
+    return [dict(zip(columns, ranges)) for ranges in zip(*columns.values())]
+
+
+def _parameters(pace: PaceIndex, as_of: date) -> Dict[str, float]:
+    """Partial ratio, weekly run rate and weeks remaining as of ``as_of``."""
+    ratios = [
+        pace.metrics(year, as_of).applications / final
+        for year in HISTORIC_YEARS
+        if (final := pace.totals(year).applications) > 0
+    ]
+    partial_ratio = float(np.mean(ratios)) if ratios else DEFAULT_PARTIAL_RATIO
+    lookback_start = as_of - timedelta(weeks=LOOKBACK_WEEKS)
+    recent = (pace.metrics(FORECAST_YEAR, as_of).applications
+              - pace.metrics(FORECAST_YEAR, lookback_start - timedelta(days=1)).applications)
+    return {
+        'partialRatio': partial_ratio,
+        'weeklyRunRate': recent / LOOKBACK_WEEKS,
+        'weeksRemaining': max(0, (DEADLINE - as_of).days) / 7,
+    }
+
+
+def forecast_breakdown(pace: PaceIndex, as_of: date, ntr_per_student: float,
+                       program_meta: Optional[pd.DataFrame] = None,
+                       program_limit: int = 20) -> Dict[str, List[Dict]]:
+    """
+    byCategory (category x degree type) and byProgram forecasts.  One set of
+    multipliers from the overall cycle is applied to every group at once.
+    """
+    params = _parameters(pace, as_of)
+    multipliers = forecast_multipliers(pace.totals(FORECAST_YEAR).applications, params['partialRatio'],
+                                       params['weeklyRunRate'], params['weeksRemaining'])
+
+    by_category = []
+    counts = _grouped_counts(pace, CATEGORY_FIELD, _category_keys)
+    keys = counts.index.str.split(FIELD_SEP, n=1, expand=True)
+    categories = keys.get_level_values(0).to_numpy()
+    yields = _yields(counts.previous['admits'], counts.previous['enrolls'])
+    for category, rate in FIXED_YIELDS.items():
+        yields = np.where(categories == category, rate, yields)
+    projected = _with_ntr(counts.project(multipliers, yields), ntr_per_student)
+    for (category, degree), row, rate in zip(keys, _range_rows(projected), yields):
+        if category != UNKNOWN:
+            by_category.append({'category': category, 'degreeType': degree, **row,
+                                'historicalYield': float(rate)})
+    by_category.sort(key=lambda c: -c['apps']['current'])
+
+    by_program = []
+    counts = _grouped_counts(pace, PROGRAM_FIELD, _program_keys)
+    yields = _yields(counts.previous['admits'], counts.previous['enrolls'])
+    projected = _with_ntr(counts.project(multipliers, yields), ntr_per_student)
+    meta = program_meta if program_meta is not None else pd.DataFrame(columns=list(PROGRAM_META))
+    meta = meta.reindex(counts.index).fillna(UNKNOWN)
+    for program, row, (_, info) in zip(counts.index, _range_rows(projected), meta.iterrows()):
+        if program != UNKNOWN:
+            by_program.append({'program': program, **info.to_dict(), **row})
+    by_program.sort(key=lambda p: -p['apps']['current'])
+    return {'byCategory': by_category, 'byProgram': by_program[:program_limit]}
+
+
+def _enrolled_by(applications: Dict, cutoff: date) -> int:
+    """Enrolled current-cycle applications submitted by ``cutoff`` (undated ones included)."""
+    df = applications.get('current')
+    if not isinstance(df, pd.DataFrame) or 'Enrolled' not in df.columns:
+        return 0
+    submitted = pd.to_datetime(df['Submitted'], errors='coerce', format='mixed').dt.normalize()
+    return int(((df['Enrolled'] == 'yes') & ~(submitted > pd.Timestamp(cutoff))).sum())
+
+
+def _program_meta(applications: Dict) -> Optional[pd.DataFrame]:
+    """Category, degree type and school of each program's first current-cycle application."""
+    df = applications.get('current')
+    if not isinstance(df, pd.DataFrame) or PROGRAM_FIELD not in df.columns:
+        return None
+    columns = [c for c in PROGRAM_META.values() if c in df.columns]
+    meta = df[[PROGRAM_FIELD] + columns].fillna('').astype(str)
+    meta[PROGRAM_FIELD] = meta[PROGRAM_FIELD].replace('', UNKNOWN)
+    meta = meta.groupby(PROGRAM_FIELD, sort=False).first().rename(
+        columns={col: key for key, col in PROGRAM_META.items()})
+    meta['category'] = _category_label(pd.Index(meta['category'])).to_numpy()
+    return meta.replace('', UNKNOWN)
+
+
+def generate_forecast(applications: Dict, pace: Optional[PaceIndex] = None,
+                      avg_credits: float = DEFAULT_AVG_CREDITS, avg_cpc: float = DEFAULT_AVG_CPC,
+                      program_limit: int = 20) -> Optional[Dict]:
+    """
+    Forecast for the current cycle, shaped like forecasting.ts output:
+    ``metrics`` (overall ForecastRanges), ``params``, ``cutoffDate``,
+    ``byCategory`` and ``byProgram``.  ``pace`` is reused when it indexes
+    FORECAST_FIELDS; otherwise one is built.  None without Submitted dates.
+    """
+    if pace is None or not set(FORECAST_FIELDS) <= pace.fields:
+        pace = build_pace_index(applications, FORECAST_FIELDS)
+    if pace is None or pace.current_year != FORECAST_YEAR:
+        return None
+
+    # Compare on the previous cycle's last submission date, or today's if earlier
+    as_of = pace.as_of
+    last_previous = pace.last_submitted(FORECAST_YEAR - 1)
+    cutoff = min(as_of, last_previous) if last_previous else as_of
+    params = _parameters(pace, cutoff)
+    multipliers = forecast_multipliers(pace.metrics(FORECAST_YEAR, cutoff).applications, params['partialRatio'],
+                                       params['weeklyRunRate'], params['weeksRemaining'])
+
+    # Enrollments of the applications counted, not those dated by the cutoff (pace)
+    current = replace(pace.metrics(FORECAST_YEAR, cutoff), enrollments=_enrolled_by(applications, cutoff))
+    previous = pace.totals(FORECAST_YEAR - 1)
+    counts = _Counts(pd.DataFrame([vars(current)]), pd.DataFrame([vars(previous)]))
+    raw_yield = previous.enrollments / previous.admits if previous.admits > 0 else DEFAULT_YIELD
+    historical_yield = float(np.clip(raw_yield, *YIELD_BOUNDS))
+    projected = _with_ntr(counts.project(multipliers, [historical_yield]), avg_credits * avg_cpc, sanitize=True)
+
+    forecast = {
+        'metrics': _range_rows(projected)[0],
+        'params': {
+            'weeklyRunRate': float(_round_to(params['weeklyRunRate'], 1)),
+            'weeksRemaining': float(_round_to(params['weeksRemaining'], 1)),
+            'growthMultiplierLow': float(_round_to(multipliers[0], 3)),
+            'growthMultiplierMid': float(_round_to(multipliers[1], 3)),
+            'growthMultiplierHigh': float(_round_to(multipliers[2], 3)),
+            'avgHistoricalYield': float(_round_to(historical_yield, 3)),
+            'backtestMAPE': BACKTEST_MAPE,
+            'partialRatio': float(_round_to(params['partialRatio'], 3)),
+        },
+        'cutoffDate': cutoff.isoformat(),
+        'asOf': as_of.isoformat(),
+        'avgCredits': avg_credits,
+        'avgCPC': avg_cpc,
+    }
+    forecast.update(forecast_breakdown(pace, as_of, avg_credits * avg_cpc, _program_meta(applications),
+                                       program_limit))
+    return forecast
+
+
+def apply_ntr(forecast: Optional[Dict], avg_credits: float, avg_cpc: float) -> Optional[Dict]:
+    """
+    Forecast with NTR ranges recomputed for new credit/CPC averages (from the
+    census), without re-running the application forecast.
+    """
+    if not forecast:
+        return forecast
+    per_student = avg_credits * avg_cpc
+
+    def ntr(enrolls: Dict, sanitize: bool) -> Dict:
+        values = _ntr([enrolls['current'], enrolls['low'], enrolls['mid'], enrolls['high'],
+                       enrolls['previousYear']], per_student, sanitize)
+        return _ranges(values[:1], values[1:4].reshape(1, 3), values[4:])[0]
+
+    return {
+        **forecast,
+        'metrics': {**forecast['metrics'], 'ntr': ntr(forecast['metrics']['enrolls'], sanitize=True)},
+        'avgCredits': avg_credits,
+        'avgCPC': avg_cpc,
+        'byCategory': [{**c, 'ntr': ntr(c['enrolls'], sanitize=False)} for c in forecast['byCategory']],
+        'byProgram': [{**p, 'ntr': ntr(p['enrolls'], sanitize=False)} for p in forecast['byProgram']],
+    }
@@ -0,0 +1,116 @@
+"""
+Graduation progress engine for the CPE Funnel Dashboard.
+Shared by the Streamlit Student Intelligence page and the React data pipeline
+(iris-react/scripts/process_data.py), so both report the same buckets.
+
+Each student is placed in one bucket by credits remaining AFTER this term:
+graduating (<= 0), 1-10, 11-20 or 20+ remaining.  Buckets are assigned once
+with pd.cut and every category/bucket count comes from a single crosstab.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pandas as pd
+import numpy as np
+
+
+REMAINING_COL = 'Census_1_CREDITS_REMAINING_FROM_PROGRAM_REQUIREMENTS'
+THIS_TERM_COLS = ['Census_1_CENSUS3_TOTAL_NUMBER_OF_CREDIT_HOURS', 'Census_1_NUMBER_OF_CREDITS']
+CATEGORY_COL = 'Student_Category'
+
+GRADUATING = 'Graduating'
+BUCKET_LABELS = [GRADUATING, '1-10 remaining', '11-20 remaining', '20+ remaining']
+BUCKET_BINS = [-np.inf, 0, 10, 20, np.inf]
+BUCKET_COLORS = ['#22c55e', '#3b82f6', '#f59e0b', '#ef4444']
+
+DEFAULT_RETENTION_RATE = 0.92
+
+
+@dataclass
+class GraduationRollup:
+    """Bucketed students plus the per-bucket and per-category counts."""
+    students: pd.DataFrame     # input rows with Credits_After_Term and Graduation_Bucket added
+    counts: Dict[str, int]     # bucket label -> students
+    by_category: pd.DataFrame  # category x bucket counts, plus Total; categories in first-seen order
+    remaining_col: str
+    this_term_col: str
+
+    @property
+    def total(self) -> int:
+        return len(self.students)
+
+    @property
+    def graduating(self) -> pd.DataFrame:
+        return self.students[self.students['Graduation_Bucket'] == GRADUATING]
+
+    def projected_continuing(self, retention_rate: float = DEFAULT_RETENTION_RATE) -> int:
+        return int((self.total - self.counts[GRADUATING]) * retention_rate)
+
+
+def this_term_column(df: pd.DataFrame) -> str:
+    """Credit-hours column for the current term (census exports use either name)."""
+    return next((c for c in THIS_TERM_COLS if c in df.columns), THIS_TERM_COLS[0])
+
+
+def compute_graduation(df: pd.DataFrame) -> Optional[GraduationRollup]:
+    """
+    Bucket students by graduation progress.
+
+    Returns None when the credits-remaining or this-term column is missing.
+    Missing credits remaining count as 999 (never graduating), missing
+    this-term credits as 0.
+    """
+    if df is None or REMAINING_COL not in df.columns:
+        return None
+    this_term_col = this_term_column(df)
+    if this_term_col not in df.columns:
+        return None
+
+    remaining = pd.to_numeric(df[REMAINING_COL], errors='coerce').fillna(999)
+    this_term = pd.to_numeric(df[this_term_col], errors='coerce').fillna(0)
+    after_term = remaining - this_term
+    buckets = pd.cut(after_term, bins=BUCKET_BINS, labels=BUCKET_LABELS)
+
+    students = df.assign(**{
+        REMAINING_COL: remaining,
+        this_term_col: this_term,
+        'Credits_After_Term': after_term,
+        'Graduation_Bucket': buckets,
+    })
+
+    if CATEGORY_COL in students.columns:
+        by_category = pd.crosstab(students[CATEGORY_COL], buckets).reindex(columns=BUCKET_LABELS, fill_value=0)
+        order = [c for c in pd.unique(students[CATEGORY_COL]) if c in by_category.index]
+        by_category = by_category.reindex(order)
+    else:
+        by_category = pd.DataFrame(columns=BUCKET_LABELS, dtype=int)
+    by_category.columns = list(BUCKET_LABELS)
+    by_category['Total'] = by_category.sum(axis=1)
+
+    counts = buckets.value_counts().reindex(BUCKET_LABELS, fill_value=0)
+    return GraduationRollup(
+        students=students,
+        counts={label: int(n) for label, n in counts.items()},
+        by_category=by_category,
+        remaining_col=REMAINING_COL,
+        this_term_col=this_term_col,
+    )
+
+
+def category_rollup(rollup: GraduationRollup, skip=('', 'Uncategorized')) -> List[Dict]:
+    """Per-category counts, largest category first."""
+    rows = []
+    for cat, counts in rollup.by_category.iterrows():
+        if not cat or cat in skip:
+            continue
+        rows.append({
+            "category": str(cat).replace('Stevens Online (', '').replace(')', ''),
+            "graduating": int(counts[GRADUATING]),
+            "within10": int(counts[BUCKET_LABELS[1]]),
+            "within20": int(counts[BUCKET_LABELS[2]]),
+            "continuing": int(counts['Total'] - counts[GRADUATING]),
+            "total": int(counts['Total']),
+        })
+    rows.sort(key=lambda x: x['total'], reverse=True)
+    return rows
@@ -13,20 +13,34 @@ Output:
     public/data/dashboard.json - All dashboard data in a single file
 """
 
+import hashlib
 import json
 import os
 import sys
-from datetime import datetime
+from types import GeneratorType
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, Iterator, List, Tuple
 
 import pandas as pd
 import numpy as np
 
 # Configuration
-SCRIPT_DIR = Path(__file__).parent
+SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_DIR = SCRIPT_DIR.parent
 PARENT_DIR = PROJECT_DIR.parent  # Original Streamlit app
+
+# Engines shared with the Streamlit app (pandas-only modules in PARENT_DIR)
+sys.path.insert(0, str(PARENT_DIR))
+from graduation import (  # noqa: E402
+    BUCKET_COLORS as GRADUATION_COLORS,
+    BUCKET_LABELS as GRADUATION_BUCKETS,
+    DEFAULT_RETENTION_RATE,
+    REMAINING_COL as GRADUATION_REMAINING_COL,
+    category_rollup,
+    compute_graduation,
+)
+from forecasting import apply_ntr, generate_forecast  # noqa: E402
 SNAPSHOT_DIR = PARENT_DIR / "data" / "snapshots"
 OUTPUT_DIR = PROJECT_DIR / "public" / "data"
 DEFAULT_NTR_GOAL = 9_800_000
@@ -621,15 +635,9 @@ def calculate_graduation_metrics(census_df: pd.DataFrame) -> Dict:
             "projectedContinuing": 0,
         }
     
-    # Column names for credits
-    remaining_col = 'Census_1_CREDITS_REMAINING_FROM_PROGRAM_REQUIREMENTS'
-    this_term_col = 'Census_1_CENSUS3_TOTAL_NUMBER_OF_CREDIT_HOURS'
-    if this_term_col not in census_df.columns:
-        this_term_col = 'Census_1_NUMBER_OF_CREDITS'
-    
-    # Check if required columns exist
-    if remaining_col not in census_df.columns:
-        print(f"   Warning: {remaining_col} not found in census data")
+    rollup = compute_graduation(census_df)
+    if rollup is None:
+        print(f"   Warning: {GRADUATION_REMAINING_COL} not found in census data")
         return {
             "graduatingThisTerm": 0,
             "within10Credits": 0,
@@ -643,96 +651,44 @@ def calculate_graduation_metrics(census_df: pd.DataFrame) -> Dict:
             "projectedContinuing": 0,
         }
     
-    # Convert to numeric
-    df = census_df.copy()
-    df[remaining_col] = pd.to_numeric(df[remaining_col], errors='coerce').fillna(999)
-    df[this_term_col] = pd.to_numeric(df[this_term_col], errors='coerce').fillna(0)
-    
-    # Calculate credits after this term (for graduation calculation)
-    df['Credits_After_Term'] = df[remaining_col] - df[this_term_col]
-    
-    # Graduating = students who will complete after this term (credits_after <= 0)
-    graduating = df[df['Credits_After_Term'] <= 0]
-    not_graduating = df[df['Credits_After_Term'] > 0]
-    
-    # Progress categories - MUTUALLY EXCLUSIVE (must add up to total)
-    # Based on credits remaining AFTER this term for non-graduating students
-    within_10 = not_graduating[(not_graduating['Credits_After_Term'] > 0) & (not_graduating['Credits_After_Term'] <= 10)]
-    within_20 = not_graduating[(not_graduating['Credits_After_Term'] > 10) & (not_graduating['Credits_After_Term'] <= 20)]
-    credits_20_plus = not_graduating[not_graduating['Credits_After_Term'] > 20]
-    
-    # Progress distribution for pie chart - should add up to total
+    # Progress buckets are mutually exclusive (credits remaining after this term)
+    counts = rollup.counts
     progress_dist = [
-        {"label": "Graduating", "value": len(graduating), "color": "#22c55e"},
-        {"label": "1-10 remaining", "value": len(within_10), "color": "#3b82f6"},
-        {"label": "11-20 remaining", "value": len(within_20), "color": "#f59e0b"},
-        {"label": "20+ remaining", "value": len(credits_20_plus), "color": "#ef4444"},
+        {"label": label, "value": counts[label], "color": color}
+        for label, color in zip(GRADUATION_BUCKETS, GRADUATION_COLORS)
     ]
     
-    # Verify totals add up
-    total_in_buckets = len(graduating) + len(within_10) + len(within_20) + len(credits_20_plus)
-    if total_in_buckets != len(df):
-        print(f"   Warning: Graduation buckets ({total_in_buckets}) != total students ({len(df)})")
-    
-    # Calculate by category breakdown - MUTUALLY EXCLUSIVE buckets
-    by_category = []
-    if 'Student_Category' in df.columns:
-        for cat in df['Student_Category'].unique():
-            if not cat or cat == 'Uncategorized':
-                continue
-            cat_df = df[df['Student_Category'] == cat]
-            cat_not_graduating = cat_df[cat_df['Credits_After_Term'] > 0]
-            
-            # Graduating = credits after term <= 0
-            cat_graduating = len(cat_df[cat_df['Credits_After_Term'] <= 0])
-            # Within X = NOT graduating and credits_after in range (mutually exclusive)
-            cat_within_10 = len(cat_not_graduating[(cat_not_graduating['Credits_After_Term'] > 0) & (cat_not_graduating['Credits_After_Term'] <= 10)])
-            cat_within_20 = len(cat_not_graduating[(cat_not_graduating['Credits_After_Term'] > 10) & (cat_not_graduating['Credits_After_Term'] <= 20)])
-            cat_continuing = len(cat_not_graduating)  # All non-graduating students
-            
-            by_category.append({
-                "category": cat.replace('Stevens Online (', '').replace(')', ''),
-                "graduating": cat_graduating,
-                "within10": cat_within_10,
-                "within20": cat_within_20,
-                "continuing": cat_continuing,
-                "total": len(cat_df),
-            })
-    
-    # Sort by total students
-    by_category.sort(key=lambda x: x['total'], reverse=True)
-    
-    # Get graduating student details (limited to top 30)
-    graduating_students = []
-    program_col = 'Census_1_PRIMARY_PROGRAM_OF_STUDY' if 'Census_1_PRIMARY_PROGRAM_OF_STUDY' in df.columns else None
-    
-    for _, row in graduating.head(30).iterrows():
-        student = {
-            "program": str(row.get(program_col, 'Unknown'))[:40] if program_col else 'Unknown',
-            "category": str(row.get('Student_Category', 'Unknown')).replace('Stevens Online (', '').replace(')', ''),
-            "creditsRemaining": int(row.get(remaining_col, 0)),
-            "creditsThisTerm": int(row.get(this_term_col, 0)),
-            "creditsAfterTerm": int(row.get('Credits_After_Term', 0)),
-            "willGraduate": row.get('Credits_After_Term', 999) <= 0,
+    # Graduating student details (limited to top 30)
+    top = rollup.graduating.head(30)
+    program_col = 'Census_1_PRIMARY_PROGRAM_OF_STUDY'
+    programs = top[program_col].astype(str).str[:40] if program_col in top.columns else ['Unknown'] * len(top)
+    categories = (top['Student_Category'].astype(str) if 'Student_Category' in top.columns else pd.Series(['Unknown'] * len(top)))
+    categories = categories.str.replace('Stevens Online (', '', regex=False).str.replace(')', '', regex=False)
+    graduating_students = [
+        {
+            "program": prog,
+            "category": cat,
+            "creditsRemaining": int(remaining),
+            "creditsThisTerm": int(this_term),
+            "creditsAfterTerm": int(after),
+            "willGraduate": True,
         }
-        graduating_students.append(student)
-    
-    # Calculate retention projection (default 92% retention rate)
-    retention_rate = 0.92
-    non_graduating = len(df) - len(graduating)
-    projected_continuing = int(non_graduating * retention_rate)
-    
+        for prog, cat, remaining, this_term, after in zip(
+            programs, categories, top[rollup.remaining_col], top[rollup.this_term_col], top['Credits_After_Term'])
+    ]
+
+    retention_rate = DEFAULT_RETENTION_RATE
     return {
-        "graduatingThisTerm": len(graduating),
-        "within10Credits": len(within_10),
-        "within20Credits": len(within_20),
-        "credits20Plus": len(credits_20_plus),
-        "totalStudents": len(df),
+        "graduatingThisTerm": counts[GRADUATION_BUCKETS[0]],
+        "within10Credits": counts[GRADUATION_BUCKETS[1]],
+        "within20Credits": counts[GRADUATION_BUCKETS[2]],
+        "credits20Plus": counts[GRADUATION_BUCKETS[3]],
+        "totalStudents": rollup.total,
         "progressDistribution": progress_dist,
         "graduatingStudents": graduating_students,
-        "byCategory": by_category,
+        "byCategory": category_rollup(rollup),
         "retentionRate": retention_rate,
-        "projectedContinuing": projected_continuing,
+        "projectedContinuing": rollup.projected_continuing(retention_rate),
     }
 
 
@@ -894,7 +850,8 @@ def calculate_funnel_by_category_hybrid(apps_df: pd.DataFrame, census_df: pd.Dat
     if census_df is not None and not census_df.empty:
         categories.update(census_df['Student_Category'].unique())
     
-    for cat in categories:
+    # Sorted: set order varies between runs and the build manifest needs repeatable output
+    for cat in sorted(categories, key=str):
         if not cat or cat == 'Uncategorized':
             continue
         
@@ -980,102 +937,142 @@ def calculate_category_metrics_hybrid(apps_df: pd.DataFrame, census_df: pd.DataF
     return result
 
 
+# Hand-maintained census -> Slate program names that standardization gets wrong
+PROGRAM_CROSSWALK_OVERRIDES_PATH = PARENT_DIR / "data" / "program_crosswalk_overrides.json"
+
+
+def load_program_crosswalk(census_programs, overrides_path: Optional[Path] = None) -> Dict[str, str]:
+    """
+    Map census program strings to canonical Slate 'Program Cleaned' keys.
+
+    Derived on every build with standardize_program_name, so a change to the
+    standardization reaches every program.  Only manual overrides are
+    persisted: ``{"version": 1, "programs": {census name: Slate program}}``
+    in program_crosswalk_overrides.json, for census names that do not
+    standardize to their Slate program.
+    """
+    path = overrides_path or PROGRAM_CROSSWALK_OVERRIDES_PATH
+    overrides: Dict[str, str] = {}
+    if path.exists():
+        try:
+            overrides = json.loads(path.read_text()).get("programs", {})
+        except Exception as e:
+            print(f"Warning: could not read {path}: {e}")
+
+    crosswalk = {raw: overrides.get(raw) or standardize_program_name(raw)
+                 for raw in census_programs if raw and not pd.isna(raw)}
+    used = sum(raw in overrides for raw in crosswalk)
+    if used:
+        print(f"   Program crosswalk: {used} manual override(s), {len(crosswalk)} census programs")
+    return crosswalk
+
+
+def _group_mode(df: pd.DataFrame, key: str, col: str) -> Dict[str, str]:
+    """Most common ``col`` value per ``key`` (ties go to the smallest value, like Series.mode)."""
+    if col not in df.columns:
+        return {}
+    counts = df.groupby([key, col]).size().reset_index(name='_n')
+    top = counts.sort_values([key, '_n', col], ascending=[True, False, True]).drop_duplicates(key)
+    return dict(zip(top[key], top[col]))
+
+
 def calculate_program_metrics_hybrid(apps_df: pd.DataFrame, census_df: pd.DataFrame, year_dfs: Dict, limit: int = None) -> List[Dict]:
     """
     Calculate metrics by program with YoY change.
     - Applications, Admits, Accepted: from Slate
-    - Enrollments: from Census
+    - Enrollments: from Census, joined through the program crosswalk
+
+    Every frame is grouped once by program; the top ``limit`` programs are a
+    slice of the full, enrollment-sorted result.
     """
     programs = {}
     
     # Get apps/admits from Slate
     if apps_df is not None and not apps_df.empty:
-        for prog in apps_df['Program Cleaned'].unique():
-            if not prog:
-                continue
-            prog_df = apps_df[apps_df['Program Cleaned'] == prog]
-            
+        slate = apps_df[apps_df['Program Cleaned'].astype(bool)]
+        grouped = slate.assign(
+            _admit=slate['Admit Status'] == 'admitted',
+            _accept=slate['Offer Accepted'] == 'yes',
+        ).groupby('Program Cleaned', sort=False)[['Is Application', '_admit', '_accept']].sum()
+        schools = _group_mode(slate, 'Program Cleaned', 'School (Expanded)')
+        degrees = _group_mode(slate, 'Program Cleaned', 'Degree Type')
+        categories = _group_mode(slate, 'Program Cleaned', 'Application Category')
+        
+        for prog, row in grouped.iterrows():
+            apps = int(row['Is Application'])
+            admits = int(row['_admit'])
             programs[prog] = {
                 "program": prog,
-                "school": prog_df['School (Expanded)'].mode().iloc[0] if not prog_df['School (Expanded)'].mode().empty else '',
-                "degreeType": prog_df['Degree Type'].mode().iloc[0] if not prog_df['Degree Type'].mode().empty else '',
-                "category": prog_df['Application Category'].mode().iloc[0].replace('Stevens Online (', '').replace(')', '') if not prog_df['Application Category'].mode().empty else '',
-                "applications": int(prog_df['Is Application'].sum()),
-                "admits": int((prog_df['Admit Status'] == 'admitted').sum()),
-                "accepted": int((prog_df['Offer Accepted'] == 'yes').sum()),
+                "school": schools.get(prog, ''),
+                "degreeType": degrees.get(prog, ''),
+                "category": categories.get(prog, '').replace('Stevens Online (', '').replace(')', ''),
+                "applications": apps,
+                "admits": admits,
+                "accepted": int(row['_accept']),
                 "enrollments": 0,
                 "yield": 0,
-                "admitRate": 0,
+                "admitRate": round((admits / apps) * 100, 1) if apps > 0 else 0,
                 "yoyChange": 0,
                 "yoyEnrollChange": 0,
                 "prevApps": 0,
                 "prevEnrolls": 0,
             }
-            
-            apps = programs[prog]["applications"]
-            admits = programs[prog]["admits"]
-            programs[prog]["admitRate"] = round((admits / apps) * 100, 1) if apps > 0 else 0
     
-    # Get enrollments from Census (match by program name)
-    if census_df is not None and not census_df.empty:
-        program_col = 'Census_1_PRIMARY_PROGRAM_OF_STUDY'
-        if program_col in census_df.columns:
-            for prog in census_df[program_col].unique():
-                if not prog or pd.isna(prog):
-                    continue
-                prog_clean = standardize_program_name(prog)
-                if not prog_clean:
-                    continue
-                    
-                prog_census = census_df[census_df[program_col] == prog]
-                enrolled = len(prog_census)
-                new_enrolled = int((prog_census['Student_Type'] == 'New').sum())
-                
-                if prog_clean in programs:
-                    programs[prog_clean]["enrollments"] = enrolled
-                    admits = programs[prog_clean]["admits"]
-                    programs[prog_clean]["yield"] = round((new_enrolled / admits) * 100, 1) if admits > 0 else 0
-                else:
-                    # Program only in Census
-                    cat = prog_census['Student_Category'].mode().iloc[0] if not prog_census['Student_Category'].mode().empty else ''
-                    school = prog_census['Census_1_SCHOOL'].mode().iloc[0] if 'Census_1_SCHOOL' in prog_census.columns and not prog_census['Census_1_SCHOOL'].mode().empty else ''
-                    degree = prog_census['Census_1_DEGREE_TYPE'].mode().iloc[0] if not prog_census['Census_1_DEGREE_TYPE'].mode().empty else ''
-                    
-                    programs[prog_clean] = {
-                        "program": prog_clean,
-                        "school": standardize_school_name(school),
-                        "degreeType": degree,
-                        "category": cat.replace('Stevens Online (', '').replace(')', ''),
-                        "applications": 0,
-                        "admits": 0,
-                        "accepted": 0,
-                        "enrollments": enrolled,
-                        "yield": 0,
-                        "admitRate": 0,
-                        "yoyChange": 0,
-                        "yoyEnrollChange": 0,
-                        "prevApps": 0,
-                        "prevEnrolls": 0,
-                    }
+    # Get enrollments from Census (joined on the canonical program key)
+    program_col = 'Census_1_PRIMARY_PROGRAM_OF_STUDY'
+    if census_df is not None and not census_df.empty and program_col in census_df.columns:
+        crosswalk = load_program_crosswalk(census_df[program_col].dropna().unique())
+        census = census_df.assign(_program=census_df[program_col].map(crosswalk).fillna(''))
+        census = census[census['_program'] != '']
+        enrolled = census.assign(_new=census['Student_Type'] == 'New').groupby('_program', sort=False).agg(
+            enrolled=('_new', 'size'), new_enrolled=('_new', 'sum'))
+        census_only = census[~census['_program'].isin(programs.keys())]
+        cats = _group_mode(census_only, '_program', 'Student_Category')
+        schools = _group_mode(census_only, '_program', 'Census_1_SCHOOL')
+        degrees = _group_mode(census_only, '_program', 'Census_1_DEGREE_TYPE')
+        
+        for prog, row in enrolled.iterrows():
+            if prog in programs:
+                programs[prog]["enrollments"] = int(row['enrolled'])
+                admits = programs[prog]["admits"]
+                programs[prog]["yield"] = round((int(row['new_enrolled']) / admits) * 100, 1) if admits > 0 else 0
+            else:
+                # Program only in Census
+                programs[prog] = {
+                    "program": prog,
+                    "school": standardize_school_name(schools.get(prog, '')),
+                    "degreeType": degrees.get(prog, ''),
+                    "category": cats.get(prog, '').replace('Stevens Online (', '').replace(')', ''),
+                    "applications": 0,
+                    "admits": 0,
+                    "accepted": 0,
+                    "enrollments": int(row['enrolled']),
+                    "yield": 0,
+                    "admitRate": 0,
+                    "yoyChange": 0,
+                    "yoyEnrollChange": 0,
+                    "prevApps": 0,
+                    "prevEnrolls": 0,
+                }
     
     # Calculate YoY changes from Slate historical data
-    if 'previous' in year_dfs and year_dfs['previous'] is not None and not year_dfs['previous'].empty:
-        prev_df = year_dfs['previous']
-        for prog in programs:
-            prev_prog = prev_df[prev_df['Program Cleaned'] == prog]
-            if not prev_prog.empty:
-                prev_apps = int(prev_prog['Is Application'].sum())
-                prev_enrolls = int((prev_prog['Enrolled'] == 'yes').sum())
-                programs[prog]["prevApps"] = prev_apps
-                programs[prog]["prevEnrolls"] = prev_enrolls
-                
-                curr_apps = programs[prog]["applications"]
-                curr_enrolls = programs[prog]["enrollments"]
-                
-                if prev_apps > 0:
-                    programs[prog]["yoyChange"] = round(((curr_apps - prev_apps) / prev_apps) * 100, 0)
-                if prev_enrolls > 0:
-                    programs[prog]["yoyEnrollChange"] = round(((curr_enrolls - prev_enrolls) / prev_enrolls) * 100, 0)
+    prev_df = year_dfs.get('previous')
+    if prev_df is not None and not prev_df.empty:
+        prev = prev_df.assign(_enrolled=prev_df['Enrolled'] == 'yes').groupby('Program Cleaned')[
+            ['Is Application', '_enrolled']].sum()
+        for prog in prev.index.intersection(list(programs)):
+            prev_apps = int(prev.at[prog, 'Is Application'])
+            prev_enrolls = int(prev.at[prog, '_enrolled'])
+            programs[prog]["prevApps"] = prev_apps
+            programs[prog]["prevEnrolls"] = prev_enrolls
+            
+            curr_apps = programs[prog]["applications"]
+            curr_enrolls = programs[prog]["enrollments"]
+            
+            if prev_apps > 0:
+                programs[prog]["yoyChange"] = round(((curr_apps - prev_apps) / prev_apps) * 100, 0)
+            if prev_enrolls > 0:
+                programs[prog]["yoyEnrollChange"] = round(((curr_enrolls - prev_enrolls) / prev_enrolls) * 100, 0)
     
     result = list(programs.values())
     result.sort(key=lambda x: x['enrollments'], reverse=True)
@@ -1612,14 +1609,13 @@ def parse_date_safely(date_val) -> Optional[str]:
         return None
 
 
-def generate_student_records(apps_df: pd.DataFrame, census_df: pd.DataFrame, year_dfs: Dict = None) -> List[Dict]:
+def iter_student_records(apps_df: pd.DataFrame, census_df: pd.DataFrame, year_dfs: Dict = None) -> Iterator[Dict]:
     """
-    Generate student-level records for client-side filtering.
+    Yield student-level records for client-side filtering.
     Combines data from both Slate (applications) and Census (enrollment) sources.
     Includes historical years for YoY filtering.
+    Records are produced one at a time so the writer can stream them to disk.
     """
-    students = []
-    
     # Process application records (Slate data) - all years
     year_keys = [('two_years_ago', '2024'), ('previous', '2025'), ('current', '2026')]
     
@@ -1656,7 +1652,7 @@ def generate_student_records(apps_df: pd.DataFrame, census_df: pd.DataFrame, yea
                         "submittedDate": submitted_date,
                         "enrollmentDate": enrollment_date,
                     }
-                    students.append(student)
+                    yield student
     elif apps_df is not None and not apps_df.empty:
         # Fallback if no year_dfs provided
         for idx, row in apps_df.iterrows():
@@ -1687,7 +1683,7 @@ def generate_student_records(apps_df: pd.DataFrame, census_df: pd.DataFrame, yea
                 "submittedDate": submitted_date,
                 "enrollmentDate": enrollment_date,
             }
-            students.append(student)
+            yield student
     
     # Process census records - all years (use Final Census for historical)
     census_all = load_census_data_all_semesters()
@@ -1759,9 +1755,12 @@ def generate_student_records(apps_df: pd.DataFrame, census_df: pd.DataFrame, yea
                 if 'Census_1_CORPORATE_STUDENT_COMPANY' in row.index and pd.notna(row.get('Census_1_CORPORATE_STUDENT_COMPANY')):
                     student["company"] = standardize_company_name(str(row['Census_1_CORPORATE_STUDENT_COMPANY']))
                 
-                students.append(student)
-    
-    return students
+                yield student
+
+
+def generate_student_records(apps_df: pd.DataFrame, census_df: pd.DataFrame, year_dfs: Dict = None) -> List[Dict]:
+    """Student-level records as a list (see iter_student_records)."""
+    return list(iter_student_records(apps_df, census_df, year_dfs))
 
 
 def generate_summaries(apps_df: pd.DataFrame, census_df: pd.DataFrame, year_dfs: Dict) -> Dict:
@@ -1816,10 +1815,77 @@ def generate_summaries(apps_df: pd.DataFrame, census_df: pd.DataFrame, year_dfs:
     return summaries
 
 
+TIMELINE_YEAR_KEYS = ('two_years_ago', 'previous', 'current')
+
+
+def _timeline_events(year_dfs: Dict, date_col: str, enrolled_only: bool = False) -> pd.DataFrame:
+    """
+    One row per dated application (or enrollment) across all years.
+
+    Dates are parsed once per column and stored as integer days since
+    1970-01-01, so every later binning step is integer arithmetic.
+    """
+    frames = []
+    for year_key in TIMELINE_YEAR_KEYS:
+        df = year_dfs.get(year_key)
+        if df is None or df.empty or date_col not in df.columns:
+            continue
+        if enrolled_only:
+            if 'Enrolled' not in df.columns:
+                continue
+            df = df[df['Enrolled'] == 'yes']
+        dates = pd.to_datetime(df[date_col], errors='coerce', format='mixed')
+        ok = dates.notna().to_numpy()
+        if not ok.any():
+            continue
+        category = df['Application Category'] if 'Application Category' in df.columns else pd.Series('', index=df.index)
+        frames.append(pd.DataFrame({
+            'day': dates[ok].to_numpy().astype('datetime64[D]').astype(np.int64),
+            'category': category[ok].fillna('').astype(str).str.replace('Stevens Online (', '', regex=False)
+                                   .str.replace(')', '', regex=False).to_numpy(),
+        }))
+    if not frames:
+        return pd.DataFrame(columns=['day', 'category', 'week', 'month'])
+    events = pd.concat(frames, ignore_index=True)
+    # 1970-01-01 was a Thursday: (day + 3) % 7 is days since Monday
+    events['week'] = events['day'] - (events['day'] + 3) % 7
+    events['month'] = events['day'].to_numpy().astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+    return events
+
+
+def _day_labels(days) -> List[str]:
+    return np.datetime_as_string(np.asarray(days, dtype=np.int64).astype('datetime64[D]'), unit='D').tolist()
+
+
+def _month_labels(months) -> List[str]:
+    return np.datetime_as_string(np.asarray(months, dtype=np.int64).astype('datetime64[M]'), unit='M').tolist()
+
+
+def _count_series(keys: pd.Series, labels) -> List[Dict]:
+    values, counts = np.unique(keys.to_numpy(), return_counts=True)
+    return [{'date': d, 'count': int(c)} for d, c in zip(labels(values), counts)]
+
+
+def _timeline_section(events: pd.DataFrame) -> Dict:
+    """Daily/weekly/monthly counts and category-by-month."""
+    section = {
+        "byDay": _count_series(events['day'], _day_labels),
+        "byWeek": _count_series(events['week'], _day_labels),
+        "byMonth": _count_series(events['month'], _month_labels),
+    }
+    
+    cat_monthly = pd.crosstab(events['month'], events['category'])
+    section["byCategoryMonth"] = [
+        {'date': label, **{cat: int(n) for cat, n in zip(cat_monthly.columns, row)}}
+        for label, row in zip(_month_labels(cat_monthly.index), cat_monthly.to_numpy())
+    ]
+    return section
+
+
 def generate_timeline_data(year_dfs: Dict) -> Dict:
     """
     Generate time-series data for applications and enrollments by date.
-    Aggregates by week and month for charting.
+    Aggregates by day, ISO week (Monday start) and month for charting.
     """
     timeline = {
         "applications": {
@@ -1838,117 +1904,19 @@ def generate_timeline_data(year_dfs: Dict) -> Dict:
         }
     }
     
-    # Collect all application dates from all years
-    app_dates = []
-    enroll_dates = []
+    app_events = _timeline_events(year_dfs, 'Submitted')
+    enroll_events = _timeline_events(year_dfs, 'Date of Enrollment', enrolled_only=True)
     
-    for year_key in ['two_years_ago', 'previous', 'current']:
-        df = year_dfs.get(year_key)
-        if df is None or df.empty:
+    all_days = []
+    for key, events in (('applications', app_events), ('enrollments', enroll_events)):
+        if events.empty:
             continue
-        
-        # Get application submission dates
-        if 'Submitted' in df.columns:
-            for _, row in df.iterrows():
-                date_str = parse_date_safely(row.get('Submitted'))
-                if date_str:
-                    category = str(row.get('Application Category', '')).replace('Stevens Online (', '').replace(')', '')
-                    degree_type = str(row.get('Degree Type', ''))
-                    app_dates.append({
-                        'date': date_str,
-                        'category': category,
-                        'degreeType': degree_type,
-                    })
-        
-        # Get enrollment dates
-        if 'Date of Enrollment' in df.columns:
-            for _, row in df.iterrows():
-                if row.get('Enrolled') == 'yes':
-                    date_str = parse_date_safely(row.get('Date of Enrollment'))
-                    if date_str:
-                        category = str(row.get('Application Category', '')).replace('Stevens Online (', '').replace(')', '')
-                        degree_type = str(row.get('Degree Type', ''))
-                        enroll_dates.append({
-                            'date': date_str,
-                            'category': category,
-                            'degreeType': degree_type,
-                        })
-    
-    if not app_dates and not enroll_dates:
-        return timeline
-    
-    # Convert to DataFrames for aggregation
-    if app_dates:
-        app_df = pd.DataFrame(app_dates)
-        app_df['date'] = pd.to_datetime(app_df['date'])
-        
-        # By day
-        daily_apps = app_df.groupby(app_df['date'].dt.strftime('%Y-%m-%d')).size().reset_index()
-        daily_apps.columns = ['date', 'count']
-        timeline['applications']['byDay'] = daily_apps.to_dict('records')
-        
-        # By week
-        weekly_apps = app_df.groupby(app_df['date'].dt.to_period('W').apply(lambda r: r.start_time.strftime('%Y-%m-%d'))).size().reset_index()
-        weekly_apps.columns = ['date', 'count']
-        timeline['applications']['byWeek'] = weekly_apps.to_dict('records')
-        
-        # By month
-        monthly_apps = app_df.groupby(app_df['date'].dt.strftime('%Y-%m')).size().reset_index()
-        monthly_apps.columns = ['date', 'count']
-        timeline['applications']['byMonth'] = monthly_apps.to_dict('records')
-        
-        # By category and month
-        cat_monthly = app_df.groupby([app_df['date'].dt.strftime('%Y-%m'), 'category']).size().unstack(fill_value=0)
-        timeline['applications']['byCategoryMonth'] = []
-        for date_str in cat_monthly.index:
-            row = {'date': date_str}
-            for cat in cat_monthly.columns:
-                row[cat] = int(cat_monthly.loc[date_str, cat])
-            timeline['applications']['byCategoryMonth'].append(row)
-        
-        timeline['dateRange']['minDate'] = app_df['date'].min().strftime('%Y-%m-%d')
-        timeline['dateRange']['maxDate'] = app_df['date'].max().strftime('%Y-%m-%d')
+        timeline[key] = _timeline_section(events)
+        all_days.extend([events['day'].min(), events['day'].max()])
     
-    if enroll_dates:
-        enroll_df = pd.DataFrame(enroll_dates)
-        enroll_df['date'] = pd.to_datetime(enroll_df['date'])
-        
-        # By day
-        daily_enroll = enroll_df.groupby(enroll_df['date'].dt.strftime('%Y-%m-%d')).size().reset_index()
-        daily_enroll.columns = ['date', 'count']
-        timeline['enrollments']['byDay'] = daily_enroll.to_dict('records')
-        
-        # By week
-        weekly_enroll = enroll_df.groupby(enroll_df['date'].dt.to_period('W').apply(lambda r: r.start_time.strftime('%Y-%m-%d'))).size().reset_index()
-        weekly_enroll.columns = ['date', 'count']
-        timeline['enrollments']['byWeek'] = weekly_enroll.to_dict('records')
-        
-        # By month
-        monthly_enroll = enroll_df.groupby(enroll_df['date'].dt.strftime('%Y-%m')).size().reset_index()
-        monthly_enroll.columns = ['date', 'count']
-        timeline['enrollments']['byMonth'] = monthly_enroll.to_dict('records')
-        
-        # By category and month
-        cat_monthly = enroll_df.groupby([enroll_df['date'].dt.strftime('%Y-%m'), 'category']).size().unstack(fill_value=0)
-        timeline['enrollments']['byCategoryMonth'] = []
-        for date_str in cat_monthly.index:
-            row = {'date': date_str}
-            for cat in cat_monthly.columns:
-                row[cat] = int(cat_monthly.loc[date_str, cat])
-            timeline['enrollments']['byCategoryMonth'].append(row)
-        
-        # Update date range
-        if timeline['dateRange']['minDate']:
-            min_date = min(pd.to_datetime(timeline['dateRange']['minDate']), enroll_df['date'].min())
-            timeline['dateRange']['minDate'] = min_date.strftime('%Y-%m-%d')
-        else:
-            timeline['dateRange']['minDate'] = enroll_df['date'].min().strftime('%Y-%m-%d')
-        
-        if timeline['dateRange']['maxDate']:
-            max_date = max(pd.to_datetime(timeline['dateRange']['maxDate']), enroll_df['date'].max())
-            timeline['dateRange']['maxDate'] = max_date.strftime('%Y-%m-%d')
-        else:
-            timeline['dateRange']['maxDate'] = enroll_df['date'].max().strftime('%Y-%m-%d')
+    if all_days:
+        timeline['dateRange']['minDate'] = _day_labels([min(all_days)])[0]
+        timeline['dateRange']['maxDate'] = _day_labels([max(all_days)])[0]
     
     return timeline
 
@@ -2109,31 +2077,200 @@ def generate_kpis(funnel: List[Dict], ntr: Dict, prev_funnel: List[Dict] = None)
 
 
 # ============================================================================
-# MAIN PROCESSING FUNCTION
+# STREAMING JSON OUTPUT
 # ============================================================================
 
-def process_data():
-    """Main data processing function."""
-    print("=" * 60)
-    print("Project Iris - Data Processing Pipeline (Real Data)")
-    print("=" * 60)
-    
-    # Load raw data
-    print("\n[1/5] Loading data sources...")
-    slate_df = load_slate_data()
-    apps_df = load_apps_data()
-    census_df = load_census_data()
-    
-    # Use apps_df if available, otherwise slate_df
-    raw_df = apps_df if apps_df is not None else slate_df
-    
-    if raw_df is None:
-        print("ERROR: No application data found!")
+def _json_default(obj):
+    """Encode NumPy and pandas scalars and dates, which the stdlib encoder rejects."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return None if np.isnan(obj) else float(obj)
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if obj is pd.NaT or obj is pd.NA:
         return None
-    
-    # Process application data
-    print("\n[2/5] Processing application data...")
-    
+    if isinstance(obj, (datetime, date)):  # includes pd.Timestamp
+        return obj.isoformat()
+    if isinstance(obj, np.datetime64):
+        return None if np.isnat(obj) else str(np.datetime_as_string(obj))
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONStreamWriter:
+    """
+    Write a JSON object one member at a time.
+
+    List and generator members are written item by item, so a large array
+    never has to exist in memory as one encoded string (or, from a
+    generator, at all).  ``indent=None`` is the compact production format
+    and uses the C encoder; ``indent=2`` matches ``json.dump(indent=2)``.
+    Output goes to a temp file that replaces ``path`` only on success.
+    """
+
+    def __init__(self, path: Path, indent: Optional[int] = 2):
+        self.path = Path(path)
+        self.indent = indent
+        self._tmp = self.path.with_name(f".{self.path.name}.tmp")
+        self._encoder = json.JSONEncoder(
+            default=_json_default,
+            check_circular=False,
+            indent=indent,
+            separators=(',', ': ') if indent else (',', ':'),
+        )
+        self._colon = ': ' if indent else ':'
+        self._members = 0
+        self._file = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp, "w", encoding="utf-8")
+        self._file.write("{")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._file.write(self._newline(0) + "}" if self._members else "}")
+            self._file.close()
+            os.replace(self._tmp, self.path)
+        else:
+            self._file.close()
+            self._tmp.unlink(missing_ok=True)
+        return False
+
+    def _newline(self, depth: int) -> str:
+        return "\n" + " " * (self.indent * depth) if self.indent else ""
+
+    def _encode(self, value, depth: int) -> str:
+        text = self._encoder.encode(value)
+        # Encoded strings never contain raw newlines, so this only re-indents structure
+        return text.replace("\n", self._newline(depth)) if self.indent else text
+
+    def write(self, key: str, value) -> int:
+        """Write one member; returns the item count for arrays, else 0."""
+        self._file.write(("," if self._members else "") + self._newline(1) + json.dumps(key) + self._colon)
+        self._members += 1
+        if not isinstance(value, (list, tuple, GeneratorType)):
+            self._file.write(self._encode(value, 1))
+            return 0
+        self._file.write("[")
+        count = 0
+        for item in value:
+            self._file.write(("," if count else "") + self._newline(2) + self._encode(item, 2))
+            count += 1
+        self._file.write((self._newline(1) if count else "") + "]")
+        return count
+
+
+# ============================================================================
+# BUILD MANIFEST (skip stages whose inputs have not changed)
+# ============================================================================
+
+BUILD_CACHE_DIR = PROJECT_DIR / ".cache" / "build"
+MANIFEST_PATH = BUILD_CACHE_DIR / "manifest.json"
+# Code the stage outputs depend on: any edit invalidates every stage
+CODE_FILES = [Path(__file__).resolve()] + [
+    PARENT_DIR / name for name in ("graduation.py", "forecasting.py", "pace.py", "analytics.py", "utils/formatting.py")
+]
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of a file's contents (16 hex chars), or '' if it does not exist."""
+    if not path.exists():
+        return ""
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:16]
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class BuildManifest:
+    """
+    Input digests and per-stage output digests from the last build.
+
+    A stage is rebuilt only when its key (code digest plus the digests of
+    the inputs it reads) differs from the manifest; otherwise its cached
+    output in BUILD_CACHE_DIR is reused without loading any data.
+    """
+
+    def __init__(self, path: Path = MANIFEST_PATH, force: bool = False):
+        self.path = path
+        self.previous: Dict = {}
+        if path.exists() and not force:
+            try:
+                self.previous = json.loads(path.read_text())
+            except Exception as e:
+                print(f"Warning: ignoring unreadable build manifest: {e}")
+        self.code = _digest("|".join(file_digest(p) for p in CODE_FILES))
+        self.stages: Dict[str, Dict] = {}
+        self.built: List[str] = []
+
+    def _key(self, inputs: Dict[str, str]) -> str:
+        return _digest(self.code + "|" + "|".join(f"{k}={v}" for k, v in sorted(inputs.items())))
+
+    def stage(self, name: str, inputs, build) -> Path:
+        """
+        Path of stage ``name``'s output (one JSON object), rebuilt with
+        ``build()`` only if ``inputs()`` (name -> digest) changed since the
+        last build.  Generator values in the built dict are streamed to disk.
+        """
+        out_path = self.path.parent / f"{name}.json"
+        prev = self.previous.get("stages", {}).get(name, {})
+        key = self._key(inputs())
+        if prev.get("key") == key and file_digest(out_path) == prev.get("output"):
+            print(f"   {name}: unchanged, reusing {out_path.name}")
+            self.stages[name] = prev
+            return out_path
+
+        print(f"   {name}: building...")
+        with JSONStreamWriter(out_path, indent=None) as out:
+            for member, value in build().items():
+                out.write(member, value)
+        self.stages[name] = {"key": key, "output": file_digest(out_path)}
+        self.built.append(name)
+        return out_path
+
+    def output_key(self, mode: str) -> str:
+        """Digest of everything dashboard.json is built from (except lastUpdated)."""
+        stages = "|".join(f"{k}={v['output']}" for k, v in sorted(self.stages.items()))
+        return _digest(f"{self.code}|{mode}|{stages}")
+
+    def output_unchanged(self, output_path: Path, mode: str) -> bool:
+        prev = self.previous.get("output", {})
+        return prev.get("key") == self.output_key(mode) and file_digest(output_path) == prev.get("file")
+
+    def save(self, output_path: Path, mode: str):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({
+            "code": self.code,
+            "stages": self.stages,
+            "output": {"key": self.output_key(mode), "file": file_digest(output_path)},
+            "builtAt": datetime.utcnow().isoformat() + "Z",
+        }, indent=2))
+
+
+# ============================================================================
+# BUILD STAGES
+# ============================================================================
+
+def apps_input_path() -> Optional[Path]:
+    """Applications source: the Excel snapshot if present, else the Slate CSV."""
+    for name in ("apps_latest.xlsx", "slate_latest.csv"):
+        path = SNAPSHOT_DIR / name
+        if path.exists():
+            return path
+    return None
+
+
+def build_year_dfs(raw_df: pd.DataFrame) -> Dict:
+    """Split raw application data into standardized frames per cycle."""
     year_dfs = {
         'current': None,
         'previous': None,
@@ -2175,60 +2312,11 @@ def process_data():
         raw_df = derive_yoy_status_from_enrollment_date(raw_df)
         year_dfs['current'] = transform_application_data(raw_df, source='MAIN')
     
-    current_df = year_dfs['current']
-    
-    # Calculate metrics
-    print("\n[3/5] Calculating metrics...")
-    print("   Using Slate for: Applications, Admits, Accepted")
-    print("   Using Census for: Enrolled, NTR, Graduation, Demographics")
-    
-    # Basic funnel (hybrid: Slate for apps/admits/accepted, Census for enrolled)
-    funnel = calculate_funnel_metrics_hybrid(current_df, census_df)
-    prev_funnel = calculate_funnel_metrics_hybrid(year_dfs['previous'], None) if year_dfs['previous'] is not None else None
-    
-    # Funnel by category (hybrid)
-    funnel_by_category = calculate_funnel_by_category_hybrid(current_df, census_df)
-    
-    # Category and program metrics (hybrid)
-    categories = calculate_category_metrics_hybrid(current_df, census_df)
-    programs_top = calculate_program_metrics_hybrid(current_df, census_df, year_dfs, limit=15)
-    programs_all = calculate_program_metrics_hybrid(current_df, census_df, year_dfs)  # All programs for drill-down
-    
-    # Corporate cohorts
-    cohorts = calculate_cohort_metrics(current_df, census_df)
-    
-    # NTR metrics (enhanced)
-    ntr = calculate_ntr_metrics(census_df)
-    
-    # Enrollment breakdown
-    enrollment_breakdown = calculate_enrollment_breakdown(census_df)
-    
-    # Graduation tracking
-    graduation = calculate_graduation_metrics(census_df)
-    
-    # Demographics
-    demographics = calculate_demographics(census_df)
-    
-    # YoY metrics from Slate (new student pipeline)
-    yoy_slate = calculate_yoy_metrics(year_dfs)
-    
-    # YoY metrics from Census (overall enrollment)
-    yoy_census = calculate_census_yoy_metrics()
-    print(f"   Census YoY: 2024={yoy_census.get('stats', {}).get('2024', {}).get('total', 0)}, 2025={yoy_census.get('stats', {}).get('2025', {}).get('total', 0)}, 2026={yoy_census.get('stats', {}).get('2026', {}).get('total', 0)}")
-    
-    # School and degree breakdowns (from Census)
-    by_school = calculate_school_metrics_from_census(census_df)
-    by_degree = calculate_degree_metrics_from_census(census_df)
-    
-    # Filter options for drill-down
-    filters = generate_filter_options(current_df, census_df)
-    
-    # Generate derived data
-    print("\n[4/5] Generating insights...")
-    kpis = generate_kpis(funnel, ntr, prev_funnel)
-    insights = generate_insights(programs_top, categories)
-    alerts = generate_alerts(funnel, ntr, categories)
-    
+    return year_dfs
+
+
+def build_apps_stage(year_dfs: Dict) -> Dict:
+    """Outputs that depend on application data only."""
     # Historical data - NEW STUDENTS (from Slate pipeline)
     historical_new_students = {
         "years": ["2024", "2025", "2026"],
@@ -2258,112 +2346,237 @@ def process_data():
             historical_new_students['enrollments'].append(0)
             historical_new_students['yields'].append(0)
     
-    # Historical data - OVERALL ENROLLMENT (from Census)
-    historical_census = yoy_census
+    # Generate timeline data for time-series charts
+    print("   Generating timeline data...")
+    timeline = generate_timeline_data(year_dfs)
+    print(f"   Timeline: {len(timeline['applications']['byMonth'])} months of apps, {len(timeline['enrollments']['byMonth'])} months of enrollments")
     
-    # CPC Rates reference table for frontend
-    cpc_reference = []
-    for key, rate in CPC_RATES.items():
-        cat, degree, student_type = key
-        cpc_reference.append({
-            "category": cat.replace('Stevens Online (', '').replace(')', ''),
-            "degreeType": degree,
-            "studentType": student_type,
-            "rate": rate,
-        })
+    # Forecast ranges (NTR is recomputed with census credit/CPC averages when writing)
+    forecast = generate_forecast(year_dfs)
+    if forecast:
+        print(f"   Forecast: {forecast['metrics']['apps']['mid']} apps (mid), "
+              f"{len(forecast['byCategory'])} categories, {len(forecast['byProgram'])} programs")
     
-    # Generate student-level records for client-side filtering (all years)
-    print("   Generating student-level records (all years)...")
-    students = generate_student_records(current_df, census_df, year_dfs)
-    print(f"   Generated {len(students)} student records")
+    return {
+        "prevFunnel": calculate_funnel_metrics_hybrid(year_dfs['previous'], None) if year_dfs['previous'] is not None else None,
+        "yoy": calculate_yoy_metrics(year_dfs),  # From Slate (new student pipeline)
+        "historicalNewStudents": historical_new_students,
+        # Generate historical data by category for projections
+        "historicalByCategory": generate_historical_by_category(year_dfs),
+        "timeline": timeline,
+        "forecast": forecast,
+    }
+
+
+def build_census_stage(census_df: Optional[pd.DataFrame]) -> Dict:
+    """Outputs that depend on census data only."""
+    # YoY metrics from Census (overall enrollment)
+    yoy_census = calculate_census_yoy_metrics()
+    print(f"   Census YoY: 2024={yoy_census.get('stats', {}).get('2024', {}).get('total', 0)}, 2025={yoy_census.get('stats', {}).get('2025', {}).get('total', 0)}, 2026={yoy_census.get('stats', {}).get('2026', {}).get('total', 0)}")
     
-    # Generate pre-aggregated summaries
-    summaries = generate_summaries(current_df, census_df, year_dfs)
+    return {
+        "ntr": calculate_ntr_metrics(census_df),  # NTR metrics (enhanced)
+        "enrollmentBreakdown": calculate_enrollment_breakdown(census_df),
+        "graduation": calculate_graduation_metrics(census_df),
+        "demographics": calculate_demographics(census_df),
+        "yoyCensus": yoy_census,
+        # School and degree breakdowns (from Census)
+        "bySchool": calculate_school_metrics_from_census(census_df),
+        "byDegree": calculate_degree_metrics_from_census(census_df),
+    }
+
+
+def build_combined_stage(year_dfs: Dict, census_df: Optional[pd.DataFrame]) -> Dict:
+    """Outputs that join application and census data."""
+    current_df = year_dfs['current']
     
-    # Generate historical data by category for projections
-    historical_by_category = generate_historical_by_category(year_dfs)
+    print("   Using Slate for: Applications, Admits, Accepted")
+    print("   Using Census for: Enrolled, NTR, Graduation, Demographics")
     
-    # Generate timeline data for time-series charts
-    print("   Generating timeline data...")
-    timeline = generate_timeline_data(year_dfs)
-    print(f"   Timeline: {len(timeline['applications']['byMonth'])} months of apps, {len(timeline['enrollments']['byMonth'])} months of enrollments")
+    programs_all = calculate_program_metrics_hybrid(current_df, census_df, year_dfs)  # All programs for drill-down
     
-    # Build dashboard data structure
-    dashboard_data = {
-        # Metadata
-        "lastUpdated": datetime.utcnow().isoformat() + "Z",
-        "semester": "2026S",
-        
-        # Student-level data for filtering
-        "students": students,
-        
-        # Pre-aggregated summaries for fast load
-        "summaries": summaries,
-        
-        # Legacy data structures (for backward compatibility)
-        "kpis": kpis,
-        "funnel": funnel,
-        "funnelByCategory": funnel_by_category,
-        "categories": categories,
-        "programs": programs_top,
+    return {
+        # Basic funnel (hybrid: Slate for apps/admits/accepted, Census for enrolled)
+        "funnel": calculate_funnel_metrics_hybrid(current_df, census_df),
+        "funnelByCategory": calculate_funnel_by_category_hybrid(current_df, census_df),
+        "categories": calculate_category_metrics_hybrid(current_df, census_df),
+        "programs": programs_all[:15],
         "programsAll": programs_all,
-        "cohorts": cohorts,
-        "ntr": ntr,
-        
-        # YoY Data - Separated by source
-        "historicalNewStudents": historical_new_students,  # From Slate (new student pipeline)
-        "historicalCensus": historical_census,              # From Census (overall enrollment)
-        "historical": historical_new_students,              # Backward compat - alias to new students
-        "historicalByCategory": historical_by_category,
-        "timeline": timeline,
-        
-        "enrollmentBreakdown": enrollment_breakdown,
-        "graduation": graduation,
-        "demographics": demographics,
-        "yoy": yoy_slate,           # From Slate (new student pipeline)
-        "yoyCensus": yoy_census,    # From Census (overall enrollment)
-        "bySchool": by_school,
-        "byDegree": by_degree,
-        "filters": filters,
-        "cpcRates": cpc_reference,
-        "alerts": alerts,
-        "insights": insights,
+        "cohorts": calculate_cohort_metrics(current_df, census_df),
+        # Filter options for drill-down
+        "filters": generate_filter_options(current_df, census_df),
+        # Pre-aggregated summaries for fast load
+        "summaries": generate_summaries(current_df, census_df, year_dfs),
+        # Student-level records for client-side filtering (all years), streamed to disk
+        "students": iter_student_records(current_df, census_df, year_dfs),
     }
+
+
+# ============================================================================
+# MAIN PROCESSING FUNCTION
+# ============================================================================
+
+# Stage members used for derived data and the build summary, and members
+# that are only inputs to derived data (not written to dashboard.json)
+STAGE_KEPT_KEYS = {"funnel", "categories", "programs", "filters", "ntr", "graduation", "yoyCensus", "yoy", "prevFunnel",
+                   "forecast"}
+STAGE_INTERNAL_KEYS = {"prevFunnel", "forecast"}
+
+
+def process_data(force: bool = False, compact: bool = False) -> Optional[Path]:
+    """
+    Main data processing function.
+
+    Returns the path of dashboard.json, or None if there is no application data.
+    """
+    print("=" * 60)
+    print("Project Iris - Data Processing Pipeline (Real Data)")
+    print("=" * 60)
+    
+    # Inputs are loaded on first use, so stages reused from the manifest never read them
+    loaded: Dict = {}
+    
+    def year_dfs() -> Dict:
+        if 'year_dfs' not in loaded:
+            print("\n   Loading application data...")
+            slate_df = load_slate_data()
+            apps_df = load_apps_data()
+            # Use apps_df if available, otherwise slate_df
+            raw_df = apps_df if apps_df is not None else slate_df
+            if raw_df is None:
+                raise RuntimeError("No application data could be loaded")
+            loaded['year_dfs'] = build_year_dfs(raw_df)
+        return loaded['year_dfs']
+    
+    def census_df() -> Optional[pd.DataFrame]:
+        if 'census_df' not in loaded:
+            print("\n   Loading census data...")
+            loaded['census_df'] = load_census_data()
+        return loaded['census_df']
+    
+    apps_path = apps_input_path()
+    if apps_path is None:
+        print("ERROR: No application data found!")
+        return None
     
-    # Ensure output directory exists
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    def apps_inputs() -> Dict[str, str]:
+        return {apps_path.name: file_digest(apps_path)}
     
-    # Write JSON output
-    print("\n[5/5] Writing output...")
-    output_path = OUTPUT_DIR / "dashboard.json"
-    with open(output_path, "w") as f:
-        json.dump(dashboard_data, f, indent=2)
+    def census_inputs() -> Dict[str, str]:
+        return {"census_latest.csv": file_digest(SNAPSHOT_DIR / "census_latest.csv")}
+    
+    def combined_inputs() -> Dict[str, str]:
+        return {**apps_inputs(), **census_inputs(), PROGRAM_CROSSWALK_OVERRIDES_PATH.name: file_digest(PROGRAM_CROSSWALK_OVERRIDES_PATH)}
+    
+    manifest = BuildManifest(force=force)
     
+    print("\n[1/4] Application stage...")
+    apps_stage = manifest.stage("apps", apps_inputs, lambda: build_apps_stage(year_dfs()))
+    
+    print("\n[2/4] Census stage...")
+    census_stage = manifest.stage("census", census_inputs, lambda: build_census_stage(census_df()))
+    
+    print("\n[3/4] Combined stage...")
+    combined_stage = manifest.stage("combined", combined_inputs, lambda: build_combined_stage(year_dfs(), census_df()))
+    loaded.clear()  # release the source frames before writing
+    
+    # Skip the write when nothing dashboard.json is built from has changed
+    output_path = OUTPUT_DIR / "dashboard.json"
+    mode = "compact" if compact else "indent2"
+    if manifest.output_unchanged(output_path, mode):
+        manifest.save(output_path, mode)
+        print(f"\n{'=' * 60}")
+        print("SUCCESS: No input changes; dashboard data is up to date:")
+        print(f"   {output_path}")
+        print(f"{'=' * 60}")
+        return output_path
+    
+    # Write JSON output one stage at a time, so peak memory is one stage's
+    # data rather than the whole dashboard
+    print("\n[4/4] Writing output...")
+    kept: Dict = {}
+    sizes: Dict[str, int] = {}
+    with JSONStreamWriter(output_path, indent=None if compact else 2) as out:
+        # Metadata
+        out.write("lastUpdated", datetime.utcnow().isoformat() + "Z")
+        out.write("semester", "2026S")
+        
+        for stage_path, aliases in (
+            (combined_stage, {}),
+            (census_stage, {"yoyCensus": "historicalCensus"}),             # From Census (overall enrollment)
+            (apps_stage, {"historicalNewStudents": "historical"}),         # Backward compat - alias to new students
+        ):
+            with open(stage_path) as f:
+                stage = json.load(f)
+            for key, value in stage.items():
+                if key in STAGE_KEPT_KEYS:
+                    kept[key] = value
+                if key in STAGE_INTERNAL_KEYS:
+                    continue
+                sizes[key] = len(value) if isinstance(value, (list, dict)) else 0
+                out.write(key, value)
+                if key in aliases:
+                    out.write(aliases[key], value)
+            del stage
+        
+        # Derived data
+        funnel, ntr = kept["funnel"], kept["ntr"]
+        kpis = generate_kpis(funnel, ntr, kept["prevFunnel"])
+        out.write("kpis", kpis)
+        out.write("cpcRates", [
+            # CPC Rates reference table for frontend
+            {
+                "category": cat.replace('Stevens Online (', '').replace(')', ''),
+                "degreeType": degree,
+                "studentType": student_type,
+                "rate": rate,
+            }
+            for (cat, degree, student_type), rate in CPC_RATES.items()
+        ])
+        alerts = generate_alerts(funnel, ntr, kept["categories"])
+        out.write("alerts", alerts)
+        out.write("insights", generate_insights(kept["programs"], kept["categories"]))
+        # Same credit/CPC averages as useForecast.ts
+        avg_credits = ntr["totalCredits"] / ntr["totalStudents"] if ntr.get("totalStudents") else 6
+        avg_cpc = ntr["total"] / ntr["totalCredits"] if ntr.get("totalCredits") else 1650
+        out.write("forecast", apply_ntr(kept["forecast"], avg_credits, avg_cpc))
+    manifest.save(output_path, mode)
+    
+    graduation = kept["graduation"]
+    yoy_census = kept["yoyCensus"]
     print(f"\n{'=' * 60}")
     print("SUCCESS: Dashboard data written to:")
-    print(f"   {output_path}")
-    print(f"\n   Student Records: {len(students)} (for client-side filtering)")
+    print(f"   {output_path} ({output_path.stat().st_size / 1e6:.1f} MB, {mode})")
+    print(f"   Rebuilt stages: {', '.join(manifest.built) or 'none'}")
+    print(f"\n   Student Records: {sizes['students']} (for client-side filtering)")
     print(f"   KPIs: {len(kpis)} metrics")
     print(f"   Funnel: {funnel}")
-    print(f"   Categories: {len(categories)}")
-    print(f"   Programs (top): {len(programs_top)}")
-    print(f"   Programs (all): {len(programs_all)}")
-    print(f"   Cohorts: {len(cohorts)}")
+    print(f"   Categories: {sizes['categories']}")
+    print(f"   Programs (top): {sizes['programs']}")
+    print(f"   Programs (all): {sizes['programsAll']}")
+    print(f"   Cohorts: {sizes['cohorts']}")
     print(f"   NTR Total: ${ntr['total']:,} ({ntr['percentOfGoal']}% of goal)")
     print(f"   NTR Breakdown rows: {len(ntr['breakdown'])}")
     print(f"   Graduation: {graduation['graduatingThisTerm']} graduating this term")
     print(f"   Graduation by Category: {len(graduation.get('byCategory', []))} categories")
-    print(f"   Historical by Category: {len(historical_by_category)} categories")
-    print(f"   YoY (Slate) Apps: {yoy_slate['vsLastYear']['appsChange']}%")
+    print(f"   Historical by Category: {sizes['historicalByCategory']} categories")
+    print(f"   YoY (Slate) Apps: {kept['yoy']['vsLastYear']['appsChange']}%")
     print(f"   YoY (Census) Total: {yoy_census.get('changes', {}).get('totalVs2025', 0)}%")
-    print(f"   By School: {len(by_school)}")
-    print(f"   By Degree: {len(by_degree)}")
-    print(f"   Filter Programs: {len(filters['programs'])}")
+    print(f"   By School: {sizes['bySchool']}")
+    print(f"   By Degree: {sizes['byDegree']}")
+    print(f"   Filter Programs: {len(kept['filters']['programs'])}")
     print(f"   Alerts: {len(alerts)}")
     print(f"{'=' * 60}")
     
-    return dashboard_data
+    return output_path
 
 
 if __name__ == "__main__":
-    process_data()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Build public/data/dashboard.json")
+    parser.add_argument("--force", action="store_true", help="Rebuild every stage, ignoring the build manifest")
+    parser.add_argument("--compact", action="store_true",
+                        help="Write compact (non-indented) JSON for production; smaller and faster to build")
+    args = parser.parse_args()
+    process_data(force=args.force, compact=args.compact)
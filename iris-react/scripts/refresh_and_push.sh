@@ -5,11 +5,15 @@
 # This script:
 # 1. Refreshes data from source files (using parent project's refresh)
 # 2. Processes data into JSON format for React app
+#    (stages whose input snapshots are unchanged are reused from
+#    .cache/build; if nothing changed, dashboard.json is left untouched)
 # 3. Commits changes to git
 # 4. Pushes to remote (triggers auto-deploy on Vercel/Netlify)
 #
 # Usage:
-#   ./scripts/refresh_and_push.sh
+#   ./scripts/refresh_and_push.sh              # incremental build
+#   ./scripts/refresh_and_push.sh --force      # rebuild every stage
+#   ./scripts/refresh_and_push.sh --compact    # non-indented dashboard.json
 #
 # Requirements:
 #   - Python 3.8+ with pandas, numpy
@@ -67,8 +71,8 @@ else
     source .venv/bin/activate 2>/dev/null || true
 fi
 
-# Run data processing script
-python3 scripts/process_data.py
+# Run data processing script (extra arguments, e.g. --force, are passed through)
+python3 scripts/process_data.py "$@"
 
 echo ""
 
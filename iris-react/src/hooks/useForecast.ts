@@ -3,6 +3,9 @@
  * 
  * Provides forecast data for applications, admits, enrollments, and NTR
  * with support for filtering by category, degree type, and program.
+ * Without filters the forecast precomputed by process_data.py is used, so
+ * the student records are only scanned when filters are active. Filtered
+ * forecasts are anchored to the same as-of date as the precomputed one.
  */
 
 import { useMemo } from 'react'
@@ -12,12 +15,21 @@ import {
   generateForecast,
   forecastByCategory,
   forecastByProgram,
+  getDataAsOfDate,
   type ForecastMetrics,
   type ForecastParams,
   type CategoryForecast,
   type ProgramForecast,
 } from '@/lib/forecasting'
 
+/**
+ * The unfiltered data's "today" (forecasting.py asOf), so a filter never
+ * moves the forecast's reference date
+ */
+function anchorDate(asOf: string | undefined, students: StudentRecord[]): Date {
+  return asOf ? new Date(asOf) : getDataAsOfDate(students)
+}
+
 /**
  * Main forecast hook - returns overall metrics, params, and dynamic cutoff date
  */
@@ -27,6 +39,16 @@ export function useForecast() {
   const hasFilters = useFilterStore((state) => state.hasActiveFilters())
   
   return useMemo(() => {
+    if (!hasFilters && data?.forecast) {
+      const { metrics, params, cutoffDate } = data.forecast
+      return {
+        metrics,
+        params,
+        cutoffDate: new Date(cutoffDate),
+        isLoading: false,
+      }
+    }
+    
     if (!data?.students) {
       return {
         metrics: null,
@@ -37,6 +59,7 @@ export function useForecast() {
     }
     
     let students = data.students as StudentRecord[]
+    const asOf = anchorDate(data.forecast?.asOf, students)
     
     // Apply filters if active
     if (hasFilters) {
@@ -57,7 +80,7 @@ export function useForecast() {
       ? data.ntr.total / data.ntr.totalCredits
       : 1650
     
-    const { metrics, params, cutoffDate } = generateForecast(students, avgCredits, avgCPC)
+    const { metrics, params, cutoffDate } = generateForecast(students, avgCredits, avgCPC, asOf)
     
     return {
       metrics,
@@ -65,7 +88,7 @@ export function useForecast() {
       cutoffDate,
       isLoading: false,
     }
-  }, [data?.students, data?.ntr, categories, schools, degreeTypes, hasFilters])
+  }, [data?.students, data?.ntr, data?.forecast, categories, schools, degreeTypes, hasFilters])
 }
 
 /**
@@ -77,9 +100,12 @@ export function useForecastByCategory(): CategoryForecast[] {
   const hasFilters = useFilterStore((state) => state.hasActiveFilters())
   
   return useMemo(() => {
+    if (!hasFilters && data?.forecast) return data.forecast.byCategory
+    
     if (!data?.students) return []
     
     let students = data.students as StudentRecord[]
+    const asOf = anchorDate(data.forecast?.asOf, students)
     
     // Apply filters if active
     if (hasFilters) {
@@ -99,8 +125,8 @@ export function useForecastByCategory(): CategoryForecast[] {
       ? data.ntr.total / data.ntr.totalCredits
       : 1650
     
-    return forecastByCategory(students, avgCredits, avgCPC)
-  }, [data?.students, data?.ntr, categories, schools, degreeTypes, hasFilters])
+    return forecastByCategory(students, avgCredits, avgCPC, asOf)
+  }, [data?.students, data?.ntr, data?.forecast, categories, schools, degreeTypes, hasFilters])
 }
 
 /**
@@ -112,9 +138,15 @@ export function useForecastByProgram(limit: number = 20): ProgramForecast[] {
   const hasFilters = useFilterStore((state) => state.hasActiveFilters())
   
   return useMemo(() => {
+    // The precomputed list holds the top 20 programs
+    if (!hasFilters && data?.forecast && limit <= data.forecast.byProgram.length) {
+      return data.forecast.byProgram.slice(0, limit)
+    }
+    
     if (!data?.students) return []
     
     let students = data.students as StudentRecord[]
+    const asOf = anchorDate(data.forecast?.asOf, students)
     
     // Apply filters if active
     if (hasFilters) {
@@ -134,8 +166,8 @@ export function useForecastByProgram(limit: number = 20): ProgramForecast[] {
       ? data.ntr.total / data.ntr.totalCredits
       : 1650
     
-    return forecastByProgram(students, limit, avgCredits, avgCPC)
-  }, [data?.students, data?.ntr, categories, schools, degreeTypes, hasFilters, limit])
+    return forecastByProgram(students, limit, avgCredits, avgCPC, asOf)
+  }, [data?.students, data?.ntr, data?.forecast, categories, schools, degreeTypes, hasFilters, limit])
 }
 
 // Re-export types for convenience
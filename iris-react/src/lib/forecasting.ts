@@ -5,6 +5,9 @@
  * 1. Partial-to-Final Ratio: Compare apps by today's date vs historical finals
  * 2. Weekly Run Rate: Calculate recent apps/week and project to deadline
  * 3. Combined Ranges: Average both methods for Low/Medium/High bands
+ *
+ * "Today" is the data's as-of date (latest current-cycle submission), as in
+ * forecasting.py, so filtered forecasts line up with the precomputed one.
  */
 
 import type { StudentRecord } from '@/store/dataStore'
@@ -61,6 +64,21 @@ export interface ForecastParams {
   partialRatio: number
 }
 
+/**
+ * Forecast precomputed by scripts/process_data.py (forecasting.py) for the
+ * unfiltered dataset; dates are ISO strings
+ */
+export interface PrecomputedForecast {
+  metrics: ForecastMetrics
+  params: ForecastParams
+  cutoffDate: string
+  asOf: string
+  avgCredits: number
+  avgCPC: number
+  byCategory: CategoryForecast[]
+  byProgram: ProgramForecast[]
+}
+
 // ============================================================================
 // Constants
 // ============================================================================
@@ -81,6 +99,14 @@ const MAX_REASONABLE_NTR = 20_000_000  // $20M max for Spring term
 // Core Forecasting Functions
 // ============================================================================
 
+/**
+ * The data's "today": the latest current-cycle submission (the wall clock
+ * only when there is none). Same anchor as forecasting.py's asOf.
+ */
+export function getDataAsOfDate(students: StudentRecord[]): Date {
+  return getLastSubmissionDate(students, FORECAST_YEAR) ?? new Date()
+}
+
 /**
  * Find the last application submission date for a given year
  * Used to dynamically determine the cutoff date for YoY comparisons
@@ -114,13 +140,16 @@ export function getLastSubmissionDate(
  * Based on: Find last submission date from previous year, use equivalent date this year
  * This ensures we're comparing apples to apples across years
  */
-export function getDynamicCutoffDate(students: StudentRecord[]): Date {
+export function getDynamicCutoffDate(
+  students: StudentRecord[],
+  asOf: Date = getDataAsOfDate(students)
+): Date {
   const previousYear = FORECAST_YEAR - 1
   const lastSubmissionPrevYear = getLastSubmissionDate(students, previousYear)
   
   if (!lastSubmissionPrevYear) {
-    // Fallback to today if no previous year data
-    return new Date()
+    // Fallback to the as-of date if no previous year data
+    return asOf
   }
   
   // Create equivalent date for current year
@@ -132,9 +161,8 @@ export function getDynamicCutoffDate(students: StudentRecord[]): Date {
     lastSubmissionPrevYear.getDate()
   )
   
-  // But if today is before the cutoff, use today
-  const today = new Date()
-  return today < cutoffDate ? today : cutoffDate
+  // But if the data's as-of date is before the cutoff, use it
+  return asOf < cutoffDate ? asOf : cutoffDate
 }
 
 /**
@@ -188,10 +216,10 @@ export function calculatePartialRatio(
  */
 export function calculateRunRate(
   students: StudentRecord[],
-  lookbackWeeks: number = LOOKBACK_WEEKS
+  lookbackWeeks: number = LOOKBACK_WEEKS,
+  asOf: Date = getDataAsOfDate(students)
 ): number {
-  const today = new Date()
-  const lookbackStart = new Date(today)
+  const lookbackStart = new Date(asOf)
   lookbackStart.setDate(lookbackStart.getDate() - (lookbackWeeks * 7))
   
   const currentYearStudents = students.filter(s => 
@@ -202,7 +230,7 @@ export function calculateRunRate(
   const recentApps = currentYearStudents.filter(s => {
     if (!s.submittedDate) return false
     const submitted = new Date(s.submittedDate)
-    return submitted >= lookbackStart && submitted <= today
+    return submitted >= lookbackStart && submitted <= asOf
   })
   
   return recentApps.length / lookbackWeeks
@@ -211,9 +239,8 @@ export function calculateRunRate(
 /**
  * Calculate weeks remaining until deadline
  */
-export function calculateWeeksRemaining(deadline: Date = DEFAULT_DEADLINE): number {
-  const today = new Date()
-  const daysRemaining = Math.max(0, (deadline.getTime() - today.getTime()) / (1000 * 60 * 60 * 24))
+export function calculateWeeksRemaining(asOf: Date, deadline: Date = DEFAULT_DEADLINE): number {
+  const daysRemaining = Math.max(0, (deadline.getTime() - asOf.getTime()) / (1000 * 60 * 60 * 24))
   return daysRemaining / 7
 }
 
@@ -297,6 +324,14 @@ function sanitizeNTR(value: number): number {
   return value
 }
 
+/**
+ * NTR for an enrollment count, in whole dollars (no float noise from the
+ * credit/CPC averages)
+ */
+function ntrFor(enrolls: number, ntrPerStudent: number): number {
+  return Math.round(enrolls * ntrPerStudent)
+}
+
 /**
  * Clamp growth multipliers to reasonable bounds
  * Prevents explosive forecasts from bad data
@@ -318,10 +353,11 @@ function clampMultiplier(multiplier: number): number {
 export function generateForecast(
   students: StudentRecord[],
   avgCredits: number = 6,
-  avgCPC: number = 1650
+  avgCPC: number = 1650,
+  asOf: Date = getDataAsOfDate(students)
 ): { metrics: ForecastMetrics; params: ForecastParams; cutoffDate: Date } {
   // Use dynamic cutoff based on previous year's last submission
-  const cutoffDate = getDynamicCutoffDate(students)
+  const cutoffDate = getDynamicCutoffDate(students, asOf)
   
   // Get current year data
   const currentYearSlate = students.filter(s => 
@@ -353,8 +389,8 @@ export function generateForecast(
   
   // Calculate parameters using dynamic cutoff
   const partialRatio = calculatePartialRatio(students, cutoffDate)
-  const runRate = calculateRunRate(students)
-  const weeksRemaining = calculateWeeksRemaining()
+  const runRate = calculateRunRate(students, LOOKBACK_WEEKS, cutoffDate)
+  const weeksRemaining = calculateWeeksRemaining(cutoffDate)
   
   // Calculate forecasts
   const appsForecast = calculateForecastRanges(currentApps, partialRatio, runRate, weeksRemaining)
@@ -380,13 +416,13 @@ export function generateForecast(
   // NTR forecast = enrolls * avg credits * CPC
   // Apply sanity checks to prevent unrealistic values
   const ntrPerStudent = avgCredits * avgCPC
-  const currentNTR = sanitizeNTR(currentEnrolls * ntrPerStudent)
-  const prevNTR = sanitizeNTR(prevEnrolls * ntrPerStudent)
+  const currentNTR = sanitizeNTR(ntrFor(currentEnrolls, ntrPerStudent))
+  const prevNTR = sanitizeNTR(ntrFor(prevEnrolls, ntrPerStudent))
   
   const ntrForecast = {
-    low: sanitizeNTR(enrollsForecast.low * ntrPerStudent),
-    mid: sanitizeNTR(enrollsForecast.mid * ntrPerStudent),
-    high: sanitizeNTR(enrollsForecast.high * ntrPerStudent),
+    low: sanitizeNTR(ntrFor(enrollsForecast.low, ntrPerStudent)),
+    mid: sanitizeNTR(ntrFor(enrollsForecast.mid, ntrPerStudent)),
+    high: sanitizeNTR(ntrFor(enrollsForecast.high, ntrPerStudent)),
   }
   
   const metrics: ForecastMetrics = {
@@ -444,12 +480,12 @@ export function generateForecast(
 export function forecastByCategory(
   students: StudentRecord[],
   avgCredits: number = 6,
-  avgCPC: number = 1650
+  avgCPC: number = 1650,
+  asOf: Date = getDataAsOfDate(students)
 ): CategoryForecast[] {
-  const today = new Date()
-  const partialRatio = calculatePartialRatio(students, today)
-  const runRate = calculateRunRate(students)
-  const weeksRemaining = calculateWeeksRemaining()
+  const partialRatio = calculatePartialRatio(students, asOf)
+  const runRate = calculateRunRate(students, LOOKBACK_WEEKS, asOf)
+  const weeksRemaining = calculateWeeksRemaining(asOf)
   
   // Get unique category/degree combinations
   const currentYearSlate = students.filter(s => 
@@ -545,11 +581,11 @@ export function forecastByCategory(
     entry.enrolls.yoyChange = calculateYoY(entry.enrolls.mid, entry.enrolls.previousYear)
     
     const ntrPerStudent = avgCredits * avgCPC
-    entry.ntr.current = entry.enrolls.current * ntrPerStudent
-    entry.ntr.low = entry.enrolls.low * ntrPerStudent
-    entry.ntr.mid = entry.enrolls.mid * ntrPerStudent
-    entry.ntr.high = entry.enrolls.high * ntrPerStudent
-    entry.ntr.previousYear = entry.enrolls.previousYear * ntrPerStudent
+    entry.ntr.current = ntrFor(entry.enrolls.current, ntrPerStudent)
+    entry.ntr.low = ntrFor(entry.enrolls.low, ntrPerStudent)
+    entry.ntr.mid = ntrFor(entry.enrolls.mid, ntrPerStudent)
+    entry.ntr.high = ntrFor(entry.enrolls.high, ntrPerStudent)
+    entry.ntr.previousYear = ntrFor(entry.enrolls.previousYear, ntrPerStudent)
     entry.ntr.yoyChange = calculateYoY(entry.ntr.mid, entry.ntr.previousYear)
   })
   
@@ -565,12 +601,12 @@ export function forecastByProgram(
   students: StudentRecord[],
   limit: number = 20,
   avgCredits: number = 6,
-  avgCPC: number = 1650
+  avgCPC: number = 1650,
+  asOf: Date = getDataAsOfDate(students)
 ): ProgramForecast[] {
-  const today = new Date()
-  const partialRatio = calculatePartialRatio(students, today)
-  const runRate = calculateRunRate(students)
-  const weeksRemaining = calculateWeeksRemaining()
+  const partialRatio = calculatePartialRatio(students, asOf)
+  const runRate = calculateRunRate(students, LOOKBACK_WEEKS, asOf)
+  const weeksRemaining = calculateWeeksRemaining(asOf)
   
   const currentYearSlate = students.filter(s => 
     s.source === 'slate' && s.year === String(FORECAST_YEAR)
@@ -653,11 +689,11 @@ export function forecastByProgram(
     entry.enrolls.yoyChange = calculateYoY(entry.enrolls.mid, entry.enrolls.previousYear)
     
     const ntrPerStudent = avgCredits * avgCPC
-    entry.ntr.current = entry.enrolls.current * ntrPerStudent
-    entry.ntr.low = entry.enrolls.low * ntrPerStudent
-    entry.ntr.mid = entry.enrolls.mid * ntrPerStudent
-    entry.ntr.high = entry.enrolls.high * ntrPerStudent
-    entry.ntr.previousYear = entry.enrolls.previousYear * ntrPerStudent
+    entry.ntr.current = ntrFor(entry.enrolls.current, ntrPerStudent)
+    entry.ntr.low = ntrFor(entry.enrolls.low, ntrPerStudent)
+    entry.ntr.mid = ntrFor(entry.enrolls.mid, ntrPerStudent)
+    entry.ntr.high = ntrFor(entry.enrolls.high, ntrPerStudent)
+    entry.ntr.previousYear = ntrFor(entry.enrolls.previousYear, ntrPerStudent)
     entry.ntr.yoyChange = calculateYoY(entry.ntr.mid, entry.ntr.previousYear)
   })
   
@@ -1,4 +1,5 @@
 import { create } from 'zustand'
+import type { PrecomputedForecast } from '@/lib/forecasting'
 import { 
   getDashboardCache, 
   setDashboardCache, 
@@ -328,6 +329,9 @@ export interface DashboardData {
     enrollments: number[]
   }>
   
+  // Forecast for the unfiltered dataset (forecasting.py)
+  forecast?: PrecomputedForecast | null
+  
   // Timeline data for time-series charts
   timeline?: {
     applications: {
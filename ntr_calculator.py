@@ -278,7 +278,7 @@ def calculate_ntr_from_census(
     if census_df is None or census_df.empty:
         return None, [], pd.DataFrame()
     
-    df = census_df.copy()
+    df = census_df.copy(deep=False)  # copy-on-write view of the shared frame
     
     # Filter for the semester if needed
     if 'Census_1_SEMESTER' in df.columns:
@@ -495,7 +495,7 @@ def calculate_ntr_by_program(census_df: pd.DataFrame, semester: str = '2026S') -
     if census_df is None or census_df.empty:
         return pd.DataFrame()
     
-    df = census_df.copy()
+    df = census_df.copy(deep=False)  # copy-on-write view of the shared frame
     
     # Filter for semester
     if 'Census_1_SEMESTER' in df.columns:
@@ -0,0 +1,259 @@
+"""
+Same-date pace index for the CPE Funnel Dashboard.
+
+The YoY numbers in analytics.calculate_summary_stats compare the current,
+still-open cycle against complete earlier cycles.  The pace index holds the
+cumulative applications, admits, offers accepted and enrollments for every
+day of every cycle (overall and per category, school and degree type), on
+one shared calendar: earlier cycles are shifted forward 364 days per year so
+weekdays line up.  "Where were we on this date last cycle" is then a single
+array lookup.  Built once per dataset by data_loader.load_all_data.
+
+Slate exports carry no admit or offer date, so admits and offers are placed
+on the application's Submitted date; enrollments use Date of Enrollment
+(falling back to Submitted).  Rows without a usable date count from the last
+day of the calendar, so end-of-cycle totals match calculate_funnel_metrics.
+
+Because the current cycle's late applicants have not been decided yet,
+Submitted-dated admits and offers run behind the earlier cycles' and would
+bias a same-date YoY.  Same-date comparisons therefore use only
+DATED_METRICS; admits and offers are compared on cycle totals, as before.
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from analytics import FunnelMetrics, YoYComparison
+
+
+YEAR_KEYS = [('two_years_ago', 2024), ('previous', 2025), ('current', 2026)]
+PACE_FIELDS = ('Application Category', 'School (Expanded)', 'Degree Type')
+FIELD_SEP = '|'  # joins the values of a multi-column field, e.g. ('Application Category', 'Degree Type')
+PACE_METRICS = ('applications', 'admits', 'offers_accepted', 'enrollments')
+DATED_METRICS = ('applications', 'enrollments')  # metrics placed on their own event date
+SAME_WEEKDAY_LAST_YEAR = 364  # days; keeps weekdays aligned across cycles
+OVERALL = ''
+
+Field = Union[str, Tuple[str, ...]]
+
+
+def _epoch_days(values: pd.Series) -> np.ndarray:
+    """Dates as integer days since 1970-01-01 (-1 for missing/unparseable)."""
+    dates = pd.to_datetime(values, errors='coerce', format='mixed')
+    days = dates.to_numpy().astype('datetime64[D]').astype(np.int64)
+    return np.where(dates.notna().to_numpy(), days, -1)
+
+
+def _to_day(when) -> int:
+    return int(np.datetime64(pd.Timestamp(when).date(), 'D').astype(np.int64))
+
+
+def _to_date(day: int) -> date:
+    return pd.Timestamp(np.datetime64(day, 'D')).date()
+
+
+def _field_labels(df: pd.DataFrame, field: Field) -> Optional[pd.Series]:
+    """Per-row value of ``field`` (multi-column fields joined with FIELD_SEP); None if missing."""
+    if not field:
+        return pd.Series(OVERALL, index=df.index)
+    columns = (field,) if isinstance(field, str) else tuple(field)
+    if any(c not in df.columns for c in columns):
+        return None
+    labels = df[columns[0]].fillna('').astype(str)
+    for col in columns[1:]:
+        labels = labels + FIELD_SEP + df[col].fillna('').astype(str)
+    return labels
+
+
+def _metric_events(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-row (day, weight) for each metric: arrays of shape (4, rows)."""
+    n = len(df)
+    submitted = _epoch_days(df['Submitted']) if 'Submitted' in df.columns else np.full(n, -1)
+    enrolled_on = _epoch_days(df['Date of Enrollment']) if 'Date of Enrollment' in df.columns else np.full(n, -1)
+    enrolled_on = np.where(enrolled_on >= 0, enrolled_on, submitted)
+
+    def flag(col, value):
+        return (df[col] == value).to_numpy(dtype=np.int64) if col in df.columns else np.zeros(n, dtype=np.int64)
+
+    apps = (pd.to_numeric(df['Is Application'], errors='coerce').fillna(0).to_numpy(dtype=np.int64)
+            if 'Is Application' in df.columns else np.ones(n, dtype=np.int64))
+    weights = np.vstack([apps, flag('Admit Status', 'admitted'), flag('Offer Accepted', 'yes'),
+                         flag('Enrolled', 'yes')])
+    days = np.vstack([submitted, submitted, submitted, enrolled_on])
+    return days, weights
+
+
+class PaceIndex:
+    """Cumulative funnel counts per aligned day, cycle and dimension value."""
+
+    def __init__(self, start_day: int, last_days: Dict[int, int], current_year: int,
+                 curves: Dict[Tuple[int, Field], Tuple[Dict[str, int], np.ndarray]]):
+        self.start_day = start_day
+        self.last_days = last_days  # year -> last dated application (shared calendar)
+        self.current_year = current_year
+        self._curves = curves  # (year, field) -> ({value: row}, int array [values, days, metrics])
+
+    def __reduce__(self):
+        # Plain constructor args, so st.cache_data can hash and pickle the data dict holding this
+        return PaceIndex, (self.start_day, self.last_days, self.current_year, self._curves)
+
+    @property
+    def as_of_day(self) -> int:
+        return self.last_days.get(self.current_year, self.start_day + self.days - 1)
+
+    @property
+    def years(self) -> List[int]:
+        return sorted({year for year, _ in self._curves})
+
+    @property
+    def fields(self) -> set:
+        """Indexed breakdowns (OVERALL is always present)."""
+        return {field for _, field in self._curves}
+
+    @property
+    def days(self) -> int:
+        return next(iter(self._curves.values()))[1].shape[1]
+
+    @property
+    def as_of(self) -> date:
+        """Latest dated application in the current cycle (the data's "today")."""
+        return _to_date(self.as_of_day)
+
+    def last_submitted(self, year: int) -> Optional[date]:
+        """Latest dated application of ``year``, on the shared calendar."""
+        day = self.last_days.get(year)
+        return None if day is None else _to_date(day)
+
+    def dates(self) -> pd.DatetimeIndex:
+        """The shared calendar, in the current cycle's dates."""
+        return pd.to_datetime(np.arange(self.start_day, self.start_day + self.days).astype('datetime64[D]'))
+
+    def values(self, field: Field) -> List[str]:
+        """Dimension values seen in any cycle, e.g. values('Degree Type')."""
+        seen = {}
+        for (_, f), (index, _) in self._curves.items():
+            if f == field:
+                seen.update(dict.fromkeys(index))
+        return sorted(seen)
+
+    def _slot(self, as_of) -> int:
+        """Calendar index for ``as_of`` (None: the data's as-of date), -1 if before the calendar."""
+        i = (self.as_of_day if as_of is None else _to_day(as_of)) - self.start_day
+        return -1 if i < 0 else min(i, self.days - 1)
+
+    def _row(self, year: int, field: Optional[Field], value: Optional[str]) -> Optional[np.ndarray]:
+        entry = self._curves.get((year, field or OVERALL))
+        if entry is None:
+            return None
+        index, cumulative = entry
+        row = index.get(OVERALL if not field else value)
+        return None if row is None else cumulative[row]
+
+    def metrics(self, year: int, as_of=None, field: Optional[Field] = None,
+                value: Optional[str] = None) -> FunnelMetrics:
+        """Funnel totals for ``year`` as of the same date (current-cycle calendar)."""
+        row = self._row(year, field, value)
+        i = self._slot(as_of)
+        if row is None or i < 0:
+            return FunnelMetrics(year=year)
+        return FunnelMetrics(year, *(int(c) for c in row[i]))
+
+    def totals(self, year: int, field: Optional[Field] = None, value: Optional[str] = None) -> FunnelMetrics:
+        """End-of-cycle funnel totals for ``year`` (undated rows included)."""
+        row = self._row(year, field, value)
+        if row is None:
+            return FunnelMetrics(year=year)
+        return FunnelMetrics(year, *(int(c) for c in row[-1]))
+
+    def table(self, year: int, field: Field, as_of=None, final: bool = False) -> pd.DataFrame:
+        """
+        Counts for every value of ``field`` at once (rows: values, columns:
+        PACE_METRICS), as of ``as_of`` or, with ``final``, at the end of the cycle.
+        """
+        entry = self._curves.get((year, field))
+        if entry is None:
+            return pd.DataFrame(columns=list(PACE_METRICS), dtype=np.int64)
+        index, cumulative = entry
+        i = self.days - 1 if final else self._slot(as_of)
+        counts = cumulative[:, i] if i >= 0 else np.zeros((len(index), len(PACE_METRICS)), dtype=np.int64)
+        return pd.DataFrame(counts, index=pd.Index(list(index), name=field if isinstance(field, str) else None),
+                            columns=list(PACE_METRICS))
+
+    def metrics_to_date(self, year: int, as_of=None, field: Optional[Field] = None,
+                        value: Optional[str] = None) -> FunnelMetrics:
+        """DATED_METRICS as of the same date; admits and offers accepted at the end of the cycle."""
+        dated = self.metrics(year, as_of, field, value)
+        final = self.totals(year, field, value)
+        return FunnelMetrics(year, dated.applications, final.admits, final.offers_accepted, dated.enrollments)
+
+    def comparison(self, current: int, previous: int, as_of=None, field: Optional[Field] = None,
+                   value: Optional[str] = None) -> YoYComparison:
+        as_of = self.as_of if as_of is None else pd.Timestamp(as_of).date()
+        return YoYComparison(
+            self.metrics_to_date(current, as_of, field, value),
+            self.metrics_to_date(previous, as_of, field, value),
+            as_of=as_of,
+        )
+
+    def yoy_comparisons(self, as_of=None) -> Dict[str, YoYComparison]:
+        """
+        Same keys as summary_stats['yoy']: applications and enrollments
+        compared on the same date, admits and offers on cycle totals.
+        """
+        years = self.years
+        return {
+            f'{cur}_vs_{prev}': self.comparison(cur, prev, as_of)
+            for prev, cur in reversed(list(zip(years, years[1:])))
+        }
+
+    def curve(self, year: int, metric: str = 'applications', field: Optional[Field] = None,
+              value: Optional[str] = None) -> pd.Series:
+        """Cumulative ``metric`` for ``year`` on the shared calendar."""
+        row = self._row(year, field, value)
+        values = row[:, PACE_METRICS.index(metric)] if row is not None else np.zeros(self.days, dtype=np.int64)
+        return pd.Series(values, index=self.dates(), name=year)
+
+
+def build_pace_index(applications: Dict, fields: Sequence[Field] = PACE_FIELDS) -> Optional[PaceIndex]:
+    """
+    Pace index from load_applications_data's year frames; None without
+    Submitted dates.  ``fields`` are the breakdowns to index besides overall.
+    """
+    years = []
+    for key, default_year in YEAR_KEYS:
+        df = applications.get(key)
+        if isinstance(df, pd.DataFrame) and not df.empty and 'Submitted' in df.columns:
+            years.append((int(applications.get(f'{key}_year', default_year)), df))
+    if not years:
+        return None
+    current_year = max(year for year, _ in years)
+
+    events = []
+    for year, df in years:
+        days, weights = _metric_events(df)
+        days = np.where(days >= 0, days + (current_year - year) * SAME_WEEKDAY_LAST_YEAR, -1)
+        events.append((year, df, days, weights))
+
+    dated = np.concatenate([d[d >= 0] for _, _, d, _ in events])
+    if dated.size == 0:
+        return None
+    start, end = int(dated.min()), int(dated.max())
+    n_days = end - start + 1
+    last_days = {year: int(days[0].max()) for year, _, days, _ in events if (days[0] >= 0).any()}
+
+    curves = {}
+    for year, df, days, weights in events:
+        slots = np.where(days >= 0, days - start, n_days - 1)  # undated rows land on the last day
+        for field in (OVERALL,) + tuple(fields):
+            labels = _field_labels(df, field)
+            if labels is None:
+                continue
+            codes, uniques = pd.factorize(labels, sort=True)
+            counts = np.zeros((len(uniques), n_days, len(PACE_METRICS)), dtype=np.int64)
+            for m in range(len(PACE_METRICS)):
+                np.add.at(counts[:, :, m], (codes, slots[m]), weights[m])
+            curves[(year, field)] = ({str(v): i for i, v in enumerate(uniques)}, counts.cumsum(axis=1))
+    return PaceIndex(start, last_days, current_year, curves)
@@ -0,0 +1,161 @@
+"""
+Headless batch export of Program Financial scenarios.
+
+Loads scenario input files (JSON), evaluates each with financial_engine and
+writes the Excel workbook and PDF report that the Streamlit export buttons
+produce.  Scenarios are spread over a process pool; each worker keeps one
+warm chart renderer for every PDF it builds.
+
+A scenario file is either a bare inputs dict or ``{"name": ..., "inputs": {...}}``
+(the shape of a saved scenario).  Missing keys fall back to
+``get_default_inputs()``.
+
+Usage:
+    python scripts/export_scenarios.py scenarios/ --out exports --workers 8
+    python scripts/export_scenarios.py a.json b.json --formats excel
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+FORMATS = ("excel", "pdf")
+
+
+def _init_worker():
+    root = str(_repo_root())
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+
+def _scenario_files(paths: list[str]) -> list[Path]:
+    files: list[Path] = []
+    for p in map(Path, paths):
+        if p.is_dir():
+            files.extend(sorted(p.glob("*.json")))
+        elif p.is_file():
+            files.append(p)
+        else:
+            print(f"[SKIP] Not found: {p}")
+    return files
+
+
+def _load_inputs(path: Path) -> dict:
+    from components.financial_engine import get_default_inputs
+
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(raw.get("inputs"), dict):
+        overrides = dict(raw["inputs"])
+        overrides.setdefault("program_name", raw.get("name") or path.stem)
+    else:
+        overrides = dict(raw)
+        overrides.setdefault("program_name", path.stem)
+    inputs = get_default_inputs()
+    inputs.update(overrides)
+    return inputs
+
+
+def _export_one(index: int, path: str, out_dir: str, formats: tuple[str, ...]) -> dict:
+    """Evaluate one scenario and write its artifacts; returns per-step timings.
+
+    File names start with the scenario's position in the batch, so scenarios
+    with the same program name do not overwrite each other.
+    """
+    from components.financial_engine import compute_scenario
+    from utils.formatting import safe_filename
+
+    report = {"scenario": path, "timings": {}, "artifacts": {}, "errors": {}}
+    t0 = time.perf_counter()
+    try:
+        inputs = _load_inputs(Path(path))
+        report["timings"]["load"] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        results = compute_scenario(inputs)
+        report["timings"]["evaluate"] = time.perf_counter() - t0
+    except Exception as e:
+        report["errors"]["evaluate"] = str(e)
+        return report
+
+    stem = f"{index:03d}_{safe_filename(inputs['program_name'], Path(path).stem)}"
+    targets = {
+        "excel": (f"{stem}_Financial_Model.xlsx", "components.financial_export_excel", "generate_excel"),
+        "pdf":   (f"{stem}_Financial_Report.pdf", "components.financial_export_pdf", "generate_pdf"),
+    }
+    for fmt in formats:
+        file_name, module, func = targets[fmt]
+        t0 = time.perf_counter()
+        try:
+            generate = getattr(__import__(module, fromlist=[func]), func)
+            dest = Path(out_dir) / file_name
+            dest.write_bytes(generate(inputs, results))
+            report["artifacts"][fmt] = str(dest)
+        except Exception as e:
+            report["errors"][fmt] = str(e)
+        report["timings"][fmt] = time.perf_counter() - t0
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="Scenario JSON files or directories of them")
+    parser.add_argument("--out", default=str(_repo_root() / "exports"), help="Output directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--formats", default=",".join(FORMATS),
+                        help="Comma-separated subset of: " + ", ".join(FORMATS))
+    args = parser.parse_args(argv)
+
+    formats = tuple(f.strip() for f in args.formats.split(",") if f.strip())
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown:
+        parser.error(f"unknown format(s): {', '.join(unknown)}")
+
+    files = _scenario_files(args.paths)
+    if not files:
+        print("[SKIP] No scenario files to export.")
+        return 0
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(args.workers, len(files)))
+
+    failed = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(_export_one, i, str(f), str(out_dir), formats): f
+                   for i, f in enumerate(files, 1)}
+        for fut in as_completed(futures):
+            name = futures[fut].name
+            try:
+                rep = fut.result()
+            except Exception as e:  # worker died (e.g. BrokenProcessPool) or result not picklable
+                failed += 1
+                print(f"[WARN] {name}  (export failed: {e!r})")
+                continue
+            steps = "  ".join(f"{k}={v:.2f}s" for k, v in rep["timings"].items())
+            if rep["errors"]:
+                failed += 1
+                errs = "; ".join(f"{k}: {v}" for k, v in rep["errors"].items())
+                print(f"[WARN] {name}  {steps}  ({errs})")
+            else:
+                print(f"[OK] {name}  {steps}")
+
+    elapsed = time.perf_counter() - started
+    print(f"Exported {len(files) - failed}/{len(files)} scenarios to {out_dir} "
+          f"in {elapsed:.1f}s with {workers} worker(s).")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Local mock of the Gemini generateContent API for exercising Ask Navs offline.
+
+Serves ``:generateContent`` and ``:streamGenerateContent`` (SSE) with canned
+text, configurable latency and an optional 429 rate so retries and streaming
+can be tested without spending quota.
+
+Usage:
+    python scripts/mock_llm_server.py --port 8765 --latency 0.3 --fail-rate 0.2
+    GEMINI_BASE_URL=http://127.0.0.1:8765 streamlit run app.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+PLANNER_MARKER = "comma-separated list of category keys"
+
+
+def _reply_for(prompt: str) -> str:
+    if PLANNER_MARKER in prompt:
+        return "summary,yoy"
+    if prompt.startswith("Summarize") or "Summary so far" in prompt:
+        return "- User asked about enrollment trends\n- Discussed yield"
+    question = prompt.rsplit("Question:", 1)[-1].strip()[:80]
+    return (f"**Mock answer** for: {question}\n\n"
+            "- Applications are tracking ahead of last year\n"
+            "- Yield is stable across schools\n")
+
+
+def _payload(text: str, finish: bool = True) -> dict:
+    cand = {"content": {"role": "model", "parts": [{"text": text}]}, "index": 0}
+    if finish:
+        cand["finishReason"] = "STOP"
+    return {"candidates": [cand], "usageMetadata": {"promptTokenCount": 1, "candidatesTokenCount": 1}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "MockGemini/1.0"
+    stats = {"requests": 0, "rate_limited": 0}
+    lock = threading.Lock()
+
+    def log_message(self, fmt, *args):  # keep test output quiet
+        pass
+
+    def _prompt(self) -> str:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        parts = [p.get("text", "") for c in body.get("contents", []) for p in c.get("parts", [])]
+        return "\n".join(parts)
+
+    def _send_json(self, code: int, obj: dict):
+        raw = json.dumps(obj).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_POST(self):
+        opts = self.server.opts
+        prompt = self._prompt()
+        with self.lock:
+            self.stats["requests"] += 1
+        if random.random() < opts.fail_rate:
+            with self.lock:
+                self.stats["rate_limited"] += 1
+            self._send_json(429, {"error": {"code": 429, "message": "Too Many Requests",
+                                            "status": "RESOURCE_EXHAUSTED"}})
+            return
+
+        time.sleep(opts.latency)
+        text = _reply_for(prompt)
+        if ":streamGenerateContent" in self.path:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            words = text.split(" ")
+            for i, word in enumerate(words):
+                piece = word + ("" if i == len(words) - 1 else " ")
+                last = i == len(words) - 1
+                self.wfile.write(f"data: {json.dumps(_payload(piece, finish=last))}\r\n\r\n".encode())
+                self.wfile.flush()
+                time.sleep(opts.chunk_delay)
+        else:
+            self._send_json(200, _payload(text))
+
+
+def serve(port: int = 8765, latency: float = 0.2, fail_rate: float = 0.0,
+          chunk_delay: float = 0.02) -> ThreadingHTTPServer:
+    """Start the mock server on a daemon thread and return it."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+    server.opts = argparse.Namespace(latency=latency, fail_rate=fail_rate, chunk_delay=chunk_delay)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Mock Gemini API server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds before the first byte")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--chunk-delay", type=float, default=0.02, help="Seconds between streamed chunks")
+    args = parser.parse_args(argv)
+
+    server = serve(args.port, args.latency, args.fail_rate, args.chunk_delay)
+    print(f"[OK] Mock Gemini listening on http://127.0.0.1:{args.port}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Cold-start profile of the dashboard.
+
+Runs app.py once in a fresh interpreter (under Streamlit's AppTest harness,
+with ``python -X importtime``) and reports:
+
+- time to import Streamlit itself and to render the first page
+  (the login form, or the default page with ``--authenticated``)
+- a warm rerun for comparison
+- the import-time tree of everything app.py pulled in, and which modules
+  were loaded through utils.lazy
+
+Usage:
+    python scripts/profile_startup.py
+    python scripts/profile_startup.py --authenticated --depth 3 --min-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MARKER = "PROFILE-APP-START"
+RESULT_PREFIX = "PROFILE-RESULT "
+_LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+@dataclass
+class ImportNode:
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list["ImportNode"] = field(default_factory=list)
+
+
+def parse_importtime(lines: list[str]) -> list[ImportNode]:
+    """Rebuild the import tree from ``-X importtime`` output (children are printed first)."""
+    pending: dict[int, list[ImportNode]] = {}
+    for line in lines:
+        m = _LINE_RE.match(line)
+        if not m:
+            continue
+        depth = (len(m.group(3)) - 1) // 2
+        node = ImportNode(m.group(4), int(m.group(1)), int(m.group(2)))
+        node.children = pending.pop(depth + 1, [])
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def _print_tree(nodes: list[ImportNode], depth: int, min_us: int, indent: int = 0):
+    for node in sorted(nodes, key=lambda n: n.cumulative_us, reverse=True):
+        if node.cumulative_us < min_us:
+            continue
+        print(f"  {node.cumulative_us / 1000:8.1f} ms {node.self_us / 1000:7.1f} ms  {'  ' * indent}{node.name}")
+        if indent + 1 < depth:
+            _print_tree(node.children, depth, min_us, indent + 1)
+
+
+# ── Child: runs inside `python -X importtime` ────────────────────────────
+
+def _child(args: argparse.Namespace) -> int:
+    sys.path.insert(0, str(ROOT))
+    start = time.perf_counter()
+    import streamlit  # noqa: F401  (what `streamlit run` has paid for before app.py starts)
+    streamlit_s = time.perf_counter() - start
+
+    from streamlit.testing.v1 import AppTest
+
+    sys.stderr.write(f"import time: {MARKER}\n")
+    sys.stderr.flush()
+
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=args.timeout)
+    at.secrets["password"] = "profile"
+    if args.authenticated:
+        at.session_state["authenticated"] = True
+
+    start = time.perf_counter()
+    at.run()
+    first_s = time.perf_counter() - start
+    start = time.perf_counter()
+    at.run()
+    rerun_s = time.perf_counter() - start
+
+    from utils.lazy import lazy_load_times
+
+    result = {
+        "streamlit_import_s": streamlit_s,
+        "first_render_s": first_s,
+        "rerun_s": rerun_s,
+        "exceptions": [e.value for e in at.exception],
+        "lazy_loaded": lazy_load_times(),
+    }
+    print(RESULT_PREFIX + json.dumps(result))
+    return 0
+
+
+# ── Parent ───────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Profile dashboard cold start")
+    parser.add_argument("--authenticated", action="store_true",
+                        help="Skip the login form and profile the default page (needs data access)")
+    parser.add_argument("--depth", type=int, default=2, help="Import tree depth to print")
+    parser.add_argument("--min-ms", type=float, default=10.0, help="Hide imports faster than this")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="Seconds allowed for the first render (login page) before warning")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return _child(args)
+
+    cmd = [sys.executable, "-X", "importtime", str(Path(__file__).resolve()), "--child",
+           "--timeout", str(args.timeout)] + (["--authenticated"] if args.authenticated else [])
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+    total_s = time.perf_counter() - start
+
+    result_line = next((l for l in proc.stdout.splitlines() if l.startswith(RESULT_PREFIX)), None)
+    if proc.returncode != 0 or result_line is None:
+        print("[WARN] Profiling run failed")
+        print(proc.stderr[-4000:])
+        return 1
+    result = json.loads(result_line[len(RESULT_PREFIX):])
+
+    err_lines = proc.stderr.splitlines()
+    split = next((i for i, l in enumerate(err_lines) if MARKER in l), 0)
+    app_imports = parse_importtime(err_lines[split + 1:])
+    app_import_ms = sum(n.cumulative_us for n in app_imports) / 1000
+
+    page = "default page" if args.authenticated else "login page"
+    print(f"Cold start profile ({page})")
+    print(f"  Streamlit import         {result['streamlit_import_s'] * 1000:8.1f} ms")
+    print(f"  First render             {result['first_render_s'] * 1000:8.1f} ms"
+          f"  (of which imports {app_import_ms:.1f} ms)")
+    print(f"  Warm rerun               {result['rerun_s'] * 1000:8.1f} ms")
+    print(f"  Profiler process total   {total_s * 1000:8.1f} ms")
+
+    print(f"\nImports during first render (cumulative, self; >= {args.min_ms:g} ms):")
+    _print_tree(app_imports, args.depth, int(args.min_ms * 1000))
+
+    if result["lazy_loaded"]:
+        print("\nLazily loaded modules:")
+        for name, secs in sorted(result["lazy_loaded"].items(), key=lambda kv: -kv[1]):
+            print(f"  {secs * 1000:8.1f} ms  {name}")
+    else:
+        print("\nLazily loaded modules: none")
+
+    for exc in result["exceptions"]:
+        print(f"[WARN] App raised: {exc}")
+
+    if not args.authenticated:
+        if result["first_render_s"] > args.budget:
+            print(f"[WARN] Login page took {result['first_render_s']:.2f}s (budget {args.budget:.2f}s)")
+            return 1
+        print(f"[OK] Login page rendered in {result['first_render_s']:.2f}s (budget {args.budget:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,15 +2,27 @@
 Refresh local snapshot data for Streamlit Cloud deployments.
 Pulls Slate API CSV, latest Census CSV, and latest Applications Excel file
 based on .streamlit/secrets.toml (or env vars).
+
+The three sources are fetched concurrently.  Each snapshot is written to a
+temp file and renamed into place (utils.snapshots), so a running dashboard
+never reads a half-written file, and a source whose content matches the
+current snapshot is left untouched.  Every changed snapshot is then added
+to the row-level delta archive in data/snapshots/archive, so earlier states
+can be rebuilt later (see snapshot_archive.py).
+
+refresh() takes its settings as a dict, so it can be pointed at local
+folders and a local HTTP server instead of OneDrive and Slate.
 """
 
 from __future__ import annotations
 
-import glob
 import os
-import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
 import requests
 
@@ -24,6 +36,19 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+sys.path.insert(0, str(_repo_root()))
+
+from snapshot_archive import SOURCES, SnapshotArchive  # noqa: E402
+from utils.snapshots import copy_if_changed, latest_file, write_if_changed  # noqa: E402
+
+
+SETTING_KEYS = ("slate_url", "census_folder", "data_folder", "snapshot_folder", "archive_folder")
+APPS_PATTERN = "Online Applications CPE (Spring) YoY*.xlsx"
+CENSUS_PATTERN = "daily_census_file_*.csv"
+HTTP_TIMEOUT = 60
+HTTP_CHUNK_SIZE = 1 << 16
+
+
 def _load_secrets() -> dict:
     if tomllib is None:
         return {}
@@ -44,59 +69,108 @@ def _get_secret(secrets: dict, key: str, default: str = "") -> str:
     return str(secrets.get(key, default) or "")
 
 
-def _latest_file(folder: str, pattern: str) -> str | None:
-    if not folder or not os.path.exists(folder):
-        return None
-    files = glob.glob(os.path.join(folder, pattern))
-    if not files:
-        return None
-    files.sort(key=os.path.getmtime, reverse=True)
-    return files[0]
+def load_settings() -> dict:
+    """Source locations from env vars, falling back to .streamlit/secrets.toml."""
+    secrets = _load_secrets()
+    return {key: _get_secret(secrets, key) for key in SETTING_KEYS}
 
 
-def refresh() -> int:
-    secrets = _load_secrets()
-    repo_root = _repo_root()
+@dataclass
+class SnapshotResult:
+    label: str
+    status: str       # "updated", "unchanged", "skipped" or "failed"
+    message: str
 
-    slate_url = _get_secret(secrets, "slate_url")
-    census_folder = _get_secret(secrets, "census_folder")
-    data_folder = _get_secret(secrets, "data_folder")
-    snapshot_folder = _get_secret(secrets, "snapshot_folder")
+    def line(self) -> str:
+        tag = {"updated": "OK", "failed": "WARN"}.get(self.status, "SKIP")
+        return f"[{tag}] {self.message}"
 
-    snapshot_dir = Path(snapshot_folder) if snapshot_folder else repo_root / "data" / "snapshots"
-    snapshot_dir.mkdir(parents=True, exist_ok=True)
 
-    # 1) Slate snapshot
-    if slate_url:
-        try:
-            resp = requests.get(slate_url, timeout=60)
+def fetch_url(label: str, url: str, dest: Path) -> SnapshotResult:
+    """Download ``url`` into ``dest``, streaming the body straight to a temp file."""
+    if not url:
+        return SnapshotResult(label, "skipped", "slate_url not set.")
+    try:
+        with requests.get(url, timeout=HTTP_TIMEOUT, stream=True) as resp:
             resp.raise_for_status()
-            slate_path = snapshot_dir / "slate_latest.csv"
-            slate_path.write_bytes(resp.content)
-            print(f"[OK] Slate data saved: {slate_path}")
-        except Exception as e:
-            print(f"[WARN] Slate fetch failed: {e}")
-    else:
-        print("[SKIP] slate_url not set.")
-
-    # 2) Applications snapshot (Excel preferred)
-    apps_file = _latest_file(data_folder, "Online Applications CPE (Spring) YoY*.xlsx")
-    if apps_file:
-        dest = snapshot_dir / "apps_latest.xlsx"
-        shutil.copy2(apps_file, dest)
-        print(f"[OK] Applications snapshot saved: {dest}")
-    else:
-        print("[SKIP] No applications file found.")
-
-    # 3) Census snapshot
-    census_file = _latest_file(census_folder, "daily_census_file_*.csv")
-    if census_file:
-        dest = snapshot_dir / "census_latest.csv"
-        shutil.copy2(census_file, dest)
-        print(f"[OK] Census snapshot saved: {dest}")
-    else:
-        print("[SKIP] No census file found.")
+            changed = write_if_changed(dest, resp.iter_content(HTTP_CHUNK_SIZE))
+    except Exception as e:
+        return SnapshotResult(label, "failed", f"{label} fetch failed: {e}")
+    if not changed:
+        return SnapshotResult(label, "unchanged", f"{label} data unchanged: {dest}")
+    return SnapshotResult(label, "updated", f"{label} data saved: {dest}")
+
+
+def copy_latest(label: str, folder: str, pattern: str, dest: Path) -> SnapshotResult:
+    """Copy the newest file in ``folder`` matching ``pattern`` to ``dest``."""
+    src = latest_file(folder, pattern)
+    if not src:
+        return SnapshotResult(label, "skipped", f"No {label.lower()} file found.")
+    try:
+        changed = copy_if_changed(src, dest)
+    except Exception as e:
+        return SnapshotResult(label, "failed", f"{label} copy failed: {e}")
+    if not changed:
+        return SnapshotResult(label, "unchanged", f"{label} snapshot unchanged: {dest}")
+    return SnapshotResult(label, "updated", f"{label} snapshot saved: {dest}")
 
+
+def _snapshot_dir(settings: dict) -> Path:
+    snapshot_folder = settings.get("snapshot_folder")
+    snapshot_dir = Path(snapshot_folder) if snapshot_folder else _repo_root() / "data" / "snapshots"
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    return snapshot_dir
+
+
+def refresh_snapshots(settings: dict) -> list[SnapshotResult]:
+    """Fetch/copy every source concurrently; results in Slate, Applications, Census order."""
+    snapshot_dir = _snapshot_dir(settings)
+
+    jobs: list[Callable[[], SnapshotResult]] = [
+        lambda: fetch_url("Slate", settings.get("slate_url", ""),
+                          snapshot_dir / "slate_latest.csv"),
+        lambda: copy_latest("Applications", settings.get("data_folder", ""), APPS_PATTERN,
+                            snapshot_dir / "apps_latest.xlsx"),
+        lambda: copy_latest("Census", settings.get("census_folder", ""), CENSUS_PATTERN,
+                            snapshot_dir / "census_latest.csv"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = [pool.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def archive_snapshots(snapshot_dir: Path, taken_at: datetime | None = None,
+                      archive_dir: Path | None = None) -> list[SnapshotResult]:
+    """Add each current snapshot to the delta archive (snapshot_archive.py)."""
+    taken_at = taken_at or datetime.now()
+    results = []
+    for source in SOURCES.values():
+        path = snapshot_dir / source.filename
+        if not path.exists():
+            continue
+        label = f"Archive {source.name}"
+        try:
+            entry = SnapshotArchive(source, archive_dir or snapshot_dir / "archive").append(path, taken_at)
+        except Exception as e:
+            results.append(SnapshotResult(label, "failed", f"{label} failed: {e}"))
+            continue
+        if entry is None:
+            results.append(SnapshotResult(label, "unchanged", f"{label}: unchanged since last refresh"))
+        else:
+            results.append(SnapshotResult(label, "updated", (
+                f"{label}: {entry['kind']}, {entry['rows']} rows "
+                f"({entry['upserts']} new or changed, {entry['deletes']} removed)")))
+    return results
+
+
+def refresh(settings: dict | None = None) -> int:
+    settings = load_settings() if settings is None else settings
+    for result in refresh_snapshots(settings):
+        print(result.line())
+    archive_folder = settings.get("archive_folder")
+    for result in archive_snapshots(_snapshot_dir(settings),
+                                    archive_dir=Path(archive_folder) if archive_folder else None):
+        print(result.line())
     return 0
 
 
@@ -0,0 +1,190 @@
+"""
+Historical snapshot archive for the CPE Funnel Dashboard.
+
+data/snapshots only holds the latest Slate/applications/census exports, so
+each refresh used to lose the previous day's state.  The archive keeps every
+refresh as a gzip'd, row-level delta against the one before it, keyed by the
+Slate ``Ref`` or census ``STUDENT_ID``, so storage grows with daily churn
+rather than with the size of the export:
+
+    data/snapshots/archive/<source>/index.json
+    data/snapshots/archive/<source>/<YYYYMMDDTHHMMSS>.<full|delta>.json.gz
+
+Every KEYFRAME_EVERY-th entry (and any refresh whose columns changed) is a
+full copy, so rebuilding the state at a point in time replays at most that
+many deltas.  Values are archived as text, exactly as read from the export;
+reconstructed frames come back sorted by key.
+
+The archive is not committed (it is in .gitignore); set ARCHIVE_FOLDER (env
+var or secrets.toml ``archive_folder`` for scripts/refresh_data.py) to keep
+it outside the repo.
+"""
+
+import gzip
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+
+from utils.snapshots import file_digest, write_if_changed
+
+
+ARCHIVE_DIR = Path(os.getenv("ARCHIVE_FOLDER") or Path(__file__).parent / "data" / "snapshots" / "archive")
+ARCHIVE_VERSION = 1
+KEYFRAME_EVERY = 30
+SAME_WEEKDAY_LAST_YEAR = 364  # 52 weeks back, so weekdays line up
+_KEY = "_archive_key"
+
+When = Union[str, date, datetime]
+
+
+@dataclass(frozen=True)
+class ArchiveSource:
+    name: str      # archive sub-folder
+    filename: str  # snapshot file in data/snapshots
+    key: str       # row key column
+
+
+SOURCES: Dict[str, ArchiveSource] = {s.name: s for s in (
+    ArchiveSource("apps", "apps_latest.xlsx", "Ref"),
+    ArchiveSource("slate", "slate_latest.csv", "Ref"),
+    ArchiveSource("census", "census_latest.csv", "Census_1_STUDENT_ID"),
+)}
+
+
+def read_snapshot(path: Union[str, Path]) -> pd.DataFrame:
+    """Snapshot file as all-text columns, blanks for missing values."""
+    path = str(path)
+    if path.lower().endswith((".xlsx", ".xls")):
+        return pd.read_excel(path, dtype=str).fillna("")
+    return pd.read_csv(path, dtype=str, keep_default_na=False, low_memory=False)
+
+
+def _keyed(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Index rows by key; repeated keys get '#n' suffixes in file order."""
+    if key not in df.columns:
+        raise KeyError(f"key column {key!r} not in snapshot")
+    ids = df[key].astype(str)
+    seq = ids.groupby(ids).cumcount()
+    index = ids.where(seq == 0, ids + "#" + seq.astype(str))
+    return df.set_axis(pd.Index(index, name=_KEY), axis=0).sort_index()
+
+
+def _as_datetime(when: When) -> datetime:
+    if isinstance(when, str):
+        when = date.fromisoformat(when) if len(when) == 10 else datetime.fromisoformat(when)
+    if not isinstance(when, datetime):
+        when = datetime.combine(when, time.max)  # a date means "as of the end of that day"
+    return when
+
+
+def _write_json_gz(path: Path, payload: dict):
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    write_if_changed(path, [gzip.compress(raw, mtime=0)])
+
+
+def _read_json_gz(path: Path) -> dict:
+    return json.loads(gzip.decompress(path.read_bytes()))
+
+
+class SnapshotArchive:
+    """Append-only delta archive for one snapshot source."""
+
+    def __init__(self, source: Union[str, ArchiveSource], root: Union[str, Path, None] = None):
+        self.source = SOURCES[source] if isinstance(source, str) else source
+        self.folder = Path(root or ARCHIVE_DIR) / self.source.name
+        self.index_path = self.folder / "index.json"
+        self.entries: List[dict] = []
+        if self.index_path.exists():
+            self.entries = json.loads(self.index_path.read_text())["entries"]
+
+    def dates(self) -> List[datetime]:
+        return [datetime.fromisoformat(e["taken_at"]) for e in self.entries]
+
+    # -- writing -------------------------------------------------------------
+
+    def append(self, path: Union[str, Path], taken_at: Optional[datetime] = None) -> Optional[dict]:
+        """
+        Archive the snapshot at ``path``; returns its index entry, or None
+        when the file is identical to the last archived one.
+        """
+        digest = file_digest(path)
+        if self.entries and self.entries[-1]["digest"] == digest:
+            return None
+        taken_at = (taken_at or datetime.now()).replace(microsecond=0)
+        if self.entries and taken_at <= _as_datetime(self.entries[-1]["taken_at"]):
+            raise ValueError(f"{self.source.name}: {taken_at} is not after the last archived snapshot")
+
+        new = _keyed(read_snapshot(path), self.source.key)
+        columns = [str(c) for c in new.columns]
+        since_full = next((i for i, e in enumerate(reversed(self.entries)) if e["kind"] == "full"), None)
+        old = self._state(len(self.entries) - 1) if self.entries else None
+
+        if old is None or list(old.columns) != columns or since_full + 1 >= KEYFRAME_EVERY:
+            kind, upserts, deletes = "full", new, []
+        else:
+            old_hash = pd.util.hash_pandas_object(old, index=False)
+            new_hash = pd.util.hash_pandas_object(new, index=False)
+            same = new_hash.eq(old_hash.reindex(new.index)).to_numpy()
+            kind, upserts = "delta", new[~same]
+            deletes = old.index.difference(new.index).tolist()
+
+        self.folder.mkdir(parents=True, exist_ok=True)
+        filename = f"{taken_at:%Y%m%dT%H%M%S}.{kind}.json.gz"
+        _write_json_gz(self.folder / filename, {
+            "version": ARCHIVE_VERSION,
+            "columns": columns,
+            "keys": upserts.index.tolist(),
+            "rows": upserts.to_numpy().tolist(),
+            "deletes": deletes,
+        })
+        entry = {
+            "taken_at": taken_at.isoformat(),
+            "file": filename,
+            "kind": kind,
+            "digest": digest,
+            "rows": len(new),
+            "upserts": len(upserts),
+            "deletes": len(deletes),
+        }
+        self.entries.append(entry)
+        index = {"version": ARCHIVE_VERSION, "source": self.source.name,
+                 "key": self.source.key, "entries": self.entries}
+        write_if_changed(self.index_path, [json.dumps(index, indent=1).encode("utf-8")])
+        return entry
+
+    # -- reading -------------------------------------------------------------
+
+    def _state(self, upto: int) -> pd.DataFrame:
+        """Keyed state after entry ``upto``: last keyframe plus the deltas after it."""
+        start = next(i for i in range(upto, -1, -1) if self.entries[i]["kind"] == "full")
+        state = None
+        for entry in self.entries[start:upto + 1]:
+            payload = _read_json_gz(self.folder / entry["file"])
+            rows = pd.DataFrame(payload["rows"], columns=payload["columns"], dtype=str,
+                                index=pd.Index(payload["keys"], name=_KEY))
+            if state is None:
+                state = rows
+            else:
+                keep = ~state.index.isin(payload["deletes"]) & ~state.index.isin(rows.index)
+                state = pd.concat([state[keep], rows])
+        return state.sort_index()
+
+    def as_of(self, when: When) -> Optional[pd.DataFrame]:
+        """Snapshot as it stood at ``when`` (a date means end of that day), or None if earlier than the archive."""
+        when = _as_datetime(when)
+        upto = sum(1 for d in self.dates() if d <= when) - 1
+        if upto < 0:
+            return None
+        return self._state(upto).reset_index(drop=True)
+
+    def same_day_last_year(self, when: Optional[When] = None,
+                           days: int = SAME_WEEKDAY_LAST_YEAR) -> Optional[pd.DataFrame]:
+        """Snapshot from the same weekday one year before ``when`` (default: today)."""
+        when = _as_datetime(when or date.today())
+        return self.as_of(when - timedelta(days=days))
+
@@ -0,0 +1,202 @@
+"""
+Embedded SQL layer for the CPE Funnel Dashboard.
+
+Ad-hoc slices (program x category x degree, company x school, ...) are
+GROUP BYs against an in-process DuckDB database instead of new pandas
+filtering loops.  The loaded frames are registered as views, so DuckDB
+scans them in place without copying:
+
+    applications  every application row of every cycle, plus ``year``
+    funnel        one row per application: year, school, category, degree,
+                  program and 0/1 apps, admits, offers and enrolls flags
+                  (same rules as analytics.calculate_funnel_metrics)
+    census        the current census extract (raw_df)
+
+Snapshot files (CSV, Parquet, Excel) can be added as more views with
+register().  DuckDB is an optional dependency: without it available() is
+False, get_sql_layer() returns None and callers keep their pandas path.
+
+    layer = get_sql_layer(data)
+    layer.aggregate(['program', 'degree'], ['apps', 'enrolls', 'yield'], where={'year': [2026]})
+    layer.query('SELECT school, SUM(enrolls) AS enrolls FROM funnel WHERE year = ? GROUP BY ALL', [2025])
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+import pandas as pd
+import streamlit as st
+
+from data_loader import get_dataset_version
+from pace import YEAR_KEYS
+
+try:
+    import duckdb
+except ImportError:  # optional: pip install duckdb
+    duckdb = None
+
+
+FUNNEL_DIMS: Dict[str, str] = {
+    'school': 'School (Expanded)',
+    'category': 'Application Category',
+    'degree': 'Degree Type',
+    'program': 'Program Cleaned',
+}
+
+# Named aggregates for aggregate(); rates are percentages like FunnelMetrics
+MEASURES: Dict[str, str] = {
+    'rows': 'COUNT(*)',
+    'apps': 'CAST(SUM(apps) AS BIGINT)',
+    'admits': 'CAST(SUM(admits) AS BIGINT)',
+    'offers': 'CAST(SUM(offers) AS BIGINT)',
+    'enrolls': 'CAST(SUM(enrolls) AS BIGINT)',
+    'admit_rate': '100.0 * SUM(admits) / NULLIF(SUM(apps), 0)',
+    'offer_rate': '100.0 * SUM(offers) / NULLIF(SUM(admits), 0)',
+    'yield': '100.0 * SUM(enrolls) / NULLIF(SUM(admits), 0)',
+}
+
+Source = Union[pd.DataFrame, str, Path]
+
+
+def available() -> bool:
+    return duckdb is not None
+
+
+def _ident(name: str) -> str:
+    """Quoted SQL identifier (column names here have spaces and parentheses)."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _literal(text: str) -> str:
+    return "'" + str(text).replace("'", "''") + "'"
+
+
+def _flag(columns: Sequence[str], column: str, value: str) -> str:
+    if column not in columns:
+        return '0'
+    return f"CASE WHEN {_ident(column)} = {_literal(value)} THEN 1 ELSE 0 END"
+
+
+class SQLLayer:
+    """One in-memory DuckDB database over a loaded dataset; queries are serialized."""
+
+    def __init__(self, data: Optional[Dict] = None):
+        if duckdb is None:
+            raise ImportError("duckdb is not installed (pip install duckdb)")
+        self.con = duckdb.connect(':memory:')
+        self._lock = threading.Lock()
+        self.views: List[str] = []
+        if data:
+            self.load(data)
+
+    def register(self, name: str, source: Source):
+        """Expose a DataFrame or a CSV/Parquet/Excel file as view ``name``."""
+        if isinstance(source, (str, Path)):
+            path = str(source)
+            suffix = Path(path).suffix.lower()
+            if suffix in ('.xlsx', '.xls'):
+                source = pd.read_excel(path)
+            else:
+                reader = 'read_parquet' if suffix == '.parquet' else 'read_csv_auto'
+                with self._lock:
+                    self.con.execute(f"CREATE OR REPLACE VIEW {_ident(name)} AS SELECT * FROM {reader}({_literal(path)})")
+                self._add_view(name)
+                return
+        with self._lock:
+            self.con.register(name, source)
+        self._add_view(name)
+
+    def _add_view(self, name: str):
+        if name not in self.views:
+            self.views.append(name)
+
+    def load(self, data: Dict):
+        """Register the applications, funnel and census views for a load_all_data dict."""
+        applications = data.get('applications') or {}
+        cycles = []
+        for key, default_year in YEAR_KEYS:
+            df = applications.get(key)
+            if isinstance(df, pd.DataFrame) and not df.empty:
+                year = int(applications.get(f'{key}_year', default_year))
+                self.register(f'_apps_{year}', df)
+                cycles.append((year, df))
+        if cycles:
+            union = ' UNION ALL BY NAME '.join(
+                f"SELECT {year} AS year, * FROM {_ident(f'_apps_{year}')}" for year, _ in cycles)
+            columns = set().union(*(df.columns for _, df in cycles))
+            dims = ', '.join(
+                f"COALESCE(CAST({_ident(col)} AS VARCHAR), '') AS {key}" if col in columns else f"'' AS {key}"
+                for key, col in FUNNEL_DIMS.items())
+            apps = (f"COALESCE(TRY_CAST({_ident('Is Application')} AS INTEGER), 0)"
+                    if 'Is Application' in columns else '1')
+            with self._lock:
+                self.con.execute(f"CREATE OR REPLACE VIEW applications AS {union}")
+                self.con.execute(
+                    f"CREATE OR REPLACE VIEW funnel AS SELECT year, {dims}, {apps} AS apps, "
+                    f"{_flag(columns, 'Admit Status', 'admitted')} AS admits, "
+                    f"{_flag(columns, 'Offer Accepted', 'yes')} AS offers, "
+                    f"{_flag(columns, 'Enrolled', 'yes')} AS enrolls FROM applications")
+            self._add_view('applications')
+            self._add_view('funnel')
+
+        census_df = (data.get('census') or {}).get('raw_df')
+        if isinstance(census_df, pd.DataFrame) and not census_df.empty:
+            self.register('census', census_df)
+
+    def query(self, sql: str, params: Optional[Sequence] = None) -> pd.DataFrame:
+        """Run ``sql`` (``?`` placeholders bound from ``params``) and return the result."""
+        with self._lock:
+            return self.con.execute(sql, list(params or [])).df()
+
+    def aggregate(self, by: Sequence[str], measures: Union[Sequence[str], Mapping[str, str]] = ('apps', 'admits', 'enrolls'),
+                  where: Optional[Mapping[str, Sequence]] = None, table: str = 'funnel',
+                  order_by: Optional[str] = None, descending: bool = True,
+                  limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        GROUP BY ``by`` over ``table``.
+
+        ``measures`` are MEASURES names, or a mapping of output name to SQL
+        aggregate for other tables.  ``where`` maps columns to allowed
+        values.  Rows are ordered by ``order_by`` (default: the first
+        measure), largest first unless ``descending`` is False.
+        """
+        if not isinstance(measures, Mapping):
+            unknown = [m for m in measures if m not in MEASURES]
+            if unknown:
+                raise ValueError(f"unknown measures {unknown}; expected one of {list(MEASURES)}")
+            measures = {m: MEASURES[m] for m in measures}
+        groups = ', '.join(_ident(col) for col in by)
+        columns = [_ident(col) for col in by] + [f"{expr} AS {_ident(name)}" for name, expr in measures.items()]
+        sql = f"SELECT {', '.join(columns)} FROM {_ident(table)}"
+        params: List = []
+        if where:
+            clauses = []
+            for col, values in where.items():
+                values = list(values)
+                clauses.append(f"{_ident(col)} IN ({', '.join('?' * len(values))})" if values else 'FALSE')
+                params.extend(values)
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        if by:
+            sql += f" GROUP BY {groups}"
+        order = order_by or next(iter(measures), None)
+        if order:
+            sql += f" ORDER BY {_ident(order)} {'DESC' if descending else 'ASC'} NULLS LAST"
+            if by:
+                sql += f", {groups}"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return self.query(sql, params)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _sql_layer_cached(version: str, _data: Dict) -> SQLLayer:
+    """One database per dataset version, shared by every session."""
+    return SQLLayer(_data)
+
+
+def get_sql_layer(data: Dict) -> Optional[SQLLayer]:
+    """SQL layer for ``data``, or None when duckdb is not installed."""
+    if duckdb is None or not data:
+        return None
+    return _sql_layer_cached(get_dataset_version(data), data)
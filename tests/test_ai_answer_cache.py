@@ -0,0 +1,80 @@
+"""Ask Navs answer cache: which rephrasings may reuse a cached answer."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.ai_answer_cache import SemanticCache  # noqa: E402
+
+SCOPE = ("Executive Summary", ("funnel", "programs"))
+
+CACHED = [
+    "What is our yield rate?",
+    "How are corporate enrollments doing?",
+    "Which programs have the highest yield?",
+    "Summarize the NTR situation",
+    "Why did applications drop?",
+    "How is the funnel performing this year?",
+    "What are the top programs by enrollment?",
+    "Give me an overview of retail performance",
+    "Which companies sponsor the most students?",
+    "What is driving enrollment growth?",
+]
+
+# Same question, different wording: should reuse the cached answer
+PARAPHRASES = [
+    ("what's our yield rate", "What is our yield rate?"),
+    ("How are corporate enrollments doing", "How are corporate enrollments doing?"),
+    ("summarize the NTR situation please", "Summarize the NTR situation"),
+    ("how is the funnel performing this year", "How is the funnel performing this year?"),
+    ("What are the top programs by enrollments?", "What are the top programs by enrollment?"),
+    ("give me an overview of the retail performance", "Give me an overview of retail performance"),
+]
+
+# Different question (often one added or swapped word): must not reuse an answer
+DIFFERENT = [
+    "Which programs have the lowest yield?",
+    "How are retail enrollments doing?",
+    "What is our admit rate?",
+    "What are the top schools by enrollment?",
+    "Summarize the graduation situation",
+    "Give me an overview of corporate performance",
+    "Which SES programs have the highest yield?",
+    "Which programs have the highest yield and enrollment?",
+    "How are corporate enrollments doing compared to last year?",
+    "What is our yield rate for masters?",
+    "Why did applications drop for Beacon?",
+    "Summarize the NTR situation by degree",
+    "How is the funnel performing this year for retail?",
+    "Which companies sponsor the fewest students?",
+    "What is driving enrollment decline?",
+]
+
+
+@pytest.fixture
+def cache():
+    cache = SemanticCache()
+    for question in CACHED:
+        cache.put("v1", SCOPE, question, question)
+    return cache
+
+
+@pytest.mark.parametrize("question,expected", PARAPHRASES)
+def test_paraphrases_hit(cache, question, expected):
+    assert cache.get("v1", SCOPE, question) == expected
+
+
+@pytest.mark.parametrize("question", DIFFERENT)
+def test_different_questions_miss(cache, question):
+    assert cache.get("v1", SCOPE, question) is None
+
+
+def test_page_version_and_numbers_scope_the_cache(cache):
+    other_page = ("Program Intelligence", SCOPE[1])
+    assert cache.get("v1", other_page, "What is our yield rate?") is None
+    assert cache.get("v2", SCOPE, "What is our yield rate?") is None
+    cache.put("v1", SCOPE, "applications in 2025", "2025")
+    assert cache.get("v1", SCOPE, "applications in 2026") is None
@@ -0,0 +1,40 @@
+"""Rolling chat summary: what a follow-up sees before and after a fold."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.ai_chat_memory import FOLD_AFTER, MAX_MESSAGE_CHARS, RollingSummary  # noqa: E402
+
+
+def _turns(n):
+    return [{"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"} for i in range(n)]
+
+
+def test_context_includes_unfolded_turns():
+    memory = RollingSummary()
+    assert memory.context([]) == ""
+    context = memory.context(_turns(2))
+    assert "user: message 0" in context and "assistant: message 1" in context
+
+
+def test_context_is_summary_plus_newer_turns():
+    memory = RollingSummary()
+    memory.summary, memory.folded = "- asked about yield", FOLD_AFTER
+    history = _turns(FOLD_AFTER + 2)
+    lines = memory.context(history).splitlines()
+    assert lines[0] == "- asked about yield"
+    assert lines[1:] == [f"user: message {FOLD_AFTER}", f"assistant: message {FOLD_AFTER + 1}"]
+
+
+def test_context_clips_long_messages():
+    memory = RollingSummary()
+    context = memory.context([{"role": "assistant", "content": "x" * (MAX_MESSAGE_CHARS * 2)}])
+    assert len(context) == len("assistant: ") + MAX_MESSAGE_CHARS
+
+
+def test_schedule_waits_for_fold_after_messages():
+    memory = RollingSummary()
+    memory.schedule(_turns(FOLD_AFTER - 1), api_key="unused")  # below the threshold: no LLM call
+    assert memory._pending is None
@@ -0,0 +1,57 @@
+"""Ask Navs context packer: what survives the token budget."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.ai_context_packer import pack_context  # noqa: E402
+
+NAMES = ["Computer Science", "Data Science", "Business Analytics", "Cybersecurity", "Finance",
+         "Systems Engineering", "Project Management", "Machine Learning", "Space Systems",
+         "Engineering Management", "Information Systems", "Biomedical Engineering"]
+PROGRAMS = [f"{name} {level}" for level in ("MS", "Certificate", "Online MS", "Executive")
+            for name in NAMES]
+
+BY_ENROLLMENTS = [f"  - {p}: {200 - 3 * i} enrollments, Yield {40 + i % 7}%" for i, p in enumerate(PROGRAMS)]
+BY_YIELD = [f"  - {p}: Yield {95 - i}%, {10 + i % 5} enrollments"
+            for i, p in enumerate(reversed(PROGRAMS))]
+FRAGMENT = "\n".join([f"Programs (tracked: {len(PROGRAMS)}):", "- Top by enrollments:", *BY_ENROLLMENTS,
+                      "- Top by yield (min 5 enrollments when available):", *BY_YIELD])
+
+
+def kept(question, rows, budget=700):
+    text, report = pack_context(question, ["Guardrails."], [("programs", FRAGMENT)], budget=budget)
+    lines = set(text.splitlines())
+    assert report.tokens <= budget
+    return [i for i, row in enumerate(rows) if row in lines]
+
+
+def test_budget_trims_rows():
+    text, report = pack_context("Which programs have the best yield?", ["Guardrails."],
+                                [("programs", FRAGMENT)], budget=700)
+    kept_rows, total = report.rows["programs"]
+    assert kept_rows < total == 2 * len(PROGRAMS)
+
+
+def test_ranking_question_keeps_the_top_of_its_list():
+    rows = kept("Which programs have the best yield?", BY_YIELD)
+    assert len(rows) >= 10
+    assert rows == list(range(len(rows)))
+
+
+def test_bottom_ranking_keeps_the_end_of_its_list():
+    rows = kept("Which programs have the lowest yield?", BY_YIELD)
+    assert len(rows) >= 10
+    assert rows == list(range(len(BY_YIELD) - len(rows), len(BY_YIELD)))
+
+
+def test_ranking_matches_the_list_by_metric():
+    rows = kept("What are the top programs by enrollments?", BY_ENROLLMENTS)
+    assert rows == list(range(len(rows))) and len(rows) >= 10
+
+
+def test_other_questions_keep_anchors_and_relevant_rows():
+    rows = kept("Tell me about Cybersecurity Executive", BY_YIELD)
+    assert {0, 1, 2} <= set(rows)
+    assert BY_YIELD.index(next(r for r in BY_YIELD if "Cybersecurity Executive" in r)) in rows
@@ -0,0 +1,100 @@
+"""Ask Navs local engine: what it may answer without the LLM, and what it must not."""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.ai_query_engine import (  # noqa: E402
+    MIN_RATE_BASE, answer_locally, build_aggregates, execute, is_follow_up, parse_question,
+)
+
+
+def _rows(program, n_apps, n_admits, n_enrolls, school="SES", category="Beacon", degree="Masters"):
+    return pd.DataFrame({
+        "School (Expanded)": school,
+        "Application Category": category,
+        "Degree Type": degree,
+        "Program Cleaned": program,
+        "Is Application": 1,
+        "Admit Status": ["admitted"] * n_admits + [""] * (n_apps - n_admits),
+        "Enrolled": ["yes"] * n_enrolls + [""] * (n_apps - n_enrolls),
+    })
+
+
+@pytest.fixture(scope="module")
+def data():
+    current = pd.concat([
+        _rows("Computer Science", 40, 30, 15),
+        _rows("Data Science", 30, 20, 12, school="SSB", category="ASAP"),
+        _rows("Tiny Program", 3, 2, 2, degree="Graduate Certificate"),  # 100% yield on 2 admits
+    ], ignore_index=True)
+    previous = pd.concat([
+        _rows("Computer Science", 35, 25, 10),
+        _rows("Data Science", 20, 15, 9, school="SSB", category="ASAP"),
+    ], ignore_index=True)
+    return {"version": "test", "applications": {"current": current, "previous": previous}}
+
+
+@pytest.fixture(scope="module")
+def aggregates(data):
+    return build_aggregates(data)
+
+
+def answer(question, aggregates):
+    plan = parse_question(question, aggregates)
+    return None if plan is None else execute(plan, aggregates)
+
+
+@pytest.mark.parametrize("question", [
+    "how many applications do we have",
+    "top 5 programs by enrollments",
+    "yield by school",
+    "admits for Beacon in 2025",
+    "applications by degree 2026 vs 2025",
+])
+def test_answers_fully_parsed_questions(question, aggregates):
+    assert answer(question, aggregates)
+
+
+def test_totals_are_exact(aggregates):
+    assert "Applications 73" in answer("how many applications do we have", aggregates)
+    assert "Admits 25" in answer("admits for Beacon in 2025", aggregates)
+
+
+@pytest.mark.parametrize("question", [
+    "what percentage of applications are from women",  # demographic / share-of
+    "how many apps did we get in december",             # time range
+    "how is yield trending",                            # trend
+    "applications from international students",
+    "enrollments since january by program",
+])
+def test_unparsed_qualifiers_go_to_llm(question, aggregates):
+    assert parse_question(question, aggregates) is None
+
+
+@pytest.mark.parametrize("question", [
+    "what about 2025",
+    "and by school?",
+    "how does that compare to last year",
+    "show those by program instead",
+])
+def test_follow_ups_go_to_llm(question, data):
+    assert is_follow_up(question)
+    assert answer_locally(question, data, chat_summary="User asked for yield by program.") is None
+
+
+def test_first_turn_is_not_a_follow_up():
+    assert not is_follow_up("yield by school")
+
+
+def test_rate_ranking_skips_low_volume_groups(aggregates):
+    text = answer("top programs by yield", aggregates)
+    assert f"at least {MIN_RATE_BASE} admits" in text
+    assert "Tiny Program" not in text
+    assert "Computer Science" in text and "Data Science" in text
+    # Volume rankings keep every group
+    assert "Tiny Program" in answer("applications by program", aggregates)
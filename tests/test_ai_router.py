@@ -0,0 +1,78 @@
+"""Ask Navs router: which context fragments a question gets without the LLM planner."""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.ai_assistant import DATA_CATEGORIES  # noqa: E402
+from components.ai_query_engine import build_aggregates, named_values  # noqa: E402
+from components.ai_router import MAX_CATEGORIES, QuestionRouter  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def router():
+    return QuestionRouter(DATA_CATEGORIES)
+
+
+@pytest.fixture(scope="module")
+def aggregates():
+    current = pd.DataFrame({
+        "School (Expanded)": ["SES", "SSB", "SES"],
+        "Application Category": ["Stevens Online (Beacon)", "Stevens Online (Corporate)", "ASAP"],
+        "Degree Type": ["Masters", "Graduate Certificate", "Masters"],
+        "Program Cleaned": ["Computer Science", "Business Analytics", "Data Science"],
+        "Is Application": 1,
+        "Admit Status": "admitted",
+        "Enrolled": "yes",
+    })
+    return build_aggregates({"version": "test", "applications": {"current": current}})
+
+
+def route(router, aggregates, question):
+    return router.route(question, named_values(question, aggregates))
+
+
+@pytest.mark.parametrize("question,expected", [
+    ("Which programs have the highest yield?", ["programs"]),
+    ("How do we close the NTR gap?", ["summary", "ntr"]),
+    ("Which companies send the most students?", ["summary", "cohorts"]),
+    ("Give me a YoY performance summary", ["summary", "yoy"]),
+])
+def test_routes_clear_questions_locally(router, aggregates, question, expected):
+    decision = route(router, aggregates, question)
+    assert decision.confident
+    assert decision.categories == expected
+
+
+@pytest.mark.parametrize("question,breakdown", [
+    ("How did Beacon applications change year over year?", "by_category"),
+    ("How is SES doing on yield compared to last year?", "by_school"),
+    ("Compare masters and certificate enrollments", "by_degree"),
+    ("How many applications did Computer Science get?", "programs"),
+])
+def test_named_values_add_their_breakdown(router, aggregates, question, breakdown):
+    decision = route(router, aggregates, question)
+    assert breakdown in decision.categories
+    assert len(decision.categories) <= MAX_CATEGORIES
+
+
+def test_named_breakdowns_survive_the_category_cap(router):
+    named = {"school": ["SES"], "category": ["Beacon"], "degree": ["Masters"], "program": ["Computer Science"]}
+    decision = router.route("Why is Computer Science yield down year over year in SES for Beacon masters?", named)
+    assert {"by_school", "by_category", "by_degree", "programs"} <= set(decision.categories)
+
+
+def test_named_value_without_breakdown_is_not_confident():
+    router = QuestionRouter({k: v for k, v in DATA_CATEGORIES.items() if k != "by_category"})
+    decision = router.route("How did Beacon applications change year over year?", {"category": ["Beacon"]})
+    assert not decision.confident
+
+
+def test_unrelated_question_falls_back(router):
+    before = router.stats()["fallbacks"]
+    assert not router.route("tell me a joke about penguins").confident
+    assert router.stats()["fallbacks"] == before + 1
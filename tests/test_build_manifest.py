@@ -0,0 +1,44 @@
+"""process_data build manifest: unchanged stages are reused, not rebuilt."""
+
+import importlib.util
+import json
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_spec = importlib.util.spec_from_file_location(
+    "process_data", os.path.join(ROOT, "iris-react", "scripts", "process_data.py"))
+process_data = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(process_data)
+
+
+def _run(tmp_path, inputs, calls):
+    manifest = process_data.BuildManifest(tmp_path / "manifest.json")
+
+    def build():
+        calls.append(inputs["apps"])
+        return {"funnel": {"apps": 3}, "students": ({"id": s} for s in "ab")}
+
+    out = manifest.stage("apps", lambda: dict(inputs), build)
+    dashboard = tmp_path / "dashboard.json"
+    dashboard.write_text("{}")
+    manifest.save(dashboard, "full")
+    return manifest, out
+
+
+def test_unchanged_inputs_reuse_stage_output(tmp_path):
+    calls = []
+    first, out = _run(tmp_path, {"apps": "d1"}, calls)
+    assert first.built == ["apps"]
+    assert json.loads(out.read_text()) == {"funnel": {"apps": 3}, "students": [{"id": "a"}, {"id": "b"}]}
+
+    second, _ = _run(tmp_path, {"apps": "d1"}, calls)
+    assert second.built == [] and calls == ["d1"]
+    assert second.stages["apps"] == first.stages["apps"]
+    assert second.output_key("full") == first.output_key("full")
+
+
+def test_changed_inputs_rebuild_stage(tmp_path):
+    calls = []
+    _run(tmp_path, {"apps": "d1"}, calls)
+    third, _ = _run(tmp_path, {"apps": "d2"}, calls)
+    assert third.built == ["apps"] and calls == ["d1", "d2"]
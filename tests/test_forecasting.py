@@ -0,0 +1,47 @@
+"""Forecast engine: the definitions shared with iris-react/src/lib/forecasting.ts."""
+
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from forecasting import apply_ntr, generate_forecast  # noqa: E402
+
+
+def _cycle(year, n, enrolled_late=0):
+    """n applications, one a week from October; the first half admitted, a third enrolled."""
+    submitted = pd.date_range(f'{year - 1}-10-01', periods=n, freq='7D')
+    enrolled = ['yes' if i < n // 3 else '' for i in range(n)]
+    # Enrollment recorded after the data's as-of date for the last ``enrolled_late`` enrollees
+    enrolled_on = [submitted[-1] + pd.Timedelta(days=30) if i >= n // 3 - enrolled_late else submitted[i]
+                   for i in range(n)]
+    return pd.DataFrame({
+        'Submitted': submitted,
+        'Admit Status': ['admitted' if i < n // 2 else '' for i in range(n)],
+        'Enrolled': enrolled,
+        'Date of Enrollment': enrolled_on,
+        'Application Category': 'Beacon',
+        'Degree Type': 'Masters',
+        'Program Cleaned': 'Computer Science',
+        'School (Expanded)': 'SES',
+    })
+
+
+def _applications():
+    return {'two_years_ago': _cycle(2024, 12), 'previous': _cycle(2025, 15), 'current': _cycle(2026, 18, enrolled_late=2)}
+
+
+def test_current_enrollments_are_enrolled_applications():
+    forecast = generate_forecast(_applications())
+    # All six enrollees applied by the cutoff, though two enrolled after it
+    assert forecast['metrics']['enrolls']['current'] == 6
+
+
+def test_ntr_is_whole_dollars():
+    forecast = apply_ntr(generate_forecast(_applications()), 6.1, 1712.3)
+    ranges = [forecast['metrics']['ntr']] + [c['ntr'] for c in forecast['byCategory'] + forecast['byProgram']]
+    for r in ranges:
+        for key in ('current', 'low', 'mid', 'high', 'previousYear'):
+            assert isinstance(r[key], int), (key, r[key])
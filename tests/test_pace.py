@@ -0,0 +1,37 @@
+"""Same-date YoY: only metrics with their own event date are cut at the as-of date."""
+
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pace import build_pace_index  # noqa: E402
+
+
+def _cycle(submitted, admitted, enrolled_on):
+    return pd.DataFrame({
+        'Submitted': submitted,
+        'Admit Status': ['admitted' if a else '' for a in admitted],
+        'Enrolled': ['yes' if e else '' for e in enrolled_on],
+        'Date of Enrollment': enrolled_on,
+    })
+
+
+def test_to_date_yoy_uses_cycle_totals_for_admits():
+    # 2025: four applications, all admitted; 2026: two so far, both admitted
+    previous = _cycle(['2024-10-01', '2024-11-01', '2024-12-20', '2025-01-05'], [1, 1, 1, 1],
+                      ['2024-10-10', None, None, None])
+    current = _cycle(['2025-09-30', '2025-10-31'], [1, 1], ['2025-10-09', None])
+    pace = build_pace_index({'previous': previous, 'current': current}, fields=())
+
+    yoy = pace.yoy_comparisons()['2026_vs_2025']
+    assert yoy.as_of == date(2025, 10, 31)
+    assert (yoy.current.applications, yoy.previous.applications) == (2, 2)    # same date
+    assert (yoy.current.enrollments, yoy.previous.enrollments) == (1, 1)      # same date
+    assert (yoy.current.admits, yoy.previous.admits) == (2, 4)                # cycle totals
+
+    cohort = pace.metrics(2025, yoy.as_of)
+    assert cohort.admits == 2  # the raw curves still place admits on Submitted
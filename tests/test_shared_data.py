@@ -0,0 +1,78 @@
+"""Process-wide dataset registry: eviction never drops a version a session is on."""
+
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_loader  # noqa: E402
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Fake loads keyed by the apps upload, and one _DatasetRef per named session."""
+    data_loader._shared_registry().clear()
+    refs = {}
+    current = {"session": None}
+
+    def fake_load(census_key, _census_bytes, census_name, apps_key, _apps_bytes, apps_name):
+        frame = pd.DataFrame({"n": [len(apps_key)]})
+        return {"applications": {"current": frame}, "version": apps_key or "default",
+                "last_refresh": datetime(2026, 1, 1)}, datetime(2026, 1, 1)
+
+    def fake_ref(version):
+        name = current["session"]
+        if name is None:
+            return None
+        ref = refs.setdefault(name, data_loader._DatasetRef(version))
+        ref.version = version
+        return ref
+
+    monkeypatch.setattr(data_loader, "_load_shared", fake_load)
+    monkeypatch.setattr(data_loader, "_session_ref", fake_ref)
+
+    def load(session, upload):
+        current["session"] = session
+        version, _ = data_loader.load_shared_data(apps_uploaded_bytes=upload.encode() if upload else None)
+        return version
+
+    yield load, refs
+    data_loader._shared_registry().clear()
+
+
+def test_sessions_on_different_uploads_keep_their_data(sessions):
+    load, refs = sessions
+    versions = {name: load(name, name) for name in ("a", "b", "c", "d", "e")}
+    for version in versions.values():
+        assert data_loader.get_shared_data(version)
+
+
+def test_idle_versions_are_evicted_least_recently_used(sessions):
+    load, refs = sessions
+    first = load("a", "first")
+    for upload in ("second", "third", "fourth"):
+        load("a", upload)  # the session moves on; earlier versions go idle
+    registry = data_loader._shared_registry()
+    assert first not in registry
+    assert len(registry) == 1 + data_loader.SHARED_VERSIONS_KEPT
+
+
+def test_ended_session_releases_its_version(sessions):
+    load, refs = sessions
+    old = load("a", "old")
+    del refs["a"]  # session state dropped
+    for upload in ("x", "y", "z"):
+        load(None, upload)
+    assert old not in data_loader._shared_registry()
+
+
+def test_last_refresh_info_never_loads(sessions, monkeypatch):
+    monkeypatch.setattr(data_loader, "_load_shared", lambda *a: pytest.fail("loaded data"))
+    with pytest.raises(LookupError):
+        data_loader.get_last_refresh_info()
+    data_loader._shared_registry()["v"] = {"last_refresh": datetime(2026, 1, 1)}
+    assert data_loader.get_last_refresh_info()[0] == datetime(2026, 1, 1)
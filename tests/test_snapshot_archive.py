@@ -0,0 +1,92 @@
+"""Snapshot archive: deltas and keyframes rebuild every archived state exactly."""
+
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import snapshot_archive  # noqa: E402
+from snapshot_archive import ArchiveSource, SnapshotArchive  # noqa: E402
+
+SOURCE = ArchiveSource("test", "test_latest.csv", "Ref")
+DAY1 = pd.DataFrame({"Ref": ["R1", "R2", "R3", "R4"],
+                     "Status": ["applied", "admitted", "applied", "denied"],
+                     "Program": ["CS", "DS", "CS", "FE"]})
+# R3 admitted, R4 withdrawn, R5 new, and a second R2 row (a program change)
+DAY2 = pd.DataFrame({"Ref": ["R1", "R2", "R3", "R5", "R2"],
+                     "Status": ["applied", "admitted", "admitted", "applied", "applied"],
+                     "Program": ["CS", "DS", "CS", "ME", "SE"]})
+
+
+def _write(tmp_path, df, name="test_latest.csv"):
+    path = tmp_path / name
+    df.to_csv(path, index=False)
+    return path
+
+
+def _expected(df):
+    return df.sort_values("Ref", kind="stable").reset_index(drop=True)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return SnapshotArchive(SOURCE, tmp_path / "archive")
+
+
+def test_round_trip_full_then_delta(tmp_path, archive):
+    first = archive.append(_write(tmp_path, DAY1), datetime(2025, 10, 1, 8))
+    second = archive.append(_write(tmp_path, DAY2), datetime(2025, 10, 2, 8))
+
+    assert first["kind"] == "full" and first["rows"] == 4
+    assert second["kind"] == "delta"
+    assert (second["rows"], second["upserts"], second["deletes"]) == (5, 3, 1)  # R3, R5, R2#1; R4 gone
+
+    reopened = SnapshotArchive(SOURCE, tmp_path / "archive")
+    pd.testing.assert_frame_equal(reopened.as_of("2025-10-01"), _expected(DAY1))
+    pd.testing.assert_frame_equal(reopened.as_of("2025-10-02"), _expected(DAY2))
+    pd.testing.assert_frame_equal(reopened.as_of(datetime(2025, 10, 2, 7)), _expected(DAY1))
+    assert reopened.as_of("2025-09-30") is None
+
+
+def test_unchanged_file_is_not_archived(tmp_path, archive):
+    archive.append(_write(tmp_path, DAY1), datetime(2025, 10, 1))
+    assert archive.append(_write(tmp_path, DAY1), datetime(2025, 10, 2)) is None
+    assert len(archive.entries) == 1
+
+
+def test_snapshots_must_move_forward(tmp_path, archive):
+    archive.append(_write(tmp_path, DAY1), datetime(2025, 10, 2))
+    with pytest.raises(ValueError):
+        archive.append(_write(tmp_path, DAY2), datetime(2025, 10, 1))
+
+
+def test_keyframe_every_n_entries(tmp_path, archive, monkeypatch):
+    monkeypatch.setattr(snapshot_archive, "KEYFRAME_EVERY", 3)
+    frames = []
+    for day in range(1, 6):
+        df = DAY1.assign(Status=[f"day{day}"] + DAY1["Status"].tolist()[1:])
+        frames.append(df)
+        archive.append(_write(tmp_path, df), datetime(2025, 10, day))
+
+    assert [e["kind"] for e in archive.entries] == ["full", "delta", "delta", "full", "delta"]
+    for day, df in enumerate(frames, 1):
+        pd.testing.assert_frame_equal(archive.as_of(f"2025-10-0{day}"), _expected(df))
+
+
+def test_column_change_forces_full_copy(tmp_path, archive):
+    archive.append(_write(tmp_path, DAY1), datetime(2025, 10, 1))
+    entry = archive.append(_write(tmp_path, DAY1.assign(Term="Spring")), datetime(2025, 10, 2))
+    assert entry["kind"] == "full"
+    pd.testing.assert_frame_equal(archive.as_of("2025-10-02"), _expected(DAY1.assign(Term="Spring")))
+
+
+def test_same_day_last_year(tmp_path, archive):
+    archive.append(_write(tmp_path, DAY1), datetime(2024, 10, 3, 8))  # a Thursday
+    archive.append(_write(tmp_path, DAY2), datetime(2024, 10, 10, 8))
+    # 364 days before Thursday 2025-10-02 is Thursday 2024-10-03
+    pd.testing.assert_frame_equal(archive.same_day_last_year("2025-10-02"), _expected(DAY1))
+    pd.testing.assert_frame_equal(archive.same_day_last_year("2025-10-09"), _expected(DAY2))
@@ -0,0 +1,40 @@
+"""Atomic snapshot writes keep the file modes a plain write would give."""
+
+import os
+import stat
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.snapshots import _UMASK, copy_if_changed, write_if_changed  # noqa: E402
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_new_file_gets_umask_mode(tmp_path):
+    dest = tmp_path / "snap.csv"
+    assert write_if_changed(dest, [b"a,b\n"])
+    assert _mode(dest) == 0o666 & ~_UMASK
+
+
+def test_replacement_keeps_existing_mode(tmp_path):
+    dest = tmp_path / "snap.csv"
+    dest.write_bytes(b"old")
+    os.chmod(dest, 0o640)
+    assert write_if_changed(dest, [b"new"])
+    assert dest.read_bytes() == b"new" and _mode(dest) == 0o640
+
+    src = tmp_path / "src.csv"
+    src.write_bytes(b"newer")
+    os.chmod(src, 0o600)
+    assert copy_if_changed(src, dest)
+    assert dest.read_bytes() == b"newer" and _mode(dest) == 0o640
+
+
+def test_unchanged_content_is_skipped(tmp_path):
+    dest = tmp_path / "snap.csv"
+    dest.write_bytes(b"same")
+    assert not write_if_changed(dest, [b"sa", b"me"])
+    assert [p.name for p in tmp_path.iterdir()] == ["snap.csv"]
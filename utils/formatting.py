@@ -2,6 +2,7 @@
 Formatting utilities for the CPE Funnel Dashboard.
 """
 
+import re
 from typing import Tuple
 
 
@@ -76,3 +77,8 @@ def safe_divide(numerator: float, denominator: float, default: float = 0) -> flo
         return default
     return numerator / denominator
 
+
+def safe_filename(name: str, default: str = "export") -> str:
+    """File-name stem from free text: anything but letters, digits, '-' and '.' becomes '_'."""
+    stem = re.sub(r"[^\w.-]+", "_", str(name or "")).strip("._")
+    return stem or default
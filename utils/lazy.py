@@ -0,0 +1,60 @@
+"""
+Deferred module imports.
+
+``lazy_import("pandas")`` returns a stand-in module that performs the real
+import on first attribute access, so heavy dependencies are paid for only
+by the code paths that use them (e.g. not by the login page).  Load times
+are recorded for scripts/profile_startup.py.
+"""
+
+import importlib
+import sys
+import threading
+import time
+import types
+from typing import Dict
+
+
+_load_times: Dict[str, float] = {}
+_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports ``name`` the first time it is used."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_target"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_lazy_target"]
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self.__name__)
+                    _load_times[self.__name__] = time.perf_counter() - start
+                    self.__dict__["_lazy_target"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_target"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str):
+    """The module itself if already imported, else a LazyModule for it."""
+    return sys.modules.get(name) or LazyModule(name)
+
+
+def lazy_load_times() -> Dict[str, float]:
+    """Seconds spent importing each lazily loaded module so far."""
+    with _lock:
+        return dict(_load_times)
@@ -0,0 +1,124 @@
+"""
+Snapshot file helpers shared by data_loader and scripts/refresh_data.py.
+
+Snapshots in data/snapshots are read by running Streamlit processes while a
+refresh may be replacing them, so every write goes to a temp file in the
+same folder and is moved into place with os.replace: readers see either the
+old file or the new one, never a partial copy.  Copies whose content digest
+matches the current snapshot are skipped, which also keeps the file's mtime
+and git state untouched.
+"""
+
+import fnmatch
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+
+CHUNK_SIZE = 1 << 20
+
+PathLike = Union[str, Path]
+
+# Read once: os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def latest_file(folder: PathLike, pattern: str) -> Optional[str]:
+    """Most recently modified file in ``folder`` matching ``pattern`` (one stat per entry)."""
+    if not folder or not os.path.isdir(folder):
+        return None
+    best, best_mtime = None, None
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if not fnmatch.fnmatch(entry.name, pattern) or not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime
+            if best_mtime is None or mtime > best_mtime:
+                best, best_mtime = entry.path, mtime
+    return best
+
+
+def file_digest(path: PathLike) -> str:
+    """SHA-256 of a file's contents, read in chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _same_content(path: Path, size: int, digest: str) -> bool:
+    return path.is_file() and path.stat().st_size == size and file_digest(path) == digest
+
+
+def _temp_path(dest: Path) -> Path:
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp")
+    os.close(fd)
+    return Path(tmp)
+
+
+def _replace(tmp: Path, dest: Path):
+    # mkstemp creates 0600 files; keep the mode the snapshot already has, or
+    # give a new one the mode a plain open() would
+    try:
+        mode = dest.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    os.chmod(tmp, mode)
+    with open(tmp, "rb+") as f:
+        os.fsync(f.fileno())
+    os.replace(tmp, dest)
+
+
+def write_if_changed(dest: PathLike, chunks: Iterable[bytes]) -> bool:
+    """
+    Stream ``chunks`` into ``dest`` atomically.
+
+    The chunks are hashed as they are written to a temp file; when the
+    result matches the current ``dest`` the temp file is discarded.
+    Returns True when ``dest`` was replaced.
+    """
+    dest = Path(dest)
+    tmp = _temp_path(dest)
+    try:
+        h = hashlib.sha256()
+        size = 0
+        with open(tmp, "wb") as f:
+            for chunk in chunks:
+                if chunk:
+                    h.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+        if _same_content(dest, size, h.hexdigest()):
+            tmp.unlink()
+            return False
+        _replace(tmp, dest)
+        return True
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def copy_if_changed(src: PathLike, dest: PathLike) -> bool:
+    """
+    Copy ``src`` over ``dest`` atomically (contents and mtime, like shutil.copy2).
+
+    Skipped when both files have the same digest.  Returns True when ``dest``
+    was replaced.
+    """
+    src, dest = Path(src), Path(dest)
+    if _same_content(dest, src.stat().st_size, file_digest(src)):
+        return False
+    tmp = _temp_path(dest)
+    try:
+        shutil.copyfile(src, tmp)
+        shutil.copystat(src, tmp)
+        _replace(tmp, dest)
+        return True
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
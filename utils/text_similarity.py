@@ -0,0 +1,91 @@
+"""
+Lightweight text similarity utilities (no external ML dependencies).
+Word unigram + bigram TF-IDF with cosine similarity, sized for short chat questions.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Sequence
+
+
+STOPWORDS = frozenset(
+    """
+    a an and are as at be by can could do does did for from give how i in is it its
+    me my of on or our please show tell the their there this to us was we were what
+    whats which who why will with would you your
+    """.split()
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_SUFFIXES = ("ing", "es", "ed", "s")
+
+
+def _stem(token: str) -> str:
+    """Crude suffix stripping so 'trending'/'trend' and 'programs'/'program' meet."""
+    if token.isdigit():
+        return token
+    for suffix in _SUFFIXES:
+        if len(token) > len(suffix) + 3 and token.endswith(suffix):
+            return token[: -len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased, lightly stemmed word tokens with stopwords removed."""
+    text = re.sub(r"['’]s\b", "", (text or "").lower())
+    return [_stem(t) for t in _TOKEN_RE.findall(text) if t not in STOPWORDS]
+
+
+def numbers_in(text: str) -> frozenset:
+    """Numeric tokens (years, counts); questions differing only in these are not duplicates."""
+    return frozenset(re.findall(r"\d+", text or ""))
+
+
+def features(text: str) -> Counter:
+    """Unigram + bigram term counts."""
+    toks = tokenize(text)
+    feats = Counter(toks)
+    feats.update(f"{a} {b}" for a, b in zip(toks, toks[1:]))
+    return feats
+
+
+class TfidfIndex:
+    """
+    Small TF-IDF vector space over a fixed set of documents.
+
+    Rebuild whenever the document set changes; building is linear in the
+    total number of terms and cheap for a few hundred short questions.
+    """
+
+    def __init__(self, documents: Sequence[str]):
+        self.documents = list(documents)
+        counts = [features(d) for d in self.documents]
+        df: Counter = Counter()
+        for c in counts:
+            df.update(c.keys())
+        n = len(self.documents)
+        # Smoothed IDF (as in sklearn): terms seen everywhere still weigh > 0
+        self.idf: Dict[str, float] = {t: math.log((1 + n) / (1 + k)) + 1.0 for t, k in df.items()}
+        self._default_idf = math.log(1 + n) + 1.0
+        self.vectors = [self._weigh(c) for c in counts]
+
+    def _weigh(self, counts: Counter) -> Dict[str, float]:
+        vec = {t: (1.0 + math.log(c)) * self.idf.get(t, self._default_idf) for t, c in counts.items()}
+        norm = math.sqrt(sum(v * v for v in vec.values()))
+        return {t: v / norm for t, v in vec.items()} if norm else {}
+
+    def vectorize(self, text: str) -> Dict[str, float]:
+        return self._weigh(features(text))
+
+    def similarities(self, text: str) -> List[float]:
+        """Cosine similarity of ``text`` against every indexed document."""
+        q = self.vectorize(text)
+        return [cosine(q, v) for v in self.vectors]
+
+
+def cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    """Cosine similarity of two L2-normalised sparse vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(t, 0.0) for t, w in a.items())